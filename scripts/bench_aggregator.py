@@ -0,0 +1,169 @@
+"""
+Benchmark do MultiSourceAggregator contra o servidor de replay (offline)
+
+Mede, para cada cenário, a latência do ciclo (p50/p95/p99), o throughput
+(símbolos/s) e a alocação de memória por símbolo (tracemalloc):
+- sequential: get_price símbolo a símbolo
+- concurrent: get_price de todos os símbolos em paralelo
+- batch:      get_prices (um round-trip por fonte)
+
+O cache é limpo antes de cada ciclo (toda chamada vai às fontes).
+
+Uso:
+    python scripts/bench_aggregator.py --symbols 50 --cycles 20
+    python scripts/bench_aggregator.py --latency-ms 80 --error-rate 0.05 --outlier-rate 0.02
+    python scripts/bench_aggregator.py --payloads fixtures/ --json results.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data.data_aggregator import MultiSourceAggregator  # noqa: E402
+from src.data.replay import add_profile_arguments, build_server, replay_sources  # noqa: E402
+
+SCENARIOS = ('sequential', 'concurrent', 'batch')
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+async def run_cycle(aggregator, scenario, symbols):
+    aggregator.cache.clear()
+    if scenario == 'sequential':
+        return [await aggregator.get_price(symbol) for symbol in symbols]
+    if scenario == 'concurrent':
+        return await asyncio.gather(*(aggregator.get_price(symbol) for symbol in symbols))
+    return list((await aggregator.get_prices(symbols)).values())
+
+
+async def measure(aggregator, scenario, symbols, cycles, warmup):
+    for _ in range(warmup):
+        await run_cycle(aggregator, scenario, symbols)
+
+    latencies = []
+    resolved = 0
+    started = time.perf_counter()
+    for _ in range(cycles):
+        start = time.perf_counter()
+        results = await run_cycle(aggregator, scenario, symbols)
+        latencies.append((time.perf_counter() - start) * 1000)
+        resolved += sum(result is not None for result in results)
+    elapsed = time.perf_counter() - started
+
+    # Alocação em ciclos separados (tracemalloc distorce o tempo)
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    await run_cycle(aggregator, scenario, symbols)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'scenario': scenario,
+        'symbols': len(symbols),
+        'cycles': cycles,
+        'cycle_ms_p50': percentile(latencies, 50),
+        'cycle_ms_p95': percentile(latencies, 95),
+        'cycle_ms_p99': percentile(latencies, 99),
+        'cycle_ms_mean': statistics.mean(latencies),
+        'symbols_per_second': len(symbols) * cycles / elapsed,
+        'consensus_ratio': resolved / (len(symbols) * cycles),
+        'peak_alloc_bytes_per_symbol': (peak - baseline) / len(symbols),
+        'retained_bytes_per_symbol': (current - baseline) / len(symbols),
+    }
+
+
+async def start_server(args):
+    """Servidor de replay no próprio processo ou em um subprocesso"""
+    if args.server == 'inprocess':
+        server = await build_server(args).start()
+        return server.url, server.close
+
+    command = [sys.executable, '-m', 'src.data.replay', '--port', '0']
+    for option in ('latency_ms', 'latency_sigma', 'error_rate', 'throttle_rate',
+                   'outlier_rate', 'outlier_factor', 'assets', 'seed', 'payloads'):
+        value = getattr(args, option)
+        if value is not None:
+            command += [f"--{option.replace('_', '-')}", str(value)]
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    process = subprocess.Popen(command, cwd=root, stdout=subprocess.PIPE, text=True)
+    line = await asyncio.get_running_loop().run_in_executor(None, process.stdout.readline)
+    url = next(token for token in line.split() if token.startswith('http://'))
+
+    async def stop():
+        process.terminate()
+        process.wait()
+    return url, stop
+
+
+async def main(args):
+    url, stop_server = await start_server(args)
+    try:
+        aggregator = MultiSourceAggregator(
+            sources=replay_sources(url),
+            early_quorum=args.early_quorum,
+            hedging=args.hedging,
+        )
+        async with aggregator:
+            universe = await aggregator.load_symbol_universe()
+            registry = aggregator.sources[0].registry
+            candidates = sorted(
+                {symbol for source in aggregator.sources for symbol in registry.symbols(source.name)},
+                key=lambda symbol: (-len(registry.sources_for(symbol)), symbol)
+            )
+            symbols = [s for s in candidates if len(registry.sources_for(s)) >= args.min_sources][:args.symbols]
+
+            print(f"Replay: {url}  universo: {universe}  símbolos: {len(symbols)}")
+            print(f"{'cenário':<11} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'símb/s':>9} "
+                  f"{'consenso':>9} {'pico B/símb':>12} {'retido B/símb':>14}")
+
+            results = []
+            for scenario in args.scenarios:
+                result = await measure(aggregator, scenario, symbols, args.cycles, args.warmup)
+                results.append(result)
+                print(f"{scenario:<11} {result['cycle_ms_p50']:8.1f} {result['cycle_ms_p95']:8.1f} "
+                      f"{result['cycle_ms_p99']:8.1f} {result['symbols_per_second']:9.0f} "
+                      f"{result['consensus_ratio']:9.1%} {result['peak_alloc_bytes_per_symbol']:12.0f} "
+                      f"{result['retained_bytes_per_symbol']:14.0f}")
+
+            report = {
+                'args': vars(args),
+                'universe': universe,
+                'results': results,
+                'aggregator_counters': dict(aggregator.counters),
+            }
+    finally:
+        await stop_server()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        print(f"Resultados salvos em {args.json}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--symbols', type=int, default=50, help="Símbolos por ciclo")
+    parser.add_argument('--cycles', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--min-sources', type=int, default=2, help="Só símbolos listados em N fontes")
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--server', choices=('subprocess', 'inprocess'), default='subprocess')
+    parser.add_argument('--early-quorum', action='store_true')
+    parser.add_argument('--hedging', action='store_true')
+    parser.add_argument('--json', help="Grava os resultados neste arquivo")
+    add_profile_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,103 @@
+"""
+Benchmark: per-asset scikit-learn fits vs the closed-form batched fit
+
+Compares, on the same synthetic price histories:
+- sklearn:   the original Predictor.train path (train_test_split +
+             LinearRegression + r2_score/mean_squared_error), one asset at a time
+- predictor: the current Predictor wrapper, one asset at a time
+- batch:     fit_linear_trend over the stacked (assets x days) matrix
+
+Every path computes slope, intercept, train/test R² and RMSE; the batched
+results are checked against the sklearn ones before timing.
+
+Usage:
+    python scripts/bench_batch_regression.py
+    python scripts/bench_batch_regression.py --assets 10 100 1000 --days 30 365
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sklearn.linear_model import LinearRegression  # noqa: E402
+from sklearn.metrics import mean_squared_error, r2_score  # noqa: E402
+from sklearn.model_selection import train_test_split  # noqa: E402
+
+from src.ml.batch_regression import fit_linear_trend  # noqa: E402
+from src.ml.predictor import Predictor  # noqa: E402
+
+
+def synthetic_prices(assets: int, days: int, seed: int = 11) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    start = rng.uniform(0.1, 60000, size=(assets, 1))
+    returns = rng.normal(0.001, 0.03, size=(assets, days))
+    return start * np.exp(returns.cumsum(axis=1))
+
+
+def sklearn_fit(prices: np.ndarray):
+    dates = np.arange(len(prices)).reshape(-1, 1)
+    X_train, X_test, y_train, y_test = train_test_split(dates, prices, test_size=0.2, random_state=42)
+    model = LinearRegression().fit(X_train, y_train)
+    train_pred, test_pred = model.predict(X_train), model.predict(X_test)
+    return (model.coef_[0], model.intercept_,
+            r2_score(y_train, train_pred), r2_score(y_test, test_pred),
+            np.sqrt(mean_squared_error(y_train, train_pred)), np.sqrt(mean_squared_error(y_test, test_pred)))
+
+
+def predictor_fit(prices: np.ndarray):
+    predictor = Predictor()
+    predictor.train(prices)
+    return predictor
+
+
+def check_parity(matrix: np.ndarray) -> float:
+    """Largest relative difference between batched and sklearn results"""
+    fit = fit_linear_trend(matrix)
+    batched = np.column_stack([fit.slope, fit.intercept, fit.train_r2, fit.test_r2, fit.train_rmse, fit.test_rmse])
+    reference = np.array([sklearn_fit(row) for row in matrix])
+    return float(np.max(np.abs(batched - reference) / np.maximum(np.abs(reference), 1e-12)))
+
+
+def timeit(fn, repeat: int) -> float:
+    """Median wall time per call (ms)"""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--assets', type=int, nargs='+', default=[1, 10, 100, 500])
+    parser.add_argument('--days', type=int, nargs='+', default=[31, 366])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    # Per-fit INFO logs would dominate the per-asset timings
+    logging.getLogger('src.ml.predictor').setLevel(logging.WARNING)
+
+    print(f"{'assets':>7} {'days':>5} {'sklearn ms':>11} {'predictor ms':>13} {'batch ms':>9} "
+          f"{'speedup':>8} {'max rel diff':>13}")
+    for days in args.days:
+        for assets in args.assets:
+            matrix = synthetic_prices(assets, days)
+            diff = check_parity(matrix)
+            sklearn_ms = timeit(lambda: [sklearn_fit(row) for row in matrix], args.repeat)
+            predictor_ms = timeit(lambda: [predictor_fit(row) for row in matrix], args.repeat)
+            batch_ms = timeit(lambda: fit_linear_trend(matrix), args.repeat)
+            print(f"{assets:7d} {days:5d} {sklearn_ms:11.2f} {predictor_ms:13.2f} {batch_ms:9.3f} "
+                  f"{sklearn_ms / batch_ms:7.0f}x {diff:13.1e}")
+
+
+if __name__ == '__main__':
+    main()
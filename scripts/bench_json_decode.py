@@ -0,0 +1,176 @@
+"""
+Microbenchmark: decodificação das respostas das fontes de preço
+
+Compara, sobre os mesmos payloads:
+- stdlib:   bytes → str → json.loads (caminho de aiohttp response.json())
+- fast:     fast_json.loads direto dos bytes (orjson quando instalado)
+- lazy:     fast_json.iter_objects (só os tickers pedidos, Binance)
+
+Cada caminho inclui a extração dos campos usados pelas fontes.
+
+Uso:
+    python scripts/bench_json_decode.py                    # payloads sintéticos
+    python scripts/bench_json_decode.py --record payloads  # grava respostas reais
+    python scripts/bench_json_decode.py --payloads payloads
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data import fast_json  # noqa: E402
+
+ENDPOINTS = {
+    'binance_ticker_24hr.json': "https://api.binance.com/api/v3/ticker/24hr",
+    'coincap_assets.json': "https://api.coincap.io/v2/assets?limit=2000",
+    'coingecko_simple_price.json': (
+        "https://api.coingecko.com/api/v3/simple/price?vs_currencies=usd"
+        "&include_24hr_vol=true&include_24hr_change=true"
+        "&ids=bitcoin,ethereum,solana,cardano,polkadot,ripple,dogecoin,litecoin"
+    ),
+}
+
+
+def synthetic_payloads(num_tickers: int = 2500, num_assets: int = 2000, seed: int = 7):
+    """Payloads com o mesmo formato das respostas reais (campos e tipos)"""
+    rng = random.Random(seed)
+
+    def num():
+        return f"{rng.uniform(0.0001, 60000):.8f}"
+
+    tickers = []
+    for i in range(num_tickers):
+        tickers.append({
+            "symbol": f"C{i:04d}USDT", "priceChange": num(), "priceChangePercent": f"{rng.uniform(-20, 20):.3f}",
+            "weightedAvgPrice": num(), "prevClosePrice": num(), "lastPrice": num(), "lastQty": num(),
+            "bidPrice": num(), "bidQty": num(), "askPrice": num(), "askQty": num(), "openPrice": num(),
+            "highPrice": num(), "lowPrice": num(), "volume": num(), "quoteVolume": num(),
+            "openTime": 1700000000000 + i, "closeTime": 1700086400000 + i,
+            "firstId": rng.randint(0, 10 ** 9), "lastId": rng.randint(0, 10 ** 9), "count": rng.randint(0, 10 ** 6),
+        })
+    assets = {"data": [
+        {
+            "id": f"asset-{i}", "rank": str(i + 1), "symbol": f"A{i}", "name": f"Asset {i}",
+            "supply": num(), "maxSupply": None, "marketCapUsd": num(), "volumeUsd24Hr": num(),
+            "priceUsd": num(), "changePercent24Hr": num(), "vwap24Hr": num(), "explorer": None,
+        }
+        for i in range(num_assets)
+    ], "timestamp": 1700000000000}
+    simple = {
+        coin: {"usd": rng.uniform(0.1, 60000), "usd_24h_vol": rng.uniform(1e6, 1e10), "usd_24h_change": rng.uniform(-5, 5)}
+        for coin in ("bitcoin", "ethereum", "solana", "cardano", "polkadot", "ripple", "dogecoin", "litecoin")
+    }
+    return {
+        'binance_ticker_24hr.json': json.dumps(tickers, separators=(',', ':')).encode(),
+        'coincap_assets.json': json.dumps(assets, separators=(',', ':')).encode(),
+        'coingecko_simple_price.json': json.dumps(simple, separators=(',', ':')).encode(),
+    }
+
+
+async def record(directory: str):
+    """Grava as respostas reais dos endpoints em `directory`"""
+    import aiohttp
+
+    os.makedirs(directory, exist_ok=True)
+    async with aiohttp.ClientSession() as session:
+        for name, url in ENDPOINTS.items():
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                raw = await response.read()
+            with open(os.path.join(directory, name), 'wb') as f:
+                f.write(raw)
+            print(f"{name}: {len(raw) / 1024:.0f} KB")
+
+
+def load_payloads(directory: str):
+    payloads = {}
+    for name in ENDPOINTS:
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                payloads[name] = f.read()
+    return payloads
+
+
+def pluck_ticker(ticker):
+    return (float(ticker['lastPrice']), float(ticker['volume']), float(ticker['highPrice']),
+            float(ticker['lowPrice']), float(ticker['priceChangePercent']))
+
+
+def pluck_asset(asset):
+    return (float(asset['priceUsd']), float(asset.get('volumeUsd24Hr') or 0),
+            float(asset['marketCapUsd'] or 0), float(asset['changePercent24Hr'] or 0))
+
+
+def pluck_coin(coin):
+    return coin['usd'], coin.get('usd_24h_vol'), coin.get('usd_24h_change')
+
+
+def cases(name, raw, wanted_tickers):
+    """Funções de decodificação + extração para um payload"""
+    if name.startswith('binance'):
+        def full(decode):
+            return lambda: [pluck_ticker(t) for t in decode(raw) if t['symbol'] in wanted_tickers]
+        return {
+            'stdlib': full(lambda r: json.loads(r.decode())),
+            'fast': full(fast_json.loads),
+            'lazy': lambda: [pluck_ticker(t) for _, t in fast_json.iter_objects(raw, 'symbol', wanted_tickers)],
+        }
+    if name.startswith('coincap'):
+        return {
+            'stdlib': lambda: [pluck_asset(a) for a in json.loads(raw.decode())['data']],
+            'fast': lambda: [pluck_asset(a) for a in fast_json.loads(raw)['data']],
+        }
+    return {
+        'stdlib': lambda: [pluck_coin(c) for c in json.loads(raw.decode()).values()],
+        'fast': lambda: [pluck_coin(c) for c in fast_json.loads(raw).values()],
+    }
+
+
+def timeit(fn, repeat: int) -> float:
+    """Mediana do tempo por chamada (ms)"""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--payloads', help="Diretório com respostas gravadas (--record)")
+    parser.add_argument('--record', help="Grava respostas reais neste diretório e sai")
+    parser.add_argument('--wanted', type=int, default=150, help="Tickers Binance pedidos (lazy)")
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record(args.record))
+        return
+
+    payloads = load_payloads(args.payloads) if args.payloads else synthetic_payloads()
+    print(f"Backend: {fast_json.BACKEND}  ({'gravados' if args.payloads else 'sintéticos'})\n")
+
+    for name, raw in payloads.items():
+        wanted = set()
+        if name.startswith('binance'):
+            symbols = [t['symbol'] for t in fast_json.loads(raw)]
+            wanted = set(random.Random(1).sample(symbols, min(args.wanted, len(symbols))))
+
+        timings = {case: timeit(fn, args.repeat) for case, fn in cases(name, raw, wanted).items()}
+        baseline = timings['stdlib']
+        detail = "  ".join(f"{case}: {ms:7.3f} ms ({baseline / ms:4.1f}x)" for case, ms in timings.items())
+        print(f"{name:30s} {len(raw) / 1024:7.0f} KB  {detail}")
+
+
+if __name__ == '__main__':
+    main()
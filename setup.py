@@ -34,6 +34,7 @@ setup(
         "python-json-logger==2.0.7",
         "sentry-sdk==1.39.2",
         "redis==5.0.1",
+        "orjson>=3.8.0",
         "celery==5.3.4",
     ],
 )
@@ -13,8 +13,8 @@ from src.api.middleware import limiter, cache_response, remote_api_retry
 from src.monitoring.metrics import metrics_endpoint, MetricsManager
 from src.utils.logger import setup_logger
 from src.utils.config import settings
-from src.ml.predictor import Predictor
-from src.ml.data_collector import DataCollector
+from src.ml.model_registry import ModelRegistry, MODEL_VERSION
+from src.ml.training_executor import training_executor, TrainingQueueFull
 from src.blockchain.contract_manager import ContractManager
 
 logger = setup_logger(__name__)
@@ -30,6 +30,14 @@ app = FastAPI(
 # Initialize Limiter for FastAPI
 app.state.limiter = limiter
 
+# Trained models shared across requests (retrained in the background)
+model_registry = ModelRegistry()
+
+@app.on_event("shutdown")
+async def close_model_registry():
+    await model_registry.close()
+    training_executor.shutdown(wait=False)
+
 # Models
 class PredictionRequest(BaseModel):
     asset_id: str = "bitcoin"
@@ -86,13 +94,8 @@ async def get_prediction(request: Request, params: PredictionRequest):
     
     with MetricsManager.track_prediction(params.asset_id):
         try:
-            # Collect data
-            collector = DataCollector()
-            prices = await collector.fetch_asset_data(params.asset_id, days=params.days_back)
-            
-            # Train and Predict
-            predictor = Predictor()
-            predictor.train(prices)
+            # Cached model (trained on first use, refreshed in the background)
+            predictor = await model_registry.get(params.asset_id, params.days_back)
             
             predicted_price = predictor.predict_next_day()
             confidence = predictor.get_confidence()
@@ -102,8 +105,12 @@ async def get_prediction(request: Request, params: PredictionRequest):
                 "predicted_price": predicted_price,
                 "confidence": confidence,
                 "timestamp": datetime.now().isoformat(),
-                "model_version": "v2.0-linear"
+                "model_version": MODEL_VERSION
             }
+        except TrainingQueueFull as e:
+            logger.warning(f"⚠️ Prediction rejected, training backlog full: {e}")
+            MetricsManager.log_error(params.asset_id, type(e).__name__)
+            raise HTTPException(status_code=503, detail=str(e))
         except Exception as e:
             logger.error(f"❌ Prediction failed: {e}")
             MetricsManager.log_error(params.asset_id, type(e).__name__)
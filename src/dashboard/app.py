@@ -9,6 +9,7 @@ import json
 from src.data.data_aggregator import MultiSourceAggregator
 from src.ml.predictor import Predictor
 from src.ml.data_collector import DataCollector
+from src.ml.training_executor import training_executor
 from src.blockchain.contract_manager import ContractManager
 
 # Page Config
@@ -68,9 +69,8 @@ async def fetch_dashboard_data(asset):
     # 2. Historical Data for Chart
     hist_prices = await core["collector"].fetch_asset_data(asset, days=days_back)
     
-    # 3. ML Prediction
-    predictor = Predictor()
-    predictor.train(hist_prices)
+    # 3. ML Prediction (fit runs in the training pool, off the event loop)
+    predictor = await training_executor.fit(Predictor(), hist_prices)
     prediction = predictor.predict_next_day()
     confidence = predictor.get_confidence()
     
@@ -0,0 +1,130 @@
+"""
+DecAI Oracle - Source Circuit Breaker
+Versão 2.0 - Resilient Data Layer
+
+Circuit breaker por fonte de dados:
+- CLOSED: requisições normais
+- OPEN: fonte ignorada até o fim do cooldown
+- HALF_OPEN: uma única requisição de prova; sucesso fecha, falha reabre
+  com cooldown exponencialmente maior
+"""
+
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+from src.utils.config import settings
+
+
+class BreakerState(Enum):
+    """Estado do circuit breaker"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class SourceCircuitBreaker:
+    """
+    Máquina de estados do circuit breaker (uso dentro de um único event loop)
+
+    Args:
+        failure_threshold: Falhas consecutivas para abrir o circuito
+        cooldown: Cooldown inicial (s) antes da primeira prova
+        max_cooldown: Teto do cooldown após provas falhas consecutivas
+        probe_timeout: Tempo (s) após o qual uma prova sem resposta é
+            considerada perdida e outra pode ser enviada
+        clock: Relógio monotônico (injetável em testes)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        cooldown: Optional[float] = None,
+        max_cooldown: Optional[float] = None,
+        probe_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = failure_threshold or settings.BREAKER_FAILURE_THRESHOLD
+        self.base_cooldown = cooldown if cooldown is not None else settings.BREAKER_COOLDOWN_SECONDS
+        self.max_cooldown = max_cooldown if max_cooldown is not None else settings.BREAKER_MAX_COOLDOWN_SECONDS
+        self.probe_timeout = probe_timeout if probe_timeout is not None else settings.BREAKER_PROBE_TIMEOUT_SECONDS
+        self._clock = clock
+
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.cooldown = self.base_cooldown
+        self.open_until = 0.0
+        self.rejected = 0
+        self._probe_started: Optional[float] = None
+
+    def allow_request(self) -> bool:
+        """
+        Decide se a fonte pode ser chamada agora
+
+        No fim do cooldown o circuito passa a HALF_OPEN e libera exatamente
+        uma requisição de prova.
+        """
+        if self.state == BreakerState.CLOSED:
+            return True
+
+        now = self._clock()
+
+        if self.state == BreakerState.OPEN and now >= self.open_until:
+            self.state = BreakerState.HALF_OPEN
+            self._probe_started = now
+            return True
+
+        if self.state == BreakerState.HALF_OPEN and (
+            self._probe_started is None
+            or now - self._probe_started >= self.probe_timeout
+        ):
+            # Prova liberada (release_probe) ou perdida (ex: cancelada); libera outra
+            self._probe_started = now
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        """Sucesso fecha o circuito e reseta o backoff"""
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.cooldown = self.base_cooldown
+        self._probe_started = None
+
+    def release_probe(self):
+        """
+        A prova não chegou à fonte (descartada pelo rate limiter ou HTTP 429)
+
+        Sem resultado a registrar: a próxima requisição pode provar de novo,
+        em vez de esperar probe_timeout.
+        """
+        if self.state == BreakerState.HALF_OPEN:
+            self._probe_started = None
+
+    def record_failure(self):
+        """Falha conta para abrir o circuito; prova falha reabre com backoff"""
+        if self.state == BreakerState.HALF_OPEN:
+            self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+            self._open()
+            return
+
+        self.failures += 1
+        if self.state == BreakerState.CLOSED and self.failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self):
+        self.state = BreakerState.OPEN
+        self.open_until = self._clock() + self.cooldown
+        self._probe_started = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Estado atual para o relatório de saúde"""
+        retry_in = max(0.0, self.open_until - self._clock()) if self.state == BreakerState.OPEN else 0.0
+        return {
+            'state': self.state.value,
+            'failures': self.failures,
+            'cooldown_seconds': self.cooldown,
+            'retry_in_seconds': round(retry_in, 3),
+            'rejected_requests': self.rejected,
+        }
@@ -0,0 +1,141 @@
+"""
+DecAI Oracle - Vectorized Consensus Engine
+Versão 2.0 - Batch consensus
+
+Consenso multi-símbolo em uma única passada NumPy sobre uma matriz
+fontes × símbolos (NaN = fonte sem preço para o símbolo):
+- Verificação de desvio (desvio padrão amostral relativo)
+- Remoção de outlier: distância da mediana (3-5 fontes) ou Z-score > 2
+- Preço ponderado por confiança (× peso dinâmico da fonte, se informado)
+
+Mesma semântica de MultiSourceAggregator._build_consensus, aplicada a
+todos os símbolos de uma vez.
+"""
+
+import warnings
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+@dataclass
+class ConsensusResult:
+    """Resultado vetorizado (arrays de tamanho N = número de símbolos)"""
+    price: np.ndarray           # preço ponderado por confiança (NaN se inválido)
+    confidence: np.ndarray      # confiança média das fontes mantidas
+    volume: np.ndarray          # soma dos volumes das fontes mantidas (NaN se nenhum)
+    std_dev: np.ndarray         # desvio padrão reportado
+    deviation_pct: np.ndarray   # desvio relativo (%) reportado
+    num_sources: np.ndarray     # fontes mantidas após remoção de outliers
+    kept: np.ndarray            # máscara S × N das fontes usadas
+    valid: np.ndarray           # símbolo com consenso confiável
+
+
+def _mean_std(prices: np.ndarray, mask: np.ndarray):
+    """Média e desvio padrão amostral (ddof=1; 0 com uma única fonte) por coluna"""
+    n = mask.sum(axis=0)
+    safe_n = np.maximum(n, 1)
+    masked = np.where(mask, prices, 0.0)
+    avg = masked.sum(axis=0) / safe_n
+    sq = np.where(mask, (prices - avg) ** 2, 0.0).sum(axis=0)
+    std = np.where(n > 1, np.sqrt(sq / np.maximum(n - 1, 1)), 0.0)
+    return n, avg, std
+
+
+def compute_consensus(
+    prices: np.ndarray,
+    confidences: np.ndarray,
+    min_sources: int = 2,
+    max_deviation: float = 5.0,
+    volumes: Optional[np.ndarray] = None,
+    source_weights: Optional[np.ndarray] = None
+) -> ConsensusResult:
+    """
+    Calcula o consenso para todos os símbolos de uma vez
+
+    Args:
+        prices: Matriz S × N de preços (NaN para ausentes)
+        confidences: Matriz S × N de confiança (0-100)
+        min_sources: Mínimo de fontes necessárias por símbolo
+        max_deviation: Desvio máximo aceitável entre fontes (%)
+        volumes: Matriz S × N opcional de volume 24h (NaN para ausentes)
+        source_weights: Vetor S opcional de pesos por fonte (multiplica a
+            confiança apenas na média do preço)
+
+    Returns:
+        ConsensusResult com arrays por símbolo
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    confidences = np.asarray(confidences, dtype=np.float64)
+    num_rows, num_cols = prices.shape
+    cols = np.arange(num_cols)
+
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+
+        mask = ~np.isnan(prices)
+        n, avg, std = _mean_std(prices, mask)
+        deviation = np.where(avg > 0, std / avg * 100, 100.0)
+
+        enough = n >= min_sources
+        needs_filter = enough & (deviation > max_deviation)
+        small = needs_filter & (n > 2) & (n <= 5)
+        large = needs_filter & ~small
+
+        kept = mask.copy()
+
+        # Conjuntos pequenos: remove a fonte mais distante da mediana
+        # (empate → a última na ordem das fontes, como no sort estável)
+        if small.any():
+            # Mediana via sort (NaN vai para o fim): mais rápido que nanmedian
+            ordered = np.sort(prices, axis=0)
+            lower = np.take_along_axis(ordered, np.maximum((n - 1) // 2, 0)[None, :], axis=0)[0]
+            upper = np.take_along_axis(ordered, np.maximum(n // 2, 0)[None, :], axis=0)[0]
+            median = (lower + upper) / 2
+            distance = np.where(mask, np.abs(prices - median), -np.inf)
+            furthest = num_rows - 1 - np.argmax(distance[::-1], axis=0)
+            remove = np.zeros_like(mask)
+            remove[furthest[small], cols[small]] = True
+            kept &= ~remove
+
+        # Demais conjuntos: Z-score > 2 em relação à média original
+        if large.any():
+            within = np.abs(prices - avg) <= 2 * std
+            kept[:, large] &= within[:, large]
+
+        # Métricas recalculadas apenas no ramo da mediana
+        _, avg_small, std_small = _mean_std(prices, kept)
+        deviation_small = np.where(avg_small > 0, std_small / avg_small * 100, 0.0)
+        std = np.where(small, std_small, std)
+        deviation = np.where(small, deviation_small, deviation)
+
+        num_kept = kept.sum(axis=0)
+        valid = enough & (num_kept >= min_sources)
+
+        kept_confidence = np.where(kept, confidences, 0.0)
+        mean_confidence = kept_confidence.sum(axis=0) / num_kept
+        weights = kept_confidence
+        if source_weights is not None:
+            weights = kept_confidence * np.asarray(source_weights, dtype=np.float64)[:, None]
+        price = np.where(kept, prices, 0.0)
+        weighted = (price * weights).sum(axis=0) / weights.sum(axis=0)
+
+        if volumes is not None:
+            volumes = np.asarray(volumes, dtype=np.float64)
+            volume_mask = kept & ~np.isnan(volumes)
+            total_volume = np.where(volume_mask, volumes, 0.0).sum(axis=0)
+            volume = np.where(total_volume > 0, total_volume, np.nan)
+        else:
+            volume = np.full(num_cols, np.nan)
+
+    return ConsensusResult(
+        price=np.where(valid, weighted, np.nan),
+        confidence=np.where(valid, mean_confidence, np.nan),
+        volume=np.where(valid, volume, np.nan),
+        std_dev=std,
+        deviation_pct=deviation,
+        num_sources=num_kept,
+        kept=kept,
+        valid=valid,
+    )
@@ -13,15 +13,36 @@ Resolve Single Point of Failure (SPOF) usando múltiplas fontes:
 
 import asyncio
 import aiohttp
+import functools
+import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import statistics
 from collections import defaultdict
 
-logging.basicConfig(level=logging.INFO)
+import numpy as np
+
+from src.data import fast_json, multicall, snapshot
+from src.data.circuit_breaker import BreakerState, SourceCircuitBreaker
+from src.data.consensus import compute_consensus
+from src.data.latency import LatencyHistogram
+from src.data.price_cache import PriceCacheBase, create_price_cache
+from src.data.rate_limiter import TokenBucketLimiter
+from src.data.source_quality import SourceQuality
+from src.data.symbols import SYMBOL_REGISTRY, SymbolRegistry
+from src.data.tick_history import TickHistory
+from src.monitoring.metrics import MetricsManager
+from src.utils.config import settings
+from src.utils.logger import setup_logger
+
+# Handler assíncrono (fila) para toda a camada src.data; logs repetidos por
+# chamada são amostrados (um por modelo de mensagem a cada intervalo)
+setup_logger("src.data", sample_interval=settings.LOG_SAMPLE_INTERVAL_SECONDS)
 logger = logging.getLogger(__name__)
 
 
@@ -62,9 +83,13 @@ class SourceHealth:
 class DataSourceBase:
     """Classe base para fontes de dados"""
     
-    def __init__(self, name: str, timeout: int = 5):
+    # Mapeamentos de símbolos (compartilhado entre fontes por padrão)
+    registry: SymbolRegistry = SYMBOL_REGISTRY
+    
+    def __init__(self, name: str, timeout: Optional[float] = None, rate_limit_per_minute: Optional[float] = None):
         self.name = name
-        self.timeout = timeout
+        # Teto do timeout (o timeout efetivo se adapta à latência observada)
+        self.timeout = timeout if timeout is not None else settings.REQUEST_TIMEOUT_SECONDS
         self.health = SourceHealth(
             source_name=name,
             status=DataSourceStatus.UNKNOWN,
@@ -76,26 +101,187 @@ class DataSourceBase:
             total_requests=0,
             total_failures=0
         )
+        # Distribuição de latência (percentis em janela deslizante)
+        self.latency = LatencyHistogram()
+        # Peso no consenso (sucesso recente e desvio em relação ao consenso)
+        self.quality = SourceQuality()
+        # Circuit breaker (OPEN → fonte ignorada até o cooldown + prova única)
+        self.breaker = SourceCircuitBreaker()
+        # Orçamento de requisições (None = sem limite local)
+        self.rate_limiter: Optional[TokenBucketLimiter] = (
+            TokenBucketLimiter(rate_limit_per_minute) if rate_limit_per_minute else None
+        )
+        # Sessão HTTP compartilhada (injetada pelo agregador)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._owns_session = False
+    
+    def bind_session(self, session: aiohttp.ClientSession):
+        """Associa uma sessão HTTP compartilhada (pool de conexões do agregador)"""
+        self.session = session
+        self._owns_session = False
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Retorna a sessão HTTP em uso.
+        
+        Se nenhuma sessão compartilhada foi associada (uso standalone da fonte),
+        cria uma sessão própria, reutilizada entre chamadas até close().
+        """
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
+        return self.session
+    
+    async def close(self):
+        """Fecha a sessão HTTP apenas se ela pertencer à fonte"""
+        if self._owns_session and self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._owns_session = False
+    
+    async def _acquire_quota(self, weight: float = 1.0) -> bool:
+        """
+        Reserva orçamento antes de enviar a requisição
+        
+        Aguarda até RATE_LIMIT_MAX_WAIT_SECONDS; se a quota não permitir, a
+        chamada é descartada localmente (não conta como falha da fonte e
+        libera a prova do circuit breaker, se houver).
+        """
+        if self.rate_limiter is None:
+            return True
+        
+        allowed = await self.rate_limiter.acquire(weight, max_wait=settings.RATE_LIMIT_MAX_WAIT_SECONDS)
+        MetricsManager.update_source_quota(self.name, self.rate_limiter.headroom())
+        if not allowed:
+            self.breaker.release_probe()
+            MetricsManager.log_request_shed(self.name)
+            logger.warning("🚦 %s: quota esgotada, requisição descartada (peso %s)", self.name, weight)
+        return allowed
+    
+    def _is_throttled(self, response: aiohttp.ClientResponse) -> bool:
+        """
+        Atualiza o limiter com os cabeçalhos da resposta
+        
+        HTTP 429/418 indicam quota excedida: o limiter pausa pelo Retry-After,
+        a resposta não é contabilizada como falha em update_health e a prova
+        do circuit breaker, se houver, é liberada.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe_headers(response.headers, response.status)
+            MetricsManager.update_source_quota(self.name, self.rate_limiter.headroom())
+        
+        if response.status in (429, 418):
+            self.breaker.release_probe()
+            MetricsManager.log_request_throttled(self.name)
+            logger.warning("🚦 %s: HTTP %d (rate limit)", self.name, response.status)
+            return True
+        return False
+    
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        """Corpo JSON decodificado direto dos bytes (orjson quando disponível)"""
+        return fast_json.loads(await response.read())
+    
+    async def start(self, symbols: List[str]):
+        """Inicia assinaturas persistentes (fontes REST não precisam; no-op)"""
+        return None
+    
+    def supports(self, symbol: str) -> bool:
+        """Se a fonte negocia o símbolo (fontes sem mapeamento aceitam todos)"""
+        return True
+    
+    async def load_symbols(self) -> Dict[str, str]:
+        """
+        Universo de símbolos da fonte (símbolo canônico → id da fonte)
+        
+        Vazio para fontes sem descoberta de ativos.
+        """
+        return {}
+    
+    async def refresh_symbols(self) -> int:
+        """Carrega o universo da fonte no registro; retorna o número de símbolos"""
+        try:
+            mapping = await self.load_symbols()
+        except Exception as e:
+            logger.warning("⚠️ %s: falha ao carregar universo de símbolos: %s", self.name, e)
+            return 0
+        if mapping:
+            self.registry.replace(self.name, mapping)
+        return len(mapping)
     
     async def fetch_price(self, symbol: str) -> Optional[PriceData]:
         """Implementar em subclasses"""
         raise NotImplementedError
     
-    def update_health(self, success: bool, response_time: float):
-        """Atualiza métricas de saúde"""
+    async def fetch_prices(self, symbols: List[str]) -> Dict[str, PriceData]:
+        """
+        Busca vários símbolos de uma vez.
+        
+        Implementação padrão: uma requisição por símbolo. Subclasses com
+        endpoint de lote devem sobrescrever para fazer um único round-trip.
+        """
+        results = await asyncio.gather(
+            *(self.fetch_price(symbol) for symbol in symbols),
+            return_exceptions=True
+        )
+        return {
+            symbol: result
+            for symbol, result in zip(symbols, results)
+            if isinstance(result, PriceData)
+        }
+    
+    def request_timeout(self) -> float:
+        """
+        Timeout (s) da próxima requisição
+        
+        Com amostras suficientes, ADAPTIVE_TIMEOUT_MULTIPLIER × o percentil
+        ADAPTIVE_TIMEOUT_PERCENTILE da latência, entre ADAPTIVE_TIMEOUT_MIN_SECONDS
+        e self.timeout; antes disso (ou desativado), self.timeout.
+        """
+        if not settings.ADAPTIVE_TIMEOUT_ENABLED or self.latency.count < settings.ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+            return self.timeout
+        
+        observed = self.latency.percentile(settings.ADAPTIVE_TIMEOUT_PERCENTILE) / 1000
+        adaptive = max(observed * settings.ADAPTIVE_TIMEOUT_MULTIPLIER, settings.ADAPTIVE_TIMEOUT_MIN_SECONDS)
+        return min(adaptive, self.timeout)
+    
+    def _client_timeout(self) -> aiohttp.ClientTimeout:
+        return aiohttp.ClientTimeout(total=self.request_timeout())
+    
+    def update_health(self, success: bool, response_time: float, record_latency: bool = True):
+        """
+        Atualiza métricas de saúde
+        
+        Args:
+            success: Resultado da requisição
+            response_time: Tempo de resposta em ms
+            record_latency: False para leituras sem round-trip (ex.: livro de
+                um stream), que não devem entrar no histograma de latência
+        """
         self.health.total_requests += 1
+        self.quality.record_outcome(success)
         
         if success:
             self.health.consecutive_failures = 0
             self.health.last_success = datetime.now()
             self.health.status = DataSourceStatus.HEALTHY
+            if record_latency:
+                self.latency.record(response_time)
+            self.breaker.record_success()
         else:
             self.health.consecutive_failures += 1
             self.health.total_failures += 1
             self.health.last_failure = datetime.now()
+            self.breaker.record_failure()
+            
+            # Requisição encerrada pelo timeout: a latência real é no mínimo
+            # o timeout; registrá-la evita que o timeout adaptativo fique preso
+            # abaixo da latência da fonte
+            if record_latency and response_time >= 0.95 * self.request_timeout() * 1000:
+                self.latency.record(response_time)
             
             # Circuit breaker
-            if self.health.consecutive_failures >= 3:
+            if self.breaker.state != BreakerState.CLOSED or self.health.consecutive_failures >= 3:
                 self.health.status = DataSourceStatus.DOWN
             elif self.health.consecutive_failures >= 1:
                 self.health.status = DataSourceStatus.DEGRADED
@@ -106,6 +292,8 @@ class DataSourceBase:
             self.health.success_rate = (success_count / self.health.total_requests) * 100
         
         # Atualizar tempo médio de resposta (média móvel)
+        if not record_latency:
+            return
         if self.health.avg_response_time == 0:
             self.health.avg_response_time = response_time
         else:
@@ -113,6 +301,19 @@ class DataSourceBase:
             self.health.avg_response_time = (
                 self.health.avg_response_time * 0.7 + response_time * 0.3
             )
+    
+    def hedge_delay(self) -> Optional[float]:
+        """
+        Tempo (s) após o qual vale disparar uma requisição duplicada
+        
+        Baseado no percentil HEDGE_PERCENTILE da latência observada; None
+        enquanto não houver amostras suficientes.
+        """
+        if self.latency.count < settings.HEDGE_MIN_SAMPLES:
+            return None
+        
+        delay_ms = max(self.latency.percentile(settings.HEDGE_PERCENTILE), settings.HEDGE_MIN_DELAY_MS)
+        return min(delay_ms / 1000, self.request_timeout())
 
 
 class BinanceSource(DataSourceBase):
@@ -120,49 +321,227 @@ class BinanceSource(DataSourceBase):
     
     BASE_URL = "https://api.binance.com/api/v3"
     
+    # Acima disso /ticker/24hr?symbols= custa o mesmo que todos os tickers
+    # (peso 80): pedimos todos e decodificamos só os necessários
+    ALL_TICKERS_THRESHOLD = 100
+    
+    # Código de erro da Binance para símbolo inexistente (HTTP 400)
+    INVALID_SYMBOL_CODE = -1121
+    
     def __init__(self):
-        super().__init__("Binance")
+        super().__init__("Binance", rate_limit_per_minute=settings.BINANCE_RATE_LIMIT_WEIGHT_PER_MINUTE)
+        # Símbolos recusados pela Binance (ex: palpites BASE+USDT feitos antes
+        # do universo de /exchangeInfo ser carregado)
+        self._rejected: set = set()
+    
+    @staticmethod
+    def _ticker_weight(num_symbols: int) -> int:
+        """Peso de /ticker/24hr na Binance conforme o número de símbolos"""
+        if num_symbols <= 20:
+            return 2
+        if num_symbols <= 100:
+            return 40
+        return 80
+    
+    @classmethod
+    def _to_binance_symbol(cls, symbol: str, registry: Optional[SymbolRegistry] = None) -> Optional[str]:
+        """
+        Converte símbolo (BTC/USD → BTCUSDT, ETH/BTC → ETHBTC)
+        
+        Usa o universo carregado de /exchangeInfo; antes disso, aplica a
+        regra BASE + QUOTE (USD cotado em USDT).
+        """
+        registry = registry or cls.registry
+        mapped = registry.to_source("Binance", symbol)
+        if mapped is not None or registry.is_loaded("Binance"):
+            return mapped
+        
+        base, _, quote = symbol.partition('/')
+        if not base or not quote:
+            return None
+        return base + ('USDT' if quote == 'USD' else quote)
+    
+    def _binance_symbol(self, symbol: str) -> Optional[str]:
+        """_to_binance_symbol, descartando símbolos já recusados pela Binance"""
+        binance_symbol = self._to_binance_symbol(symbol, self.registry)
+        return None if binance_symbol in self._rejected else binance_symbol
+    
+    def supports(self, symbol: str) -> bool:
+        return self._binance_symbol(symbol) is not None
+    
+    async def _is_invalid_symbol(self, response: aiohttp.ClientResponse) -> bool:
+        """
+        HTTP 400 com código -1121: a Binance não negocia o símbolo pedido
+        
+        A fonte respondeu normalmente: não conta como falha em update_health
+        e a prova do circuit breaker, se houver, é liberada.
+        """
+        if response.status != 400:
+            return False
+        try:
+            body = await self._read_json(response)
+        except Exception:
+            return False
+        if not isinstance(body, dict) or body.get('code') != self.INVALID_SYMBOL_CODE:
+            return False
+        self.breaker.release_probe()
+        return True
+    
+    async def load_symbols(self) -> Dict[str, str]:
+        """Pares em negociação de /exchangeInfo (XXXUSDT → XXX/USD)"""
+        if not await self._acquire_quota(20):
+            return {}
+        
+        session = self._get_session()
+        async with session.get(f"{self.BASE_URL}/exchangeInfo", timeout=aiohttp.ClientTimeout(total=self.timeout * 4)) as response:
+            if response.status != 200:
+                raise Exception(f"HTTP {response.status}")
+            info = await self._read_json(response)
+        
+        mapping: Dict[str, str] = {}
+        for market in info.get('symbols', []):
+            if market.get('status') != 'TRADING':
+                continue
+            quote = 'USD' if market['quoteAsset'] == 'USDT' else market['quoteAsset']
+            mapping.setdefault(f"{market['baseAsset']}/{quote}", market['symbol'])
+        return mapping
+    
+    def _parse_ticker(self, symbol: str, data: Dict[str, Any]) -> PriceData:
+        """Converte um ticker 24h da Binance em PriceData"""
+        return PriceData(
+            source=self.name,
+            symbol=symbol,
+            price=float(data['lastPrice']),
+            volume_24h=float(data['volume']),
+            timestamp=datetime.now(),
+            confidence=95.0,  # Binance é muito confiável
+            metadata={
+                'high_24h': float(data['highPrice']),
+                'low_24h': float(data['lowPrice']),
+                'price_change_pct': float(data['priceChangePercent'])
+            }
+        )
     
     async def fetch_price(self, symbol: str) -> Optional[PriceData]:
         """Busca preço da Binance"""
+        binance_symbol = self._binance_symbol(symbol)
+        if binance_symbol is None:
+            return None
+        
+        if not await self._acquire_quota(self._ticker_weight(1)):
+            return None
+        
         start_time = datetime.now()
         
         try:
-            # Converter símbolo (BTC/USD → BTCUSDT)
-            binance_symbol = symbol.replace('/', '') + 'T' if not symbol.endswith('T') else symbol
+            session = self._get_session()
             
-            async with aiohttp.ClientSession() as session:
-                # Ticker 24h
-                ticker_url = f"{self.BASE_URL}/ticker/24hr?symbol={binance_symbol}"
-                
-                async with session.get(ticker_url, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        response_time = (datetime.now() - start_time).total_seconds() * 1000
-                        self.update_health(True, response_time)
-                        
-                        return PriceData(
-                            source=self.name,
-                            symbol=symbol,
-                            price=float(data['lastPrice']),
-                            volume_24h=float(data['volume']),
-                            timestamp=datetime.now(),
-                            confidence=95.0,  # Binance é muito confiável
-                            metadata={
-                                'high_24h': float(data['highPrice']),
-                                'low_24h': float(data['lowPrice']),
-                                'price_change_pct': float(data['priceChangePercent'])
-                            }
-                        )
-                    else:
-                        raise Exception(f"HTTP {response.status}")
+            # Ticker 24h
+            ticker_url = f"{self.BASE_URL}/ticker/24hr?symbol={binance_symbol}"
+            
+            async with session.get(ticker_url, timeout=self._client_timeout()) as response:
+                if self._is_throttled(response):
+                    return None
+                if await self._is_invalid_symbol(response):
+                    self._rejected.add(binance_symbol)
+                    logger.warning("⚠️ %s (%s) não é negociado na Binance", symbol, binance_symbol)
+                    return None
+                if response.status == 200:
+                    data = await self._read_json(response)
+                    
+                    response_time = (datetime.now() - start_time).total_seconds() * 1000
+                    price_data = self._parse_ticker(symbol, data)
+                    self.update_health(True, response_time)
+                    
+                    return price_data
+                else:
+                    raise Exception(f"HTTP {response.status}")
         
         except Exception as e:
             response_time = (datetime.now() - start_time).total_seconds() * 1000
             self.update_health(False, response_time)
-            logger.warning(f"❌ {self.name} falhou para {symbol}: {str(e)}")
+            logger.warning("❌ %s falhou para %s: %s", self.name, symbol, e)
             return None
+    
+    async def fetch_prices(self, symbols: List[str]) -> Dict[str, PriceData]:
+        """
+        Busca vários tickers em uma única requisição
+        (GET /ticker/24hr?symbols=["BTCUSDT","ETHUSDT",...])
+        
+        Obs: a Binance rejeita o lote inteiro (HTTP 400, código -1121) se
+        algum símbolo for inválido; nesse caso os símbolos são buscados um a
+        um, os inválidos ficam registrados e saem dos próximos lotes.
+        
+        Com mais de ALL_TICKERS_THRESHOLD símbolos, busca todos os tickers
+        (mesmo peso) e decodifica apenas os objetos pedidos.
+        """
+        by_binance_symbol = {}
+        for symbol in symbols:
+            binance_symbol = self._binance_symbol(symbol)
+            if binance_symbol is not None:
+                by_binance_symbol[binance_symbol] = symbol
+        if not by_binance_symbol:
+            return {}
+        
+        if not await self._acquire_quota(self._ticker_weight(len(by_binance_symbol))):
+            return {}
+        
+        start_time = datetime.now()
+        
+        try:
+            session = self._get_session()
+            
+            url = f"{self.BASE_URL}/ticker/24hr"
+            all_tickers = len(by_binance_symbol) > self.ALL_TICKERS_THRESHOLD
+            params = None if all_tickers else {
+                'symbols': json.dumps(list(by_binance_symbol), separators=(',', ':'))
+            }
+            
+            async with session.get(url, params=params, timeout=self._client_timeout()) as response:
+                if self._is_throttled(response):
+                    return {}
+                if await self._is_invalid_symbol(response):
+                    return await self._fetch_individually(by_binance_symbol)
+                if response.status == 200:
+                    raw = await response.read()
+                    
+                    response_time = (datetime.now() - start_time).total_seconds() * 1000
+                    
+                    if all_tickers:
+                        tickers = fast_json.iter_objects(raw, 'symbol', by_binance_symbol)
+                    else:
+                        tickers = ((ticker.get('symbol'), ticker) for ticker in fast_json.loads(raw))
+                    
+                    results = {}
+                    for binance_symbol, ticker in tickers:
+                        symbol = by_binance_symbol.get(binance_symbol)
+                        if symbol is not None:
+                            results[symbol] = self._parse_ticker(symbol, ticker)
+                    self.update_health(True, response_time)
+                    return results
+                else:
+                    raise Exception(f"HTTP {response.status}")
+        
+        except Exception as e:
+            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            self.update_health(False, response_time)
+            logger.warning("❌ %s falhou para lote de %d símbolos: %s", self.name, len(symbols), e)
+            return {}
+    
+    async def _fetch_individually(self, by_binance_symbol: Dict[str, str]) -> Dict[str, PriceData]:
+        """
+        Lote recusado por um símbolo inválido: busca os símbolos um a um
+        
+        fetch_price registra os recusados, que saem dos próximos lotes.
+        """
+        if len(by_binance_symbol) == 1:
+            self._rejected.update(by_binance_symbol)
+            return {}
+        logger.warning(
+            "⚠️ %s: lote recusado por símbolo inválido, buscando %d símbolos individualmente",
+            self.name, len(by_binance_symbol)
+        )
+        return await super().fetch_prices(list(by_binance_symbol.values()))
 
 
 class CoinGeckoSource(DataSourceBase):
@@ -170,7 +549,7 @@ class CoinGeckoSource(DataSourceBase):
     
     BASE_URL = "https://api.coingecko.com/api/v3"
     
-    # Mapeamento de símbolos
+    # Mapeamentos fixos (têm precedência sobre o universo de load_symbols)
     SYMBOL_MAP = {
         'BTC/USD': 'bitcoin',
         'ETH/USD': 'ethereum',
@@ -180,55 +559,152 @@ class CoinGeckoSource(DataSourceBase):
     }
     
     def __init__(self):
-        super().__init__("CoinGecko")
+        super().__init__("CoinGecko", rate_limit_per_minute=settings.COINGECKO_RATE_LIMIT_PER_MINUTE)
+        self.registry.register(self.name, self.SYMBOL_MAP)
+    
+    def supports(self, symbol: str) -> bool:
+        return self.registry.to_source(self.name, symbol) is not None
+    
+    async def load_symbols(self) -> Dict[str, str]:
+        """
+        Maiores ativos por market cap (/coins/markets), SYMBOL_UNIVERSE_SIZE no total
+        
+        Tickers repetidos ficam com o ativo de maior market cap.
+        """
+        session = self._get_session()
+        mapping: Dict[str, str] = {}
+        per_page = 250
+        pages = -(-settings.SYMBOL_UNIVERSE_SIZE // per_page)
+        
+        for page in range(1, pages + 1):
+            if not await self._acquire_quota():
+                break
+            params = {
+                'vs_currency': 'usd',
+                'order': 'market_cap_desc',
+                'per_page': per_page,
+                'page': page
+            }
+            async with session.get(f"{self.BASE_URL}/coins/markets", params=params, timeout=aiohttp.ClientTimeout(total=self.timeout * 4)) as response:
+                if self._is_throttled(response):
+                    break
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}")
+                coins = await self._read_json(response)
+            
+            for coin in coins:
+                mapping.setdefault(f"{coin['symbol'].upper()}/USD", coin['id'])
+            if len(coins) < per_page:
+                break
+        
+        if mapping:
+            mapping.update(self.SYMBOL_MAP)
+        return mapping
+    
+    def _parse_coin(self, symbol: str, coin_data: Dict[str, Any]) -> PriceData:
+        """Converte uma entrada de /simple/price em PriceData"""
+        return PriceData(
+            source=self.name,
+            symbol=symbol,
+            price=float(coin_data['usd']),
+            volume_24h=coin_data.get('usd_24h_vol'),
+            timestamp=datetime.now(),
+            confidence=90.0,  # CoinGecko é confiável
+            metadata={
+                'change_24h': coin_data.get('usd_24h_change')
+            }
+        )
+    
+    async def _fetch_simple_price(self, coin_ids: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        GET /simple/price para uma lista de ids (uma única requisição)
+        
+        Returns:
+            JSON da resposta, ou None se a API recusou por rate limit
+        """
+        session = self._get_session()
+        
+        url = f"{self.BASE_URL}/simple/price"
+        params = {
+            'ids': ','.join(coin_ids),
+            'vs_currencies': 'usd',
+            'include_24hr_vol': 'true',
+            'include_24hr_change': 'true'
+        }
+        
+        async with session.get(url, params=params, timeout=self._client_timeout()) as response:
+            if self._is_throttled(response):
+                return None
+            if response.status == 200:
+                return await self._read_json(response)
+            raise Exception(f"HTTP {response.status}")
     
     async def fetch_price(self, symbol: str) -> Optional[PriceData]:
         """Busca preço do CoinGecko"""
+        # Mapear símbolo
+        coin_id = self.registry.to_source(self.name, symbol)
+        if not coin_id:
+            logger.warning("⚠️ %s não mapeado no CoinGecko", symbol)
+            return None
+        
+        if not await self._acquire_quota():
+            return None
+        
         start_time = datetime.now()
         
         try:
-            # Mapear símbolo
-            coin_id = self.SYMBOL_MAP.get(symbol)
-            if not coin_id:
-                logger.warning(f"⚠️ {symbol} não mapeado no CoinGecko")
+            data = await self._fetch_simple_price([coin_id])
+            if data is None:
                 return None
+            coin_data = data.get(coin_id, {})
             
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.BASE_URL}/simple/price"
-                params = {
-                    'ids': coin_id,
-                    'vs_currencies': 'usd',
-                    'include_24hr_vol': 'true',
-                    'include_24hr_change': 'true'
-                }
-                
-                async with session.get(url, params=params, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        coin_data = data.get(coin_id, {})
-                        
-                        response_time = (datetime.now() - start_time).total_seconds() * 1000
-                        self.update_health(True, response_time)
-                        
-                        return PriceData(
-                            source=self.name,
-                            symbol=symbol,
-                            price=float(coin_data['usd']),
-                            volume_24h=coin_data.get('usd_24h_vol'),
-                            timestamp=datetime.now(),
-                            confidence=90.0,  # CoinGecko é confiável
-                            metadata={
-                                'change_24h': coin_data.get('usd_24h_change')
-                            }
-                        )
-                    else:
-                        raise Exception(f"HTTP {response.status}")
+            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            price_data = self._parse_coin(symbol, coin_data)
+            self.update_health(True, response_time)
+            
+            return price_data
         
         except Exception as e:
             response_time = (datetime.now() - start_time).total_seconds() * 1000
             self.update_health(False, response_time)
-            logger.warning(f"❌ {self.name} falhou para {symbol}: {str(e)}")
+            logger.warning("❌ %s falhou para %s: %s", self.name, symbol, e)
             return None
+    
+    async def fetch_prices(self, symbols: List[str]) -> Dict[str, PriceData]:
+        """Busca vários preços em uma única requisição (/simple/price?ids=a,b,c)"""
+        by_coin_id = {}
+        for symbol in symbols:
+            coin_id = self.registry.to_source(self.name, symbol)
+            if coin_id is not None:
+                by_coin_id[coin_id] = symbol
+        if not by_coin_id:
+            return {}
+        
+        if not await self._acquire_quota():
+            return {}
+        
+        start_time = datetime.now()
+        
+        try:
+            data = await self._fetch_simple_price(list(by_coin_id))
+            if data is None:
+                return {}
+            
+            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            results = {
+                symbol: self._parse_coin(symbol, data[coin_id])
+                for coin_id, symbol in by_coin_id.items()
+                if 'usd' in data.get(coin_id, {})
+            }
+            self.update_health(True, response_time)
+            
+            return results
+        
+        except Exception as e:
+            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            self.update_health(False, response_time)
+            logger.warning("❌ %s falhou para lote de %d símbolos: %s", self.name, len(symbols), e)
+            return {}
 
 
 class CoinCapSource(DataSourceBase):
@@ -236,6 +712,7 @@ class CoinCapSource(DataSourceBase):
     
     BASE_URL = "https://api.coincap.io/v2"
     
+    # Mapeamentos fixos (têm precedência sobre o universo de load_symbols)
     SYMBOL_MAP = {
         'BTC/USD': 'bitcoin',
         'ETH/USD': 'ethereum',
@@ -245,48 +722,283 @@ class CoinCapSource(DataSourceBase):
     }
     
     def __init__(self):
-        super().__init__("CoinCap")
+        super().__init__("CoinCap", rate_limit_per_minute=settings.COINCAP_RATE_LIMIT_PER_MINUTE)
+        self.registry.register(self.name, self.SYMBOL_MAP)
+    
+    def supports(self, symbol: str) -> bool:
+        return self.registry.to_source(self.name, symbol) is not None
+    
+    async def load_symbols(self) -> Dict[str, str]:
+        """Ativos por ranking (/assets?limit=N); tickers repetidos ficam com o melhor rank"""
+        if not await self._acquire_quota():
+            return {}
+        
+        session = self._get_session()
+        params = {'limit': min(settings.SYMBOL_UNIVERSE_SIZE, 2000)}
+        async with session.get(f"{self.BASE_URL}/assets", params=params, timeout=aiohttp.ClientTimeout(total=self.timeout * 4)) as response:
+            if response.status != 200:
+                raise Exception(f"HTTP {response.status}")
+            result = await self._read_json(response)
+        
+        mapping: Dict[str, str] = {}
+        for asset in result.get('data', []):
+            mapping.setdefault(f"{asset['symbol'].upper()}/USD", asset['id'])
+        if mapping:
+            mapping.update(self.SYMBOL_MAP)
+        return mapping
+    
+    def _parse_asset(self, symbol: str, data: Dict[str, Any]) -> PriceData:
+        """Converte um asset do CoinCap em PriceData"""
+        return PriceData(
+            source=self.name,
+            symbol=symbol,
+            price=float(data['priceUsd']),
+            volume_24h=float(data.get('volumeUsd24Hr') or 0),
+            timestamp=datetime.now(),
+            confidence=85.0,
+            metadata={
+                'market_cap': float(data['marketCapUsd']),
+                'change_24h': float(data['changePercent24Hr'])
+            }
+        )
     
     async def fetch_price(self, symbol: str) -> Optional[PriceData]:
         """Busca preço do CoinCap"""
+        asset_id = self.registry.to_source(self.name, symbol)
+        if not asset_id:
+            return None
+        
+        if not await self._acquire_quota():
+            return None
+        
         start_time = datetime.now()
         
         try:
-            asset_id = self.SYMBOL_MAP.get(symbol)
-            if not asset_id:
-                return None
+            session = self._get_session()
             
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.BASE_URL}/assets/{asset_id}"
-                
-                async with session.get(url, timeout=self.timeout) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        data = result['data']
-                        
-                        response_time = (datetime.now() - start_time).total_seconds() * 1000
-                        self.update_health(True, response_time)
-                        
-                        return PriceData(
-                            source=self.name,
-                            symbol=symbol,
-                            price=float(data['priceUsd']),
-                            volume_24h=float(data.get('volumeUsd24Hr', 0)),
-                            timestamp=datetime.now(),
-                            confidence=85.0,
-                            metadata={
-                                'market_cap': float(data['marketCapUsd']),
-                                'change_24h': float(data['changePercent24Hr'])
-                            }
-                        )
-                    else:
-                        raise Exception(f"HTTP {response.status}")
+            url = f"{self.BASE_URL}/assets/{asset_id}"
+            
+            async with session.get(url, timeout=self._client_timeout()) as response:
+                if self._is_throttled(response):
+                    return None
+                if response.status == 200:
+                    result = await self._read_json(response)
+                    data = result['data']
+                    
+                    response_time = (datetime.now() - start_time).total_seconds() * 1000
+                    price_data = self._parse_asset(symbol, data)
+                    self.update_health(True, response_time)
+                    
+                    return price_data
+                else:
+                    raise Exception(f"HTTP {response.status}")
         
         except Exception as e:
             response_time = (datetime.now() - start_time).total_seconds() * 1000
             self.update_health(False, response_time)
-            logger.warning(f"❌ {self.name} falhou para {symbol}: {str(e)}")
+            logger.warning("❌ %s falhou para %s: %s", self.name, symbol, e)
+            return None
+    
+    async def fetch_prices(self, symbols: List[str]) -> Dict[str, PriceData]:
+        """Busca vários assets em uma única requisição (/assets?ids=a,b,c)"""
+        by_asset_id = {}
+        for symbol in symbols:
+            asset_id = self.registry.to_source(self.name, symbol)
+            if asset_id is not None:
+                by_asset_id[asset_id] = symbol
+        if not by_asset_id:
+            return {}
+        
+        if not await self._acquire_quota():
+            return {}
+        
+        start_time = datetime.now()
+        
+        try:
+            session = self._get_session()
+            
+            url = f"{self.BASE_URL}/assets"
+            params = {'ids': ','.join(by_asset_id)}
+            
+            async with session.get(url, params=params, timeout=self._client_timeout()) as response:
+                if self._is_throttled(response):
+                    return {}
+                if response.status == 200:
+                    result = await self._read_json(response)
+                    
+                    response_time = (datetime.now() - start_time).total_seconds() * 1000
+                    
+                    results = {}
+                    for asset in result.get('data', []):
+                        symbol = by_asset_id.get(asset.get('id'))
+                        if symbol is not None:
+                            results[symbol] = self._parse_asset(symbol, asset)
+                    self.update_health(True, response_time)
+                    return results
+                else:
+                    raise Exception(f"HTTP {response.status}")
+        
+        except Exception as e:
+            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            self.update_health(False, response_time)
+            logger.warning("❌ %s falhou para lote de %d símbolos: %s", self.name, len(symbols), e)
+            return {}
+
+
+class ChainlinkSource(DataSourceBase):
+    """
+    Fonte de dados: Chainlink Price Feeds (on-chain)
+    
+    Todos os feeds pedidos são lidos em um único eth_call à Multicall3
+    (latestRoundData de cada feed + número/timestamp do bloco), em vez de
+    uma chamada RPC por feed.
+    
+    Verificações de obsolescência:
+    - Bloco: resposta de um nó RPC atrasado (bloco abaixo do maior já visto
+      menos max_block_lag) é tratada como falha da fonte
+    - Feed: updatedAt mais antigo que max_feed_age em relação ao bloco, ou
+      rodada incompleta (answeredInRound < roundId), é descartado
+    """
+    
+    def __init__(
+        self,
+        rpc_url: Optional[str] = None,
+        feeds: Optional[Dict[str, str]] = None,
+        multicall_address: Optional[str] = None,
+        max_feed_age: Optional[float] = None,
+        max_block_lag: Optional[int] = None
+    ):
+        super().__init__("Chainlink")
+        self.rpc_url = rpc_url or settings.CHAINLINK_RPC_URL
+        self.feeds = feeds if feeds is not None else self._parse_feeds(settings.CHAINLINK_FEEDS)
+        self.multicall_address = multicall_address or settings.CHAINLINK_MULTICALL_ADDRESS
+        self.max_feed_age = max_feed_age if max_feed_age is not None else settings.CHAINLINK_MAX_FEED_AGE_SECONDS
+        self.max_block_lag = max_block_lag if max_block_lag is not None else settings.CHAINLINK_MAX_BLOCK_LAG
+        
+        self.decimals: Dict[str, int] = {}  # por símbolo, lido uma única vez
+        self.last_block = 0
+        self._request_id = 0
+    
+    def supports(self, symbol: str) -> bool:
+        return symbol in self.feeds
+    
+    @staticmethod
+    def _parse_feeds(raw: str) -> Dict[str, str]:
+        """'BTC/USD=0x...,ETH/USD=0x...' → {símbolo: endereço do feed}"""
+        feeds = {}
+        for item in raw.split(','):
+            if '=' in item:
+                symbol, address = item.split('=', 1)
+                feeds[symbol.strip()] = address.strip()
+        return feeds
+    
+    async def _multicall(self, calls: List[multicall.Call]) -> Optional[List[Tuple[bool, bytes]]]:
+        """Executa aggregate3 via eth_call (None se a fonte estiver limitada)"""
+        self._request_id += 1
+        payload = {
+            'jsonrpc': '2.0',
+            'id': self._request_id,
+            'method': 'eth_call',
+            'params': [
+                {'to': self.multicall_address, 'data': multicall.encode_aggregate3(calls)},
+                'latest'
+            ]
+        }
+        
+        session = self._get_session()
+        async with session.post(self.rpc_url, json=payload, timeout=self._client_timeout()) as response:
+            if self._is_throttled(response):
+                return None
+            if response.status != 200:
+                raise Exception(f"HTTP {response.status}")
+            body = await self._read_json(response)
+        
+        if body.get('error'):
+            raise Exception(f"RPC: {body['error'].get('message', body['error'])}")
+        return multicall.decode_aggregate3(body['result'])
+    
+    def _parse_round(self, symbol: str, round_data: multicall.RoundData, block_number: int, block_time: int) -> Optional[PriceData]:
+        """Converte latestRoundData em PriceData (None se obsoleto/inválido)"""
+        age = block_time - round_data.updated_at
+        if round_data.answer <= 0 or round_data.answered_in_round < round_data.round_id:
+            logger.warning("⚠️ %s: rodada inválida para %s (round %d)", self.name, symbol, round_data.round_id)
+            return None
+        if age > self.max_feed_age:
+            logger.warning("⚠️ %s: feed %s obsoleto (%ds sem atualização)", self.name, symbol, age)
+            return None
+        
+        return PriceData(
+            source=self.name,
+            symbol=symbol,
+            price=round_data.answer / 10 ** self.decimals[symbol],
+            volume_24h=None,
+            timestamp=datetime.now(),
+            confidence=90.0,  # Rede de oráculos descentralizada, atualização por desvio/heartbeat
+            metadata={
+                'round_id': round_data.round_id,
+                'updated_at': datetime.fromtimestamp(round_data.updated_at).isoformat(),
+                'feed_age_seconds': age,
+                'block_number': block_number
+            }
+        )
+    
+    async def fetch_price(self, symbol: str) -> Optional[PriceData]:
+        """Busca preço de um feed (um eth_call)"""
+        if symbol not in self.feeds:
             return None
+        return (await self.fetch_prices([symbol])).get(symbol)
+    
+    async def fetch_prices(self, symbols: List[str]) -> Dict[str, PriceData]:
+        """Busca todos os feeds pedidos em um único eth_call (Multicall3)"""
+        feeds = [s for s in dict.fromkeys(symbols) if s in self.feeds]
+        if not feeds or not self.rpc_url:
+            return {}
+        
+        start_time = datetime.now()
+        
+        try:
+            missing_decimals = [s for s in feeds if s not in self.decimals]
+            calls = [
+                multicall.Call(self.multicall_address, multicall.GET_BLOCK_NUMBER, False),
+                multicall.Call(self.multicall_address, multicall.GET_CURRENT_BLOCK_TIMESTAMP, False),
+            ]
+            calls += [multicall.Call(self.feeds[s], multicall.LATEST_ROUND_DATA) for s in feeds]
+            calls += [multicall.Call(self.feeds[s], multicall.DECIMALS) for s in missing_decimals]
+            
+            results = await self._multicall(calls)
+            if results is None:
+                return {}
+            
+            block_number = multicall.decode_uint(results[0][1])
+            block_time = multicall.decode_uint(results[1][1])
+            if block_number + self.max_block_lag < self.last_block:
+                raise Exception(
+                    f"nó RPC atrasado (bloco {block_number}, já visto {self.last_block})"
+                )
+            self.last_block = max(self.last_block, block_number)
+            
+            for symbol, (success, data) in zip(missing_decimals, results[2 + len(feeds):]):
+                if success:
+                    self.decimals[symbol] = multicall.decode_uint(data)
+            
+            prices = {}
+            for symbol, (success, data) in zip(feeds, results[2:2 + len(feeds)]):
+                if not success or symbol not in self.decimals:
+                    logger.warning("⚠️ %s: chamada ao feed %s falhou", self.name, symbol)
+                    continue
+                price_data = self._parse_round(symbol, multicall.decode_round_data(data), block_number, block_time)
+                if price_data is not None:
+                    prices[symbol] = price_data
+            
+            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            self.update_health(True, response_time)
+            return prices
+        
+        except Exception as e:
+            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            self.update_health(False, response_time)
+            logger.warning("❌ %s falhou para lote de %d feeds: %s", self.name, len(feeds), e)
+            return {}
 
 
 class MultiSourceAggregator:
@@ -296,20 +1008,181 @@ class MultiSourceAggregator:
     - Validação cruzada
     - Circuit breaker
     - Consenso entre fontes
+    - Pool de conexões HTTP compartilhado (keep-alive + cache de DNS)
+    - Stale-while-revalidate + refresher em background (opcional)
+    - Quórum antecipado: consenso assim que min_sources concordam (opcional)
+    - Hedging por percentil de latência de cada fonte (opcional)
+    
+    Uso recomendado em processos de longa duração:
+    
+        async with MultiSourceAggregator() as aggregator:
+            await aggregator.get_price('BTC/USD')
     """
     
-    def __init__(self):
-        self.sources: List[DataSourceBase] = [
+    def __init__(
+        self,
+        sources: Optional[List[DataSourceBase]] = None,
+        stale_while_revalidate: bool = False,
+        early_quorum: bool = False,
+        hedging: bool = False,
+        cache: Optional[PriceCacheBase] = None
+    ):
+        self.sources: List[DataSourceBase] = sources if sources is not None else [
             BinanceSource(),
             CoinGeckoSource(),
             CoinCapSource(),
         ]
+        if sources is None and settings.CHAINLINK_RPC_URL:
+            self.sources.append(ChainlinkSource())
+        
+        # Stale-while-revalidate: serve o último consenso e atualiza em background
+        self.stale_while_revalidate = stale_while_revalidate
+        self.refresh_ahead = timedelta(seconds=settings.CACHE_REFRESH_AHEAD_SECONDS)
+        self.max_staleness = timedelta(seconds=settings.CACHE_MAX_STALENESS_SECONDS)
+        
+        # Cache de preços limitado (LRU, TTL por classe de símbolo, descarte
+        # após max_staleness); memória local ou Redis conforme CACHE_BACKEND
+        self.cache: PriceCacheBase = cache if cache is not None else create_price_cache(
+            max_age=self.max_staleness
+        )
+        self.tracked_symbols: set = set()
+        self._refresher: Optional[asyncio.Task] = None
+        # Atualizações em background (canceladas por stop_refresher) e buscas
+        # em primeiro plano (canceladas apenas por close)
+        self._background_tasks: set = set()
+        self._fetch_tasks: set = set()
+        self._refreshing: set = set()  # símbolos com atualização em lote em andamento
+        
+        # Histórico local de ticks (consenso + por fonte) em ring buffers;
+        # TICK_HISTORY_CAPACITY=0 desativa
+        self.history: Optional[TickHistory] = (
+            TickHistory(settings.TICK_HISTORY_CAPACITY)
+            if settings.TICK_HISTORY_CAPACITY > 0 else None
+        )
+        
+        # Snapshots em disco (cache, saúde e latência) para reinício a quente
+        self.snapshot_path = settings.SNAPSHOT_PATH or None
+        self._snapshotter: Optional[asyncio.Task] = None
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            self.load_snapshot()
+        
+        # Quórum antecipado: retorna quando min_sources concordam, sem esperar
+        # a fonte mais lenta
+        self.early_quorum = early_quorum
+        
+        # Hedging: requisição duplicada quando a fonte passa do seu p95
+        self.hedging = hedging
+        self.hedged_requests = 0
+        
+        # Pool de conexões (criado sob demanda dentro do event loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Requisições em andamento (single-flight): chamadas concorrentes para o
+        # mesmo símbolo aguardam a mesma busca em vez de repetir o fan-out
+        self._inflight: Dict[Tuple[str, int, float], asyncio.Future] = {}
+        self.coalesced_requests = 0
+        
+        # Contadores agregados (substituem logs por requisição); resumo em
+        # INFO a cada LOG_SUMMARY_INTERVAL_SECONDS
+        self.counters: Dict[str, int] = defaultdict(int)
+        self._summary_counts: Dict[str, int] = {}
+        self._summary_at = time.monotonic()
+        
+        logger.info("✅ Agregador inicializado com %d fontes", len(self.sources))
+    
+    @property
+    def cache_ttl(self) -> timedelta:
+        """TTL padrão (símbolos fora das classes configuradas no cache)"""
+        return self.cache.default_ttl
+    
+    @cache_ttl.setter
+    def cache_ttl(self, value: timedelta):
+        self.cache.default_ttl = value
+    
+    async def __aenter__(self) -> "MultiSourceAggregator":
+        self._ensure_session()
+        if settings.SYMBOL_UNIVERSE_AUTOLOAD:
+            await self.load_symbol_universe()
+        if self.snapshot_path:
+            self.start_snapshots()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Cria (se necessário) a sessão HTTP compartilhada e a associa às fontes.
+        
+        Uma única sessão mantém conexões keep-alive por host, evitando um novo
+        handshake TCP+TLS e lookup de DNS a cada requisição.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not loop:
+            # Sessão presa a um event loop anterior (ex: asyncio.run repetido
+            # no dashboard) não pode ser reutilizada; descartamos a referência.
+            self._session = None
+        
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=settings.HTTP_POOL_LIMIT,
+                limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+                keepalive_timeout=settings.HTTP_KEEPALIVE_SECONDS,
+                ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL_SECONDS,
+                use_dns_cache=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+            logger.info(
+                "🔌 Pool HTTP criado (limit=%d, per_host=%d)",
+                settings.HTTP_POOL_LIMIT, settings.HTTP_POOL_LIMIT_PER_HOST
+            )
+        
+        for source in self.sources:
+            if source.session is not self._session:
+                source.bind_session(self._session)
+        
+        return self._session
+    
+    async def start_streams(self, symbols: List[str]):
+        """
+        Inicia as assinaturas das fontes de streaming (ver src.data.streaming)
+        
+        Após iniciadas, get_price lê o último tick de cada fonte em memória.
+        """
+        self._ensure_session()
+        await asyncio.gather(*(source.start(symbols) for source in self.sources))
+    
+    async def load_symbol_universe(self) -> Dict[str, int]:
+        """
+        Carrega (ou atualiza) o universo de símbolos de cada fonte no registro
+        
+        Returns:
+            Número de símbolos por fonte (0 = sem descoberta ou falha)
+        """
+        self._ensure_session()
+        counts = await asyncio.gather(*(source.refresh_symbols() for source in self.sources))
+        universe = {source.name: count for source, count in zip(self.sources, counts)}
+        logger.info("🗂️ Universo de símbolos carregado: %s", universe)
+        return universe
+    
+    async def close(self):
+        """Fecha o pool de conexões compartilhado e sessões próprias das fontes"""
+        await self.stop_refresher()
+        await self._cancel_tasks(self._fetch_tasks)
+        await self.stop_snapshots()
+        if self.snapshot_path:
+            await self.save_snapshot_async()
         
-        # Cache de preços (TTL: 30 segundos)
-        self.cache: Dict[str, Tuple[PriceData, datetime]] = {}
-        self.cache_ttl = timedelta(seconds=30)
+        for source in self.sources:
+            await source.close()
         
-        logger.info(f"✅ Agregador inicializado com {len(self.sources)} fontes")
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        logger.info("🔌 Pool HTTP encerrado")
     
     async def get_price(
         self,
@@ -320,33 +1193,553 @@ class MultiSourceAggregator:
         """
         Busca preço de múltiplas fontes e retorna consenso
         
+        Com stale_while_revalidate ativo, entradas próximas da expiração (ou
+        expiradas, até max_staleness) são servidas imediatamente, anotadas com
+        'cache_age_seconds'/'stale', enquanto a atualização roda em background.
+        
         Args:
             symbol: Par de negociação (ex: BTC/USD)
             min_sources: Mínimo de fontes necessárias
             max_deviation: Desvio máximo aceitável entre fontes (%)
         """
+        self._count('requests')
+        
         # Verificar cache
-        cached = self._get_from_cache(symbol)
-        if cached:
-            logger.info(f"💾 Cache hit para {symbol}")
-            return cached
+        entry = await self._get_cache_entry(symbol)
+        if entry:
+            data, age = entry
+            ttl = self.cache.ttl_for(symbol)
+            if age < ttl:
+                self._count('cache_hits')
+                if self.stale_while_revalidate:
+                    if age >= ttl - self.refresh_ahead:
+                        self._start_fetch(symbol, min_sources, max_deviation, background=True)
+                    return self._annotate_age(data, age)
+                logger.debug("💾 Cache hit para %s", symbol)
+                return data
+            
+            if self.stale_while_revalidate and age < self.max_staleness:
+                self._count('stale_served')
+                logger.debug("♻️ Servindo %s obsoleto (%.1fs), atualizando em background", symbol, age.total_seconds())
+                self._start_fetch(symbol, min_sources, max_deviation, background=True)
+                return self._annotate_age(data, age)
+        
+        # Coalescer chamadas concorrentes para o mesmo símbolo
+        # shield: o cancelamento de um chamador não cancela a busca compartilhada
+        return await asyncio.shield(self._start_fetch(symbol, min_sources, max_deviation))
+    
+    def _start_fetch(
+        self,
+        symbol: str,
+        min_sources: int,
+        max_deviation: float,
+        background: bool = False
+    ) -> asyncio.Future:
+        """
+        Retorna a busca em andamento para o símbolo, criando-a se necessário
+        (single-flight: uma única busca por chave, compartilhada por todos)
+        
+        Buscas em background (stale-while-revalidate, refresh-ahead) são
+        canceladas por stop_refresher(); assim que um chamador passa a
+        aguardá-la, a busca só é cancelada por close().
+        """
+        key = (symbol, min_sources, max_deviation)
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            tasks = self._background_tasks if background else self._fetch_tasks
+            inflight = self._spawn(self._fetch_and_aggregate(symbol, min_sources, max_deviation), tasks)
+            self._inflight[key] = inflight
+            inflight.add_done_callback(functools.partial(self._clear_inflight, key))
+        else:
+            if not background and inflight in self._background_tasks:
+                # Um chamador aguarda a busca: stop_refresher() não a cancela mais
+                self._background_tasks.discard(inflight)
+                self._fetch_tasks.add(inflight)
+                inflight.add_done_callback(self._fetch_tasks.discard)
+            self.coalesced_requests += 1
+            self._count('coalesced')
+            logger.debug("🔗 Aguardando busca em andamento para %s", symbol)
+        return inflight
+    
+    def _clear_inflight(self, key: Tuple[str, int, float], future: asyncio.Future):
+        """Remove a busca concluída do registro de requisições em andamento"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Consumir exceção de buscas em background que ninguém aguardou
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("❌ Busca para %s falhou: %s", key[0], future.exception())
+    
+    async def _fetch_and_aggregate(
+        self,
+        symbol: str,
+        min_sources: int,
+        max_deviation: float
+    ) -> Optional[PriceData]:
+        """Fan-out para todas as fontes + consenso + cache (uma busca por símbolo)"""
+        # Apenas fontes que negociam o símbolo (sem requisições inúteis)
+        sources = [source for source in self.sources if source.supports(symbol)]
         
         # Buscar de todas as fontes em paralelo
-        logger.info(f"🔍 Buscando {symbol} em {len(self.sources)} fontes...")
+        self._count('fetches')
+        logger.debug("🔍 Buscando %s em %d fontes...", symbol, len(sources))
         
-        tasks = [source.fetch_price(symbol) for source in self.sources]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        self._ensure_session()
         
-        # Filtrar resultados válidos
-        valid_results: List[PriceData] = [
-            r for r in results 
-            if isinstance(r, PriceData) and r is not None
-        ]
+        if self.early_quorum:
+            valid_results = await self._gather_quorum(symbol, sources, min_sources, max_deviation)
+        else:
+            tasks = [self._fetch_from(source, symbol) for source in sources]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Filtrar resultados válidos
+            valid_results: List[PriceData] = [
+                r for r in results 
+                if isinstance(r, PriceData) and r is not None
+            ]
+        
+        aggregated = self._build_consensus(symbol, valid_results, min_sources, max_deviation)
+        self._record_ticks(valid_results, aggregated)
+        if aggregated is None:
+            self._count('no_consensus')
+            return None
+        self._count('consensus')
+        
+        # Desvio de cada fonte (inclusive outliers removidos) → peso futuro
+        self._record_deviations({
+            r.source: abs(r.price - aggregated.price) / aggregated.price * 100
+            for r in valid_results
+        })
+        
+        # Cachear resultado
+        await self._save_to_cache(symbol, aggregated)
+        
+        return aggregated
+    
+    async def _fetch_from(self, source: DataSourceBase, symbol: str) -> Optional[PriceData]:
+        """
+        Busca em uma fonte, respeitando o circuit breaker, com hedging opcional
+        
+        Fontes com circuito OPEN não são chamadas (sem gastar um timeout).
+        Se a fonte não responder até seu p95 (hedge_delay), uma requisição
+        duplicada é disparada; vale a primeira resposta válida e a outra é
+        cancelada.
+        """
+        if not source.breaker.allow_request():
+            logger.debug("⛔ %s ignorada (circuito %s)", source.name, source.breaker.state.value)
+            return None
+        
+        # Em HALF_OPEN apenas a prova única é enviada (sem hedge)
+        hedge = self.hedging and source.breaker.state == BreakerState.CLOSED
+        delay = source.hedge_delay() if hedge else None
+        if delay is None:
+            return await source.fetch_price(symbol)
+        
+        primary = asyncio.ensure_future(source.fetch_price(symbol))
+        pending = {primary}
+        
+        # try/finally cobre também a primeira espera: se o chamador for
+        # cancelado, nenhuma requisição fica órfã
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+            
+            self.hedged_requests += 1
+            self._count('hedged')
+            logger.debug("🪃 Hedge para %s/%s após %.0fms", source.name, symbol, delay * 1000)
+            pending.add(asyncio.ensure_future(source.fetch_price(symbol)))
+            
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and isinstance(task.result(), PriceData):
+                        return task.result()
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def _gather_quorum(
+        self,
+        symbol: str,
+        sources: List[DataSourceBase],
+        min_sources: int,
+        max_deviation: float
+    ) -> List[PriceData]:
+        """
+        Aguarda as fontes por ordem de chegada e para assim que min_sources
+        resultados concordam dentro de max_deviation
+        
+        Fontes ainda pendentes não são canceladas: continuam em background
+        para que o resultado tardio atualize SourceHealth normalmente.
+        Se o quórum não for atingido, retorna todos os resultados válidos
+        (o consenso completo, com remoção de outliers, decide).
+        """
+        pending = {asyncio.ensure_future(self._fetch_from(source, symbol)) for source in sources}
+        valid_results: List[PriceData] = []
+        
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception() is None and isinstance(task.result(), PriceData):
+                    valid_results.append(task.result())
+            
+            if len(valid_results) >= min_sources and self._within_deviation(valid_results, max_deviation):
+                break
+        
+        if pending:
+            self._count('early_quorum')
+            logger.debug(
+                "⚡ Quórum para %s com %d fontes (%d pendentes seguem em background)",
+                symbol, len(valid_results), len(pending)
+            )
+            for task in pending:
+                self._spawn(task)
+        
+        return valid_results
+    
+    @staticmethod
+    def _within_deviation(results: List[PriceData], max_deviation: float) -> bool:
+        """Desvio padrão relativo (%) dos preços dentro do limite"""
+        prices = [r.price for r in results]
+        avg_price = statistics.mean(prices)
+        if avg_price <= 0:
+            return False
+        std_dev = statistics.stdev(prices) if len(prices) > 1 else 0
+        return std_dev / avg_price * 100 <= max_deviation
+    
+    async def get_prices(
+        self,
+        symbols: List[str],
+        min_sources: int = 2,
+        max_deviation: float = 5.0
+    ) -> Dict[str, Optional[PriceData]]:
+        """
+        Busca preços de vários símbolos com um único round-trip por fonte
+        
+        Cada fonte recebe a lista completa de símbolos sem cache válido
+        (fetch_prices), então o número de requisições por ciclo é igual ao
+        número de fontes, independente da quantidade de ativos.
+        
+        Args:
+            symbols: Pares de negociação (ex: ['BTC/USD', 'ETH/USD'])
+            min_sources: Mínimo de fontes necessárias por símbolo
+            max_deviation: Desvio máximo aceitável entre fontes (%)
+        
+        Returns:
+            Dicionário símbolo → consenso (None quando não há consenso)
+        """
+        results: Dict[str, Optional[PriceData]] = {}
+        missing: List[str] = []
+        due: List[str] = []
+        
+        for symbol in dict.fromkeys(symbols):
+            entry = await self._get_cache_entry(symbol)
+            if entry is None:
+                missing.append(symbol)
+                continue
+            
+            data, age = entry
+            ttl = self.cache.ttl_for(symbol)
+            if not self.stale_while_revalidate:
+                if age < ttl:
+                    results[symbol] = data
+                else:
+                    missing.append(symbol)
+            elif age < self.max_staleness:
+                results[symbol] = self._annotate_age(data, age)
+                if age >= ttl - self.refresh_ahead:
+                    due.append(symbol)
+            else:
+                missing.append(symbol)
+        
+        # Uma única atualização em lote por símbolo (sem thundering herd)
+        due = [symbol for symbol in due if symbol not in self._refreshing]
+        if due:
+            self._refreshing.update(due)
+            self._spawn(self._refresh_many(due, min_sources, max_deviation))
+        
+        if not missing:
+            logger.debug("💾 Cache hit para %d símbolos", len(results))
+            return results
+        
+        results.update(await self._fetch_and_aggregate_many(missing, min_sources, max_deviation))
+        return results
+    
+    async def _refresh_many(self, symbols: List[str], min_sources: int, max_deviation: float):
+        """Atualização em background de get_prices (libera os símbolos ao terminar)"""
+        try:
+            await self._fetch_and_aggregate_many(symbols, min_sources, max_deviation)
+        finally:
+            self._refreshing.difference_update(symbols)
+    
+    async def _fetch_and_aggregate_many(
+        self,
+        symbols: List[str],
+        min_sources: int,
+        max_deviation: float
+    ) -> Dict[str, Optional[PriceData]]:
+        """Busca em lote (fetch_prices) + consenso + cache para cada símbolo"""
+        self._count('batch_fetches')
+        logger.debug("🔍 Buscando %d símbolos em lote (%d fontes)...", len(symbols), len(self.sources))
+        
+        self._ensure_session()
+        
+        # Cada fonte recebe só os símbolos que negocia; fontes sem nenhum
+        # (ou com circuito aberto) não são chamadas
+        active: List[DataSourceBase] = []
+        requests = []
+        for source in self.sources:
+            supported = [symbol for symbol in symbols if source.supports(symbol)]
+            if supported and source.breaker.allow_request():
+                active.append(source)
+                requests.append(source.fetch_prices(supported))
+        batches = await asyncio.gather(*requests, return_exceptions=True)
+        
+        # Matrizes fontes × símbolos (NaN = sem preço)
+        shape = (len(active), len(symbols))
+        prices = np.full(shape, np.nan)
+        confidences = np.full(shape, np.nan)
+        volumes = np.full(shape, np.nan)
+        column = {symbol: j for j, symbol in enumerate(symbols)}
+        
+        for i, batch in enumerate(batches):
+            if not isinstance(batch, dict):
+                continue
+            self._record_ticks(batch.values())
+            for symbol, price_data in batch.items():
+                j = column.get(symbol)
+                if j is None:
+                    continue
+                prices[i, j] = price_data.price
+                confidences[i, j] = price_data.confidence
+                if price_data.volume_24h is not None:
+                    volumes[i, j] = price_data.volume_24h
+        
+        weights = self._source_weights()
+        consensus = compute_consensus(
+            prices, confidences, min_sources, max_deviation, volumes,
+            source_weights=np.array([weights[source.name] for source in active])
+        )
+        
+        # Desvio médio de cada fonte nos símbolos com consenso (uma observação
+        # por ciclo em lote)
+        if consensus.valid.any():
+            with np.errstate(invalid='ignore'):
+                valid_prices = consensus.price[consensus.valid]
+                deviations = np.abs(prices[:, consensus.valid] - valid_prices) / valid_prices * 100
+            observed = ~np.isnan(deviations)
+            counts = observed.sum(axis=1)
+            means = np.where(observed, deviations, 0.0).sum(axis=1) / np.maximum(counts, 1)
+            self._record_deviations({
+                source.name: float(means[i]) for i, source in enumerate(active) if counts[i]
+            })
+        
+        results: Dict[str, Optional[PriceData]] = {}
+        now = datetime.now()
+        for j, symbol in enumerate(symbols):
+            if not consensus.valid[j]:
+                results[symbol] = None
+                continue
+            
+            rows = np.flatnonzero(consensus.kept[:, j])
+            volume = consensus.volume[j]
+            aggregated = PriceData(
+                source="MultiSource-Aggregator",
+                symbol=symbol,
+                price=float(consensus.price[j]),
+                volume_24h=None if np.isnan(volume) else float(volume),
+                timestamp=now,
+                confidence=float(consensus.confidence[j]),
+                metadata={
+                    'sources_used': [active[i].name for i in rows],
+                    'num_sources': int(consensus.num_sources[j]),
+                    'price_std_dev': float(consensus.std_dev[j]),
+                    'price_deviation_pct': float(consensus.deviation_pct[j]),
+                    'individual_prices': {active[i].name: float(prices[i, j]) for i in rows}
+                }
+            )
+            await self._save_to_cache(symbol, aggregated)
+            self._record_ticks((), aggregated)
+            results[symbol] = aggregated
+        
+        logger.debug(
+            "✅ Consenso em lote: %d/%d símbolos (%d fontes)",
+            int(consensus.valid.sum()), len(symbols), len(active)
+        )
+        
+        return results
+    
+    # ------------------------------------------------------------------
+    # Refresh-ahead em background
+    # ------------------------------------------------------------------
+    
+    def _spawn(self, coro, tasks: Optional[set] = None) -> asyncio.Task:
+        """Cria tarefa mantendo referência até terminar (padrão: tarefas de background)"""
+        tasks = self._background_tasks if tasks is None else tasks
+        task = asyncio.ensure_future(coro)
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        return task
+    
+    @staticmethod
+    async def _cancel_tasks(tasks: set):
+        for task in list(tasks):
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def start_refresher(
+        self,
+        symbols: List[str],
+        interval: Optional[float] = None,
+        min_sources: int = 2,
+        max_deviation: float = 5.0
+    ):
+        """
+        Mantém aquecido o conjunto de símbolos rastreados
+        
+        A cada intervalo, símbolos sem cache ou próximos da expiração são
+        atualizados em um único lote, de modo que get_price/get_prices
+        (com stale_while_revalidate) nunca aguardem a rede.
+        
+        Args:
+            symbols: Símbolos a rastrear (acumulados com chamadas anteriores)
+            interval: Período do ciclo em segundos (padrão: metade do refresh_ahead)
+        """
+        self.tracked_symbols.update(symbols)
+        
+        if self._refresher is not None and not self._refresher.done():
+            return
+        
+        period = interval if interval is not None else max(self.refresh_ahead.total_seconds() / 2, 0.1)
+        self._refresher = asyncio.create_task(
+            self._refresh_loop(period, min_sources, max_deviation), name="aggregator-refresher"
+        )
+        logger.info("♻️ Refresher iniciado (%d símbolos, a cada %.1fs)", len(self.tracked_symbols), period)
+    
+    async def stop_refresher(self):
+        """Interrompe o refresher e aguarda atualizações em background"""
+        refresher, self._refresher = self._refresher, None
+        if refresher is not None and not refresher.done():
+            refresher.cancel()
+            try:
+                await refresher
+            except asyncio.CancelledError:
+                pass
+        
+        # Buscas aguardadas por chamadores (get_price) não são canceladas aqui
+        await self._cancel_tasks(self._background_tasks)
+    
+    async def _refresh_loop(self, period: float, min_sources: int, max_deviation: float):
+        while True:
+            due = [
+                symbol for symbol in list(self.tracked_symbols)
+                if await self._needs_refresh(symbol)
+            ]
+            if due:
+                try:
+                    await self._fetch_and_aggregate_many(due, min_sources, max_deviation)
+                except Exception as e:
+                    logger.error("❌ Refresher falhou: %s", e)
+            await asyncio.sleep(period)
+    
+    # ------------------------------------------------------------------
+    # Snapshots (reinício a quente)
+    # ------------------------------------------------------------------
+    
+    def save_snapshot(self, path: Optional[str] = None) -> Optional[int]:
+        """
+        Grava cache, SourceHealth, histogramas de latência e histórico de ticks em disco
+        
+        Returns:
+            Tamanho do snapshot em bytes (None em caso de falha)
+        """
+        return self._write_snapshot(path or self.snapshot_path, self._export_ticks())
+    
+    async def save_snapshot_async(self, path: Optional[str] = None) -> Optional[int]:
+        """
+        save_snapshot sem bloquear o event loop
+        
+        O histórico de ticks é copiado no loop (onde é alterado); a
+        serialização, a escrita e o fsync rodam no executor padrão.
+        """
+        ticks = self._export_ticks()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._write_snapshot, path or self.snapshot_path, ticks)
+    
+    def _export_ticks(self):
+        return self.history.export() if self.history is not None else None
+    
+    def _write_snapshot(self, path: str, ticks) -> Optional[int]:
+        try:
+            size = snapshot.save_snapshot(path, self.cache, self.sources, ticks)
+            logger.debug("💾 Snapshot salvo em %s (%d bytes)", path, size)
+            return size
+        except Exception as e:
+            logger.error("❌ Falha ao salvar snapshot em %s: %s", path, e)
+            return None
+    
+    def load_snapshot(self, path: Optional[str] = None) -> bool:
+        """Restaura o estado salvo por save_snapshot (cache aquecido + saúde das fontes)"""
+        path = path or self.snapshot_path
+        try:
+            restored = snapshot.load_snapshot(path, self.cache, self.sources, self.history)
+        except Exception as e:
+            logger.warning("⚠️ Snapshot ignorado (%s): %s", path, e)
+            return False
+        
+        logger.info(
+            "♨️ Snapshot restaurado: %d preços em cache, %d fontes, %d ticks",
+            restored['cache'], restored['sources'], restored['ticks']
+        )
+        return True
+    
+    def start_snapshots(self, interval: Optional[float] = None):
+        """Grava snapshots periódicos (padrão: SNAPSHOT_INTERVAL_SECONDS)"""
+        if self._snapshotter is not None and not self._snapshotter.done():
+            return
+        period = interval if interval is not None else settings.SNAPSHOT_INTERVAL_SECONDS
+        self._snapshotter = asyncio.create_task(self._snapshot_loop(period))
+    
+    async def stop_snapshots(self):
+        """Interrompe os snapshots periódicos"""
+        snapshotter, self._snapshotter = self._snapshotter, None
+        if snapshotter is not None and not snapshotter.done():
+            snapshotter.cancel()
+            try:
+                await snapshotter
+            except asyncio.CancelledError:
+                pass
+    
+    async def _snapshot_loop(self, period: float):
+        while True:
+            await asyncio.sleep(period)
+            await self.save_snapshot_async()
+    
+    async def _needs_refresh(self, symbol: str) -> bool:
+        """Sem cache ou dentro da janela de refresh-ahead"""
+        entry = await self.cache.alookup(symbol, record=False)
+        return entry is None or entry[1] >= self.cache.ttl_for(symbol) - self.refresh_ahead
+    
+    def _build_consensus(
+        self,
+        symbol: str,
+        valid_results: List[PriceData],
+        min_sources: int,
+        max_deviation: float
+    ) -> Optional[PriceData]:
+        """
+        Valida o consenso entre fontes e calcula o preço agregado
+        
+        Returns:
+            PriceData agregado ou None se não houver consenso confiável
+        """
+        valid_results = list(valid_results)
         
         if len(valid_results) < min_sources:
             logger.error(
-                f"❌ Fontes insuficientes para {symbol}: "
-                f"{len(valid_results)}/{min_sources} necessárias"
+                "❌ Fontes insuficientes para %s: %d/%d necessárias",
+                symbol, len(valid_results), min_sources
             )
             return None
         
@@ -356,19 +1749,19 @@ class MultiSourceAggregator:
         std_dev = statistics.stdev(prices) if len(prices) > 1 else 0
         deviation_pct = (std_dev / avg_price * 100) if avg_price > 0 else 100
         
-        logger.info(f"📊 {symbol}: {len(valid_results)} fontes")
-        for result in valid_results:
-            diff_pct = abs((result.price - avg_price) / avg_price * 100)
-            logger.info(
-                f"   {result.source}: ${result.price:,.2f} "
-                f"(diff: {diff_pct:.2f}%)"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "📊 %s: %d fontes (%s)",
+                symbol, len(valid_results),
+                ", ".join(
+                    f"{r.source}: ${r.price:,.2f}, diff {abs(r.price - avg_price) / avg_price * 100:.2f}%"
+                    for r in valid_results
+                )
             )
         
         # Verificar desvio
         if deviation_pct > max_deviation:
-            logger.warning(
-                f"⚠️ Desvio alto detectado ({deviation_pct:.2f}% > {max_deviation}%)"
-            )
+            logger.warning("⚠️ Desvio alto detectado (%.2f%% > %s%%)", deviation_pct, max_deviation)
             
             # Para conjuntos pequenos (3-5 fontes), removemos quem estiver mais longe da mediana
             if 2 < len(valid_results) <= 5:
@@ -376,7 +1769,7 @@ class MultiSourceAggregator:
                 # Ordenar por proximidade da mediana e manter os N-1 melhores
                 valid_results.sort(key=lambda r: abs(r.price - median_price))
                 removed = valid_results.pop()
-                logger.warning(f"🧹 Outlier removido (furthest from median): {removed.source} (${removed.price:,.2f})")
+                logger.warning("🧹 Outlier removido (furthest from median): %s ($%.2f)", removed.source, removed.price)
                 
                 # Recalcular métricas básicas após remoção para o objeto final
                 prices = [r.price for r in valid_results]
@@ -394,11 +1787,14 @@ class MultiSourceAggregator:
                 logger.error("❌ Muitos outliers, dados não confiáveis")
                 return None
         
-        # Calcular preço consensual (média ponderada por confiança)
-        total_confidence = sum(r.confidence for r in valid_results)
+        # Calcular preço consensual (média ponderada por confiança × peso
+        # dinâmico da fonte)
+        source_weights = self._source_weights()
+        weights = [r.confidence * source_weights.get(r.source, 1.0) for r in valid_results]
+        total_weight = sum(weights)
         weighted_price = sum(
-            r.price * (r.confidence / total_confidence)
-            for r in valid_results
+            r.price * (weight / total_weight)
+            for r, weight in zip(valid_results, weights)
         )
         
         # Agregar volumes
@@ -424,27 +1820,77 @@ class MultiSourceAggregator:
             }
         )
         
-        # Cachear resultado
-        self._save_to_cache(symbol, aggregated)
-        
-        logger.info(
-            f"✅ Consenso para {symbol}: ${weighted_price:,.2f} "
-            f"({len(valid_results)} fontes, confiança: {aggregated.confidence:.1f}%)"
+        logger.debug(
+            "✅ Consenso para %s: $%.2f (%d fontes, confiança: %.1f%%)",
+            symbol, weighted_price, len(valid_results), aggregated.confidence
         )
         
         return aggregated
     
-    def _get_from_cache(self, symbol: str) -> Optional[PriceData]:
+    def _count(self, event: str):
+        """Incrementa um contador agregado (e emite o resumo periódico)"""
+        self.counters[event] += 1
+        now = time.monotonic()
+        if now - self._summary_at >= settings.LOG_SUMMARY_INTERVAL_SECONDS:
+            self._log_summary(now)
+    
+    def _log_summary(self, now: float):
+        """Uma linha INFO com os eventos desde o último resumo"""
+        delta = {
+            event: count - self._summary_counts.get(event, 0)
+            for event, count in self.counters.items()
+            if count != self._summary_counts.get(event, 0)
+        }
+        logger.info(
+            "📈 Agregador (últimos %.0fs): %s",
+            now - self._summary_at,
+            ", ".join(f"{event}={count}" for event, count in sorted(delta.items()))
+        )
+        self._summary_counts = dict(self.counters)
+        self._summary_at = now
+    
+    def _source_weights(self) -> Dict[str, float]:
+        """Peso dinâmico atual de cada fonte (SourceQuality)"""
+        return {source.name: source.quality.weight for source in self.sources}
+    
+    def _record_deviations(self, deviations: Dict[str, float]):
+        """Atualiza o desvio em relação ao consenso de cada fonte"""
+        for source in self.sources:
+            deviation = deviations.get(source.name)
+            if deviation is not None:
+                source.quality.record_deviation(deviation)
+    
+    async def _get_cache_entry(self, symbol: str) -> Optional[Tuple[PriceData, timedelta]]:
+        """Recupera entrada do cache com sua idade, mesmo se expirada"""
+        return await self.cache.alookup(symbol)
+    
+    async def _get_from_cache(self, symbol: str) -> Optional[PriceData]:
         """Recupera preço do cache se ainda válido"""
-        if symbol in self.cache:
-            data, timestamp = self.cache[symbol]
-            if datetime.now() - timestamp < self.cache_ttl:
-                return data
+        entry = await self._get_cache_entry(symbol)
+        if entry and entry[1] < self.cache.ttl_for(symbol):
+            return entry[0]
         return None
     
-    def _save_to_cache(self, symbol: str, data: PriceData):
+    def _annotate_age(self, data: PriceData, age: timedelta) -> PriceData:
+        """Cópia do consenso em cache com a idade explícita no metadata"""
+        return replace(data, metadata={
+            **data.metadata,
+            'cache_age_seconds': age.total_seconds(),
+            'stale': age >= self.cache.ttl_for(data.symbol)
+        })
+    
+    async def _save_to_cache(self, symbol: str, data: PriceData):
         """Salva preço no cache"""
-        self.cache[symbol] = (data, datetime.now())
+        await self.cache.astore(symbol, (data, datetime.now()))
+    
+    def _record_ticks(self, source_ticks: Iterable[PriceData], consensus: Optional[PriceData] = None):
+        """Adiciona ticks das fontes (e o consenso, se houver) ao histórico local"""
+        if self.history is None:
+            return
+        for tick in source_ticks:
+            self.history.record_source(tick)
+        if consensus is not None:
+            self.history.record_consensus(consensus)
     
     def get_health_report(self) -> Dict[str, Any]:
         """Retorna relatório de saúde de todas as fontes"""
@@ -457,6 +1903,12 @@ class MultiSourceAggregator:
                     'status': source.health.status.value,
                     'success_rate': f"{source.health.success_rate:.1f}%",
                     'avg_response_time_ms': f"{source.health.avg_response_time:.0f}",
+                    'latency_percentiles_ms': source.latency.snapshot(),
+                    'request_timeout_s': round(source.request_timeout(), 3),
+                    'consensus_weight': source.quality.snapshot(),
+                    'circuit_breaker': source.breaker.snapshot(),
+                    'quota_headroom': round(source.rate_limiter.headroom(), 3)
+                        if source.rate_limiter else None,
                     'consecutive_failures': source.health.consecutive_failures,
                     'total_requests': source.health.total_requests,
                     'total_failures': source.health.total_failures,
@@ -470,7 +1922,9 @@ class MultiSourceAggregator:
             'healthy_sources': sum(
                 1 for s in self.sources 
                 if s.health.status == DataSourceStatus.HEALTHY
-            )
+            ),
+            'cache': self.cache.stats(),
+            'requests': dict(self.counters)
         }
 
 
@@ -481,29 +1935,29 @@ async def main():
     print("🔷 DECAI ORACLE - MULTI-SOURCE AGGREGATOR TEST")
     print("="*60)
     
-    aggregator = MultiSourceAggregator()
-    
-    # Testar símbolos
-    symbols = ['BTC/USD', 'ETH/USD', 'SOL/USD']
-    
-    for symbol in symbols:
-        print(f"\n{'─'*60}")
-        result = await aggregator.get_price(symbol)
+    async with MultiSourceAggregator() as aggregator:
+        # Testar símbolos
+        symbols = ['BTC/USD', 'ETH/USD', 'SOL/USD']
         
-        if result:
-            print(f"✅ {symbol}: ${result.price:,.2f}")
-            print(f"   Fontes: {result.metadata['sources_used']}")
-            print(f"   Confiança: {result.confidence:.1f}%")
-            print(f"   Desvio: {result.metadata['price_deviation_pct']:.2f}%")
-        else:
-            print(f"❌ {symbol}: Falha ao obter preço")
+        for symbol in symbols:
+            print(f"\n{'─'*60}")
+            result = await aggregator.get_price(symbol)
+            
+            if result:
+                print(f"✅ {symbol}: ${result.price:,.2f}")
+                print(f"   Fontes: {result.metadata['sources_used']}")
+                print(f"   Confiança: {result.confidence:.1f}%")
+                print(f"   Desvio: {result.metadata['price_deviation_pct']:.2f}%")
+            else:
+                print(f"❌ {symbol}: Falha ao obter preço")
+        
+        health = aggregator.get_health_report()
     
     # Relatório de saúde
     print(f"\n{'─'*60}")
     print("📊 HEALTH REPORT")
     print("─"*60)
     
-    health = aggregator.get_health_report()
     for source in health['sources']:
         status_emoji = {
             'healthy': '✅',
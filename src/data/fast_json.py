@@ -0,0 +1,66 @@
+"""
+DecAI Oracle - Fast JSON decoding
+Versão 2.0 - Source response parsing
+
+Decodificação das respostas das fontes direto dos bytes recebidos:
+- orjson quando instalado (fallback para json da stdlib)
+- Extração seletiva em arrays grandes de objetos planos (ex: todos os
+  tickers da Binance): só os objetos pedidos são decodificados
+- Serialização compacta em bytes (servidor de replay)
+
+A busca seletiva localiza o campo-chave com uma regex sobre os bytes e
+decodifica apenas o trecho {...} do objeto correspondente; o restante
+do payload nunca vira objetos Python.
+"""
+
+import json
+import re
+from typing import Any, Collection, Dict, Iterator, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # dependência opcional
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(raw: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decodifica um documento JSON (bytes ou str)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw) if isinstance(raw, memoryview) else raw)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serializa em JSON compacto (bytes)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def iter_objects(
+    raw: bytes,
+    key: str,
+    wanted: Collection[str]
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Objetos de um array JSON cujo campo `key` (string) está em `wanted`
+
+    Pré-condição: objetos planos (sem objetos aninhados) e `key` presente
+    apenas como chave, como em /ticker/24hr da Binance.
+
+    Yields:
+        (valor do campo, objeto decodificado)
+    """
+    pattern = re.compile(rb'"' + re.escape(key.encode()) + rb'"\s*:\s*"([^"]*)"')
+    wanted_bytes = {value.encode() for value in wanted}
+    for match in pattern.finditer(raw):
+        value = match.group(1)
+        if value not in wanted_bytes:
+            continue
+        start = raw.rfind(b'{', 0, match.start())
+        end = raw.find(b'}', match.end())
+        if start < 0 or end < 0:
+            raise ValueError(f"Objeto JSON malformado em torno de {value!r}")
+        yield value.decode(), loads(raw[start:end + 1])
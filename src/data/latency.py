@@ -0,0 +1,107 @@
+"""
+DecAI Oracle - Latency Histogram
+Versão 2.0 - Tail latency tracking
+
+Histograma de latência com memória fixa por fonte:
+- Buckets logarítmicos (1ms → ~70s, crescimento de 25% por bucket)
+- Janela deslizante por rotação (janela atual + anterior)
+- Percentis aproximados (erro máximo de um bucket, ~25%)
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+def _log_bounds(start: float = 1.0, growth: float = 1.25, limit: float = 70000.0) -> List[float]:
+    bounds = [start]
+    while bounds[-1] < limit:
+        bounds.append(bounds[-1] * growth)
+    return bounds
+
+
+class LatencyHistogram:
+    """
+    Histograma de latências (ms) com percentis em janela deslizante
+
+    A memória é constante: dois vetores de contagem com len(BOUNDS) + 1
+    posições. Quando a janela atual atinge window_size amostras, ela passa a
+    ser a anterior e uma nova janela começa; percentis usam as duas.
+    """
+
+    BOUNDS: List[float] = _log_bounds()
+
+    def __init__(self, window_size: int = 512):
+        self.window_size = window_size
+        self._current = [0] * (len(self.BOUNDS) + 1)
+        self._previous = [0] * (len(self.BOUNDS) + 1)
+        self._current_count = 0
+        self._previous_count = 0
+        self.total_samples = 0
+
+    def record(self, latency_ms: float):
+        """Registra uma amostra de latência em ms"""
+        if self._current_count >= self.window_size:
+            self._previous, self._current = self._current, self._previous
+            for i in range(len(self._current)):
+                self._current[i] = 0
+            self._previous_count, self._current_count = self._current_count, 0
+
+        self._current[bisect_left(self.BOUNDS, latency_ms)] += 1
+        self._current_count += 1
+        self.total_samples += 1
+
+    @property
+    def count(self) -> int:
+        """Amostras na janela deslizante"""
+        return self._current_count + self._previous_count
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Percentil aproximado (limite superior do bucket), em ms
+
+        Args:
+            q: Percentil entre 0 e 100
+
+        Returns:
+            Latência em ms, ou None sem amostras
+        """
+        total = self.count
+        if total == 0:
+            return None
+
+        rank = max(1, int(round(q / 100 * total)))
+        seen = 0
+        for i, (cur, prev) in enumerate(zip(self._current, self._previous)):
+            seen += cur + prev
+            if seen >= rank:
+                return self.BOUNDS[i] if i < len(self.BOUNDS) else self.BOUNDS[-1]
+        return self.BOUNDS[-1]
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        """Percentis usuais para relatórios"""
+        return {
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+    def export_counts(self) -> Tuple[List[int], List[int], int, int]:
+        """Estado da janela (para snapshots): buckets atual/anterior e contagens"""
+        return list(self._current), list(self._previous), self._current_count, self._previous_count
+
+    def restore_counts(
+        self,
+        current: Sequence[int],
+        previous: Sequence[int],
+        current_count: int,
+        previous_count: int,
+        total_samples: int
+    ):
+        """Restaura o estado exportado por export_counts (mesmos BOUNDS)"""
+        if len(current) != len(self._current) or len(previous) != len(self._previous):
+            raise ValueError("Número de buckets incompatível com BOUNDS")
+        self._current = [int(c) for c in current]
+        self._previous = [int(c) for c in previous]
+        self._current_count = int(current_count)
+        self._previous_count = int(previous_count)
+        self.total_samples = int(total_samples)
@@ -0,0 +1,111 @@
+"""
+DecAI Oracle - Multicall3 ABI helpers
+Versão 2.0 - On-chain price feeds
+
+Codificação mínima (sem dependências) das chamadas usadas pela
+ChainlinkSource:
+- Multicall3.aggregate3((address,bool,bytes)[]) → (bool,bytes)[]
+- getBlockNumber / getCurrentBlockTimestamp (na própria Multicall3)
+- AggregatorV3Interface.latestRoundData / decimals
+
+Multicall3 está implantada no mesmo endereço em praticamente todas as
+redes EVM (mainnet, Sepolia, L2s).
+"""
+
+from typing import List, NamedTuple, Tuple
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Seletores (4 primeiros bytes do keccak256 da assinatura)
+AGGREGATE3 = bytes.fromhex("82ad56cb")                  # aggregate3((address,bool,bytes)[])
+GET_BLOCK_NUMBER = bytes.fromhex("42cbb15c")            # getBlockNumber()
+GET_CURRENT_BLOCK_TIMESTAMP = bytes.fromhex("0f28c97d") # getCurrentBlockTimestamp()
+LATEST_ROUND_DATA = bytes.fromhex("feaf968c")           # latestRoundData()
+DECIMALS = bytes.fromhex("313ce567")                    # decimals()
+
+
+class Call(NamedTuple):
+    """Chamada individual dentro do aggregate3"""
+    target: str
+    call_data: bytes
+    allow_failure: bool = True
+
+
+class RoundData(NamedTuple):
+    """Retorno de latestRoundData"""
+    round_id: int
+    answer: int
+    started_at: int
+    updated_at: int
+    answered_in_round: int
+
+
+def _word(value: int) -> bytes:
+    return value.to_bytes(32, 'big')
+
+
+def _address(address: str) -> bytes:
+    raw = bytes.fromhex(address[2:] if address.startswith('0x') else address)
+    if len(raw) != 20:
+        raise ValueError(f"Endereço inválido: {address}")
+    return bytes(12) + raw
+
+
+def _pad(data: bytes) -> bytes:
+    return data + bytes(-len(data) % 32)
+
+
+def _read_word(data: bytes, offset: int) -> int:
+    if offset + 32 > len(data):
+        raise ValueError("Retorno ABI truncado")
+    return int.from_bytes(data[offset:offset + 32], 'big')
+
+
+def encode_aggregate3(calls: List[Call]) -> str:
+    """Calldata hex (0x...) de aggregate3 para as chamadas"""
+    bodies = [
+        _address(call.target)
+        + _word(int(call.allow_failure))
+        + _word(0x60)
+        + _word(len(call.call_data))
+        + _pad(call.call_data)
+        for call in calls
+    ]
+
+    offsets = []
+    offset = 32 * len(calls)
+    for body in bodies:
+        offsets.append(_word(offset))
+        offset += len(body)
+
+    encoded = AGGREGATE3 + _word(0x20) + _word(len(calls)) + b''.join(offsets) + b''.join(bodies)
+    return '0x' + encoded.hex()
+
+
+def decode_aggregate3(result: str) -> List[Tuple[bool, bytes]]:
+    """Decodifica o retorno de aggregate3 em [(sucesso, returnData)]"""
+    raw = bytes.fromhex(result[2:] if result.startswith('0x') else result)
+    array = _read_word(raw, 0)
+    count = _read_word(raw, array)
+    start = array + 32
+
+    decoded = []
+    for i in range(count):
+        item = start + _read_word(raw, start + 32 * i)
+        success = _read_word(raw, item) != 0
+        data_at = item + _read_word(raw, item + 32)
+        length = _read_word(raw, data_at)
+        decoded.append((success, raw[data_at + 32:data_at + 32 + length]))
+    return decoded
+
+
+def decode_uint(data: bytes) -> int:
+    """Primeira palavra do retorno como uint256"""
+    return _read_word(data, 0)
+
+
+def decode_round_data(data: bytes) -> RoundData:
+    """Decodifica (uint80, int256, uint256, uint256, uint80)"""
+    words = [_read_word(data, 32 * i) for i in range(5)]
+    answer = words[1] - (1 << 256) if words[1] >= 1 << 255 else words[1]
+    return RoundData(words[0], answer, words[2], words[3], words[4])
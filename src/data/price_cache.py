@@ -0,0 +1,319 @@
+"""
+DecAI Oracle - Price Cache
+Versão 2.0 - Bounded cache layer
+
+Cache de consenso do agregador:
+- Capacidade limitada com despejo LRU
+- TTL por classe de símbolo (ex: majors 5s, long-tail 60s)
+- Limite rígido de idade (entradas além de max_age são descartadas)
+- Contadores de hit/miss/stale/despejo
+- Interface plugável: memória local (LRUPriceCache) ou Redis (RedisPriceCache)
+
+As entradas seguem o formato histórico do agregador: (PriceData, salvo_em).
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# (PriceData, salvo_em) — PriceData vive em data_aggregator, que importa este módulo
+CacheEntry = Tuple[Any, datetime]
+
+
+class PriceCacheBase:
+    """
+    Interface do cache de preços
+
+    Subclasses implementam _load/_store/_delete/_keys; a base cuida da
+    política de TTL por símbolo e dos contadores.
+
+    Args:
+        default_ttl: TTL para símbolos sem classe específica
+        class_ttls: TTL por símbolo (ex: {'BTC/USD': 5s})
+        max_age: Idade máxima absoluta de uma entrada (stale incluído)
+    """
+
+    def __init__(
+        self,
+        default_ttl: timedelta,
+        class_ttls: Optional[Dict[str, timedelta]] = None,
+        max_age: Optional[timedelta] = None
+    ):
+        self.default_ttl = default_ttl
+        self.class_ttls = dict(class_ttls or {})
+        self.max_age = max_age
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def ttl_for(self, symbol: str) -> timedelta:
+        """TTL da classe do símbolo"""
+        return self.class_ttls.get(symbol, self.default_ttl)
+
+    def lookup(self, symbol: str, record: bool = True) -> Optional[Tuple[Any, timedelta]]:
+        """
+        Retorna (consenso, idade) mesmo se além do TTL (para stale-while-revalidate)
+
+        Entradas mais velhas que max_age são removidas e contam como miss.
+
+        Args:
+            symbol: Par de negociação
+            record: Contabiliza hit/miss (False para consultas internas)
+        """
+        result, expired = self._evaluate(symbol, self._load(symbol), record)
+        if expired:
+            self._delete(symbol)
+        return result
+
+    async def alookup(self, symbol: str, record: bool = True) -> Optional[Tuple[Any, timedelta]]:
+        """lookup para o event loop (I/O do backend fora da thread do loop)"""
+        result, expired = self._evaluate(symbol, await self._run(self._load, symbol), record)
+        if expired:
+            await self._run(self._delete, symbol)
+        return result
+
+    async def astore(self, symbol: str, entry: CacheEntry):
+        """Equivalente assíncrono de cache[symbol] = entry"""
+        await self._run(self._store, symbol, entry)
+
+    def _evaluate(
+        self,
+        symbol: str,
+        entry: Optional[CacheEntry],
+        record: bool
+    ) -> Tuple[Optional[Tuple[Any, timedelta]], bool]:
+        """(consenso, idade) da entrada carregada e se ela passou de max_age"""
+        expired = False
+        if entry is not None:
+            data, saved_at = entry
+            age = datetime.now() - saved_at
+            if self.max_age is not None and age >= self.max_age:
+                self.expirations += 1
+                expired = True
+                entry = None
+
+        if entry is None:
+            if record:
+                self.misses += 1
+            return None, expired
+
+        if record:
+            if age < self.ttl_for(symbol):
+                self.hits += 1
+            else:
+                self.stale_hits += 1
+        return (data, age), False
+
+    async def _run(self, func, *args):
+        """Executa uma operação do backend (em memória: direto no loop)"""
+        return func(*args)
+
+    def stats(self) -> Dict[str, Any]:
+        """Contadores para métricas/relatórios"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'backend': type(self).__name__,
+            'entries': len(self),
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'hit_rate': (self.hits / lookups) if lookups else 0.0,
+        }
+
+    # Protocolo de mapeamento (compatível com o antigo dict do agregador)
+
+    def __getitem__(self, symbol: str) -> CacheEntry:
+        entry = self._load(symbol)
+        if entry is None:
+            raise KeyError(symbol)
+        return entry
+
+    def __setitem__(self, symbol: str, entry: CacheEntry):
+        self._store(symbol, entry)
+
+    def __delitem__(self, symbol: str):
+        self._delete(symbol)
+
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and self._load(symbol) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys()))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._keys())
+
+    def clear(self):
+        for symbol in list(self._keys()):
+            self._delete(symbol)
+
+    def entries(self) -> List[Tuple[str, CacheEntry]]:
+        """Todas as entradas (símbolo, (consenso, salvo_em)) sem alterar contadores"""
+        result = []
+        for symbol in list(self._keys()):
+            entry = self._load(symbol)
+            if entry is not None:
+                result.append((symbol, entry))
+        return result
+
+    # Implementar em subclasses
+
+    def _load(self, symbol: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def _store(self, symbol: str, entry: CacheEntry):
+        raise NotImplementedError
+
+    def _delete(self, symbol: str):
+        raise NotImplementedError
+
+    def _keys(self) -> Iterable[str]:
+        raise NotImplementedError
+
+
+class LRUPriceCache(PriceCacheBase):
+    """Cache em memória limitado a max_entries, com despejo LRU"""
+
+    def __init__(self, max_entries: int = 10000, **kwargs):
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def _load(self, symbol: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(symbol)
+        if entry is not None:
+            self._entries.move_to_end(symbol)
+        return entry
+
+    def _store(self, symbol: str, entry: CacheEntry):
+        self._entries[symbol] = entry
+        self._entries.move_to_end(symbol)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _delete(self, symbol: str):
+        self._entries.pop(symbol, None)
+
+    def _keys(self) -> Iterable[str]:
+        return self._entries.keys()
+
+    def entries(self) -> List[Tuple[str, CacheEntry]]:
+        # Sem _load: a ordem LRU não é alterada
+        return list(self._entries.items())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisPriceCache(PriceCacheBase):
+    """
+    Cache compartilhado em Redis (várias réplicas/workers)
+
+    Cada entrada é um JSON com expiração nativa em max_age (ou no TTL da
+    classe); o despejo por memória fica a cargo da maxmemory-policy do Redis.
+
+    O cliente redis-py é síncrono: alookup/astore rodam as chamadas no
+    executor padrão para não bloquear o event loop. len() conta as entradas
+    gravadas por este processo que ainda não expiraram (sem SCAN).
+    """
+
+    def __init__(self, client=None, prefix: str = "decai:price:", **kwargs):
+        super().__init__(**kwargs)
+        if client is None:
+            from redis import Redis
+            client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self.client = client
+        self.prefix = prefix
+        self._expires_at: Dict[str, float] = {}  # símbolo → prazo (monotonic)
+
+    def _key(self, symbol: str) -> str:
+        return f"{self.prefix}{symbol}"
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def _load(self, symbol: str) -> Optional[CacheEntry]:
+        from src.data.data_aggregator import PriceData
+
+        raw = self.client.get(self._key(symbol))
+        if raw is None:
+            self._expires_at.pop(symbol, None)
+            return None
+        payload = json.loads(raw)
+        data = payload['data']
+        data['timestamp'] = datetime.fromisoformat(data['timestamp'])
+        return PriceData(**data), datetime.fromisoformat(payload['saved_at'])
+
+    def _store(self, symbol: str, entry: CacheEntry):
+        data, saved_at = entry
+        serialized = asdict(data)
+        serialized['timestamp'] = data.timestamp.isoformat()
+        expire = max(1, int((self.max_age or self.ttl_for(symbol)).total_seconds()))
+        self.client.set(
+            self._key(symbol),
+            json.dumps({'data': serialized, 'saved_at': saved_at.isoformat()}, default=str),
+            ex=expire
+        )
+        self._expires_at[symbol] = time.monotonic() + expire
+
+    def _delete(self, symbol: str):
+        self.client.delete(self._key(symbol))
+        self._expires_at.pop(symbol, None)
+
+    def _keys(self) -> Iterable[str]:
+        for key in self.client.scan_iter(match=f"{self.prefix}*"):
+            yield key[len(self.prefix):]
+
+    def __len__(self) -> int:
+        now = time.monotonic()
+        for symbol, deadline in list(self._expires_at.items()):
+            if deadline <= now:
+                self._expires_at.pop(symbol, None)
+        return len(self._expires_at)
+
+
+def _parse_symbol_list(raw: str) -> Iterable[str]:
+    return [s.strip() for s in raw.split(',') if s.strip()]
+
+
+def create_price_cache(
+    default_ttl: Optional[timedelta] = None,
+    max_age: Optional[timedelta] = None
+) -> PriceCacheBase:
+    """
+    Cria o cache configurado em Settings (CACHE_BACKEND = memory | redis)
+
+    Símbolos em CACHE_MAJOR_SYMBOLS usam CACHE_MAJOR_TTL_SECONDS; os demais
+    usam CACHE_TTL_SECONDS.
+    """
+    default_ttl = default_ttl or timedelta(seconds=settings.CACHE_TTL_SECONDS)
+    major_ttl = timedelta(seconds=settings.CACHE_MAJOR_TTL_SECONDS)
+    class_ttls = {symbol: major_ttl for symbol in _parse_symbol_list(settings.CACHE_MAJOR_SYMBOLS)}
+
+    options = dict(default_ttl=default_ttl, class_ttls=class_ttls, max_age=max_age)
+
+    if settings.CACHE_BACKEND == "redis":
+        try:
+            cache = RedisPriceCache(**options)
+            cache.client.ping()
+            return cache
+        except Exception as e:
+            logger.warning("⚠️ Redis indisponível para cache de preços, usando memória: %s", e)
+
+    return LRUPriceCache(max_entries=settings.CACHE_MAX_ENTRIES, **options)
@@ -0,0 +1,121 @@
+"""
+DecAI Oracle - Source Rate Limiter
+Versão 2.0 - Quota-aware data layer
+
+Token bucket assíncrono por fonte:
+- Orçamento por peso de requisição (ex: pesos da Binance)
+- Fila (espera curta) ou descarte local antes de enviar
+- Adaptação a Retry-After e cabeçalhos de peso/quota das APIs
+"""
+
+import asyncio
+import time
+from typing import Callable, Mapping, Optional
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket com reserva (FIFO sem lock)
+
+    Cada acquire reserva seu peso imediatamente (o saldo pode ficar
+    negativo) e dorme o tempo necessário para o reabastecimento cobrir a
+    reserva. Chamadas cuja espera excederia max_wait são descartadas.
+
+    Args:
+        limit_per_minute: Peso total permitido por minuto (também é a capacidade)
+        default_retry_after: Pausa (s) após 429 sem cabeçalho Retry-After
+        clock: Relógio monotônico (injetável em testes)
+    """
+
+    def __init__(
+        self,
+        limit_per_minute: float,
+        default_retry_after: float = 10.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.capacity = float(limit_per_minute)
+        self.rate = self.capacity / 60.0
+        self.default_retry_after = default_retry_after
+        self._clock = clock
+
+        self.tokens = self.capacity
+        self.paused_until = 0.0
+        self._updated = clock()
+
+        self.acquired = 0
+        self.shed = 0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, weight: float = 1.0) -> float:
+        """Espera (s) necessária para enviar uma requisição com esse peso"""
+        self._refill()
+        deficit = weight - self.tokens
+        wait = deficit / self.rate if deficit > 0 else 0.0
+        return max(wait, self.paused_until - self._clock())
+
+    async def acquire(self, weight: float = 1.0, max_wait: Optional[float] = None) -> bool:
+        """
+        Reserva orçamento para uma requisição
+
+        Returns:
+            True se a requisição pode ser enviada; False se foi descartada
+            (espera estimada acima de max_wait)
+        """
+        wait = self.wait_time(weight)
+        if max_wait is not None and wait > max_wait:
+            self.shed += 1
+            return False
+
+        self.tokens -= weight
+        self.acquired += 1
+        if wait > 0:
+            self.waited_seconds += wait
+            await asyncio.sleep(wait)
+        return True
+
+    def observe_headers(self, headers: Mapping[str, str], status: int = 200):
+        """
+        Ajusta o orçamento local com base na resposta da API
+
+        - 429/418: pausa pelo Retry-After (ou default_retry_after)
+        - X-MBX-USED-WEIGHT-1M (Binance): peso já consumido no minuto
+        - X-RateLimit-Remaining: requisições restantes na janela
+        """
+        self._refill()
+
+        used = headers.get('X-MBX-USED-WEIGHT-1M')
+        if used is not None:
+            try:
+                self.tokens = min(self.tokens, self.capacity - float(used))
+            except ValueError:
+                pass
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None:
+            try:
+                self.tokens = min(self.tokens, float(remaining))
+            except ValueError:
+                pass
+
+        if status in (429, 418):
+            self.throttled += 1
+            retry_after = self.default_retry_after
+            try:
+                retry_after = float(headers.get('Retry-After', retry_after))
+            except ValueError:
+                pass
+            self.paused_until = max(self.paused_until, self._clock() + retry_after)
+            self.tokens = min(self.tokens, 0.0)
+
+    def headroom(self) -> float:
+        """Fração do orçamento disponível agora (0-1)"""
+        self._refill()
+        if self._clock() < self.paused_until:
+            return 0.0
+        return max(0.0, self.tokens) / self.capacity
@@ -0,0 +1,462 @@
+"""
+DecAI Oracle - Offline Replay Exchange
+Versão 2.0 - Reproducible benchmarks
+
+Servidor HTTP local que imita os endpoints usados pelas fontes REST
+(Binance, CoinGecko, CoinCap), respondendo a partir de respostas gravadas
+ou de um mercado sintético:
+- Latência por exchange (log-normal: mediana + dispersão)
+- Taxa de erros (HTTP 500) e de rate limit (HTTP 429 + Retry-After)
+- Outliers: preços multiplicados por um fator em uma fração das respostas
+
+Todas as exchanges ficam no mesmo servidor, sob /binance, /coingecko e
+/coincap; replay_sources() cria as fontes do agregador apontando para ele.
+
+Uso standalone:
+    python -m src.data.replay --port 8765 --latency-ms 40 --error-rate 0.02
+    python -m src.data.replay --record fixtures/   # grava respostas reais
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+from src.data import fast_json
+from src.data.symbols import SymbolRegistry
+
+EXCHANGES = ("binance", "coingecko", "coincap")
+
+# Arquivos gravados (--record) e endpoints de origem
+RECORDINGS = {
+    'binance': ('binance_ticker_24hr.json', "https://api.binance.com/api/v3/ticker/24hr"),
+    'coingecko': (
+        'coingecko_coins_markets.json',
+        "https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&order=market_cap_desc&per_page=250&page=1"
+    ),
+    'coincap': ('coincap_assets.json', "https://api.coincap.io/v2/assets?limit=2000"),
+}
+
+# Moedas de cotação reconhecidas ao derivar exchangeInfo dos tickers gravados
+QUOTE_ASSETS = ("USDT", "FDUSD", "USDC", "BUSD", "TUSD", "BTC", "ETH", "BNB", "EUR", "TRY", "BRL")
+
+MAJORS = {
+    # base: (id CoinGecko, id CoinCap, preço)
+    'BTC': ('bitcoin', 'bitcoin', 50000.0),
+    'ETH': ('ethereum', 'ethereum', 3000.0),
+    'BNB': ('binancecoin', 'binance-coin', 550.0),
+    'SOL': ('solana', 'solana', 120.0),
+    'ADA': ('cardano', 'cardano', 0.45),
+}
+
+
+@dataclass
+class ReplayProfile:
+    """Comportamento de uma exchange no replay"""
+    latency_ms: float = 20.0       # mediana
+    latency_sigma: float = 0.5     # dispersão log-normal (0 = latência fixa)
+    error_rate: float = 0.0        # fração de respostas HTTP 500
+    throttle_rate: float = 0.0     # fração de respostas HTTP 429
+    outlier_rate: float = 0.0      # fração de preços distorcidos
+    outlier_factor: float = 1.2    # multiplicador aplicado aos outliers
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """Latência (s) de uma resposta"""
+        if self.latency_ms <= 0:
+            return 0.0
+        if self.latency_sigma <= 0:
+            return self.latency_ms / 1000
+        return rng.lognormvariate(math.log(self.latency_ms), self.latency_sigma) / 1000
+
+
+def synthetic_market(num_assets: int = 500, spread: float = 0.0005, seed: int = 7) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Mercado sintético com o formato das respostas reais
+
+    Os majors (BTC, ETH, ...) usam os ids dos SYMBOL_MAPs; os demais ativos
+    são A0001, A0002, ... Cada exchange vê o mesmo preço com ruído
+    relativo de `spread` (desvio padrão).
+    """
+    rng = random.Random(seed)
+    assets = [(base, ids[0], ids[1], ids[2]) for base, ids in MAJORS.items()]
+    for i in range(max(0, num_assets - len(assets))):
+        base = f"A{i + 1:04d}"
+        assets.append((base, f"asset-{i + 1}", f"asset-{i + 1}", 10 ** rng.uniform(-3, 4)))
+
+    def quote(price: float) -> float:
+        return price * (1 + rng.gauss(0, spread))
+
+    binance, coingecko, coincap = [], [], []
+    for rank, (base, gecko_id, cap_id, price) in enumerate(assets, start=1):
+        volume = 10 ** rng.uniform(4, 9)
+        change = rng.uniform(-8, 8)
+        last = quote(price)
+        binance.append({
+            'symbol': f"{base}USDT", 'priceChange': f"{last * change / 100:.8f}",
+            'priceChangePercent': f"{change:.3f}", 'weightedAvgPrice': f"{last:.8f}",
+            'prevClosePrice': f"{last:.8f}", 'lastPrice': f"{last:.8f}", 'lastQty': "1.00000000",
+            'bidPrice': f"{last * 0.9999:.8f}", 'bidQty': "1.00000000",
+            'askPrice': f"{last * 1.0001:.8f}", 'askQty': "1.00000000",
+            'openPrice': f"{last:.8f}", 'highPrice': f"{last * 1.02:.8f}", 'lowPrice': f"{last * 0.98:.8f}",
+            'volume': f"{volume / price:.8f}", 'quoteVolume': f"{volume:.8f}",
+            'openTime': 0, 'closeTime': 0, 'firstId': 0, 'lastId': 0, 'count': rank,
+        })
+        coingecko.append({
+            'id': gecko_id, 'symbol': base.lower(), 'name': base,
+            'current_price': quote(price), 'market_cap': volume * 10, 'market_cap_rank': rank,
+            'total_volume': volume, 'price_change_percentage_24h': change,
+        })
+        coincap.append({
+            'id': cap_id, 'rank': str(rank), 'symbol': base, 'name': base,
+            'supply': "1000000", 'maxSupply': None,
+            'marketCapUsd': f"{volume * 10:.4f}", 'volumeUsd24Hr': f"{volume:.4f}",
+            'priceUsd': f"{quote(price):.10f}", 'changePercent24Hr': f"{change:.4f}",
+            'vwap24Hr': None, 'explorer': None,
+        })
+    return {'binance': binance, 'coingecko': coingecko, 'coincap': coincap}
+
+
+def load_recordings(directory: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Respostas gravadas por --record (exchanges sem arquivo ficam vazias)"""
+    market: Dict[str, List[Dict[str, Any]]] = {exchange: [] for exchange in EXCHANGES}
+    for exchange, (filename, _) in RECORDINGS.items():
+        path = os.path.join(directory, filename)
+        if not os.path.exists(path):
+            continue
+        with open(path, 'rb') as f:
+            payload = fast_json.loads(f.read())
+        market[exchange] = payload['data'] if exchange == 'coincap' else payload
+    return market
+
+
+async def record_fixtures(directory: str):
+    """Grava as respostas reais usadas pelo replay em `directory`"""
+    import aiohttp
+
+    os.makedirs(directory, exist_ok=True)
+    async with aiohttp.ClientSession() as session:
+        for filename, url in RECORDINGS.values():
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                raw = await response.read()
+            with open(os.path.join(directory, filename), 'wb') as f:
+                f.write(raw)
+            print(f"💾 {filename}: {len(raw) / 1024:.0f} KB")
+
+
+def _split_pair(symbol: str):
+    """BTCUSDT → (BTC, USDT), a partir das moedas de cotação conhecidas"""
+    for quote in QUOTE_ASSETS:
+        if symbol.endswith(quote) and len(symbol) > len(quote):
+            return symbol[:-len(quote)], quote
+    return None
+
+
+class ReplayExchangeServer:
+    """
+    Servidor de replay (aiohttp) para Binance, CoinGecko e CoinCap
+
+    Args:
+        market: Respostas por exchange (synthetic_market ou load_recordings)
+        profiles: ReplayProfile por exchange (padrão: ReplayProfile())
+        host / port: Endereço de escuta (port 0 = porta livre)
+        seed: Semente das latências, erros e outliers
+    """
+
+    def __init__(
+        self,
+        market: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+        profiles: Optional[Dict[str, ReplayProfile]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 42
+    ):
+        market = market if market is not None else synthetic_market()
+        self.profiles = {exchange: ReplayProfile() for exchange in EXCHANGES}
+        self.profiles.update(profiles or {})
+        self.host = host
+        self.port = port
+        self.rng = random.Random(seed)
+        self.requests: Dict[str, int] = defaultdict(int)
+
+        self.tickers = {t['symbol']: t for t in market.get('binance', [])}
+        self.coins = list(market.get('coingecko', []))
+        self.coins_by_id = {c['id']: c for c in self.coins}
+        self.assets = list(market.get('coincap', []))
+        self.assets_by_id = {a['id']: a for a in self.assets}
+
+        self.app = web.Application()
+        self.app.router.add_get('/binance/api/v3/ticker/24hr', self._binance_ticker)
+        self.app.router.add_get('/binance/api/v3/exchangeInfo', self._binance_exchange_info)
+        self.app.router.add_get('/coingecko/api/v3/simple/price', self._coingecko_simple_price)
+        self.app.router.add_get('/coingecko/api/v3/coins/markets', self._coingecko_markets)
+        self.app.router.add_get('/coincap/v2/assets', self._coincap_assets)
+        self.app.router.add_get('/coincap/v2/assets/{asset_id}', self._coincap_asset)
+        self._runner: Optional[web.AppRunner] = None
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    async def start(self) -> "ReplayExchangeServer":
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+        return self
+
+    async def close(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "ReplayExchangeServer":
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def base_url(self, exchange: str) -> str:
+        """BASE_URL da fonte correspondente"""
+        return {
+            'binance': f"{self.url}/binance/api/v3",
+            'coingecko': f"{self.url}/coingecko/api/v3",
+            'coincap': f"{self.url}/coincap/v2",
+        }[exchange]
+
+    # ------------------------------------------------------------------
+    # Comportamento comum (latência, erros, outliers)
+    # ------------------------------------------------------------------
+
+    async def _prelude(self, exchange: str) -> Optional[web.Response]:
+        """Aplica latência e sorteia erro/rate limit; None = resposta normal"""
+        self.requests[exchange] += 1
+        profile = self.profiles[exchange]
+        delay = profile.sample_latency(self.rng)
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self.rng.random()
+        if roll < profile.error_rate:
+            self.requests[f"{exchange}_errors"] += 1
+            return web.Response(status=500, text="replay: injected error")
+        if roll < profile.error_rate + profile.throttle_rate:
+            self.requests[f"{exchange}_throttled"] += 1
+            return web.Response(status=429, headers={'Retry-After': '1'}, text="replay: injected 429")
+        return None
+
+    def _price(self, exchange: str, value):
+        """Preço (mesmo tipo do original) com chance de outlier"""
+        profile = self.profiles[exchange]
+        if profile.outlier_rate and self.rng.random() < profile.outlier_rate:
+            self.requests[f"{exchange}_outliers"] += 1
+            distorted = float(value) * profile.outlier_factor
+            return f"{distorted:.10f}" if isinstance(value, str) else distorted
+        return value
+
+    @staticmethod
+    def _json(payload: Any, status: int = 200) -> web.Response:
+        return web.Response(body=fast_json.dumps(payload), status=status, content_type='application/json')
+
+    # ------------------------------------------------------------------
+    # Binance
+    # ------------------------------------------------------------------
+
+    def _ticker(self, ticker: Dict[str, Any]) -> Dict[str, Any]:
+        return {**ticker, 'lastPrice': self._price('binance', ticker['lastPrice'])}
+
+    async def _binance_ticker(self, request: web.Request) -> web.Response:
+        failure = await self._prelude('binance')
+        if failure is not None:
+            return failure
+
+        if 'symbol' in request.query:
+            ticker = self.tickers.get(request.query['symbol'])
+            if ticker is None:
+                return self._json({'code': -1121, 'msg': 'Invalid symbol.'}, status=400)
+            return self._json(self._ticker(ticker))
+
+        if 'symbols' in request.query:
+            wanted = fast_json.loads(request.query['symbols'])
+            if any(symbol not in self.tickers for symbol in wanted):
+                # Comportamento real: um símbolo inválido rejeita o lote inteiro
+                return self._json({'code': -1121, 'msg': 'Invalid symbol.'}, status=400)
+            return self._json([self._ticker(self.tickers[symbol]) for symbol in wanted])
+
+        return self._json([self._ticker(ticker) for ticker in self.tickers.values()])
+
+    async def _binance_exchange_info(self, request: web.Request) -> web.Response:
+        failure = await self._prelude('binance')
+        if failure is not None:
+            return failure
+
+        symbols = []
+        for symbol in self.tickers:
+            pair = _split_pair(symbol)
+            if pair is not None:
+                symbols.append({'symbol': symbol, 'status': 'TRADING', 'baseAsset': pair[0], 'quoteAsset': pair[1]})
+        return self._json({'timezone': 'UTC', 'symbols': symbols})
+
+    # ------------------------------------------------------------------
+    # CoinGecko
+    # ------------------------------------------------------------------
+
+    async def _coingecko_simple_price(self, request: web.Request) -> web.Response:
+        failure = await self._prelude('coingecko')
+        if failure is not None:
+            return failure
+
+        result = {}
+        for coin_id in request.query.get('ids', '').split(','):
+            coin = self.coins_by_id.get(coin_id)
+            if coin is None or coin.get('current_price') is None:
+                continue
+            entry = {'usd': self._price('coingecko', coin['current_price'])}
+            if request.query.get('include_24hr_vol') == 'true':
+                entry['usd_24h_vol'] = coin.get('total_volume')
+            if request.query.get('include_24hr_change') == 'true':
+                entry['usd_24h_change'] = coin.get('price_change_percentage_24h')
+            result[coin_id] = entry
+        return self._json(result)
+
+    async def _coingecko_markets(self, request: web.Request) -> web.Response:
+        failure = await self._prelude('coingecko')
+        if failure is not None:
+            return failure
+
+        per_page = int(request.query.get('per_page', 100))
+        page = int(request.query.get('page', 1))
+        return self._json(self.coins[(page - 1) * per_page:page * per_page])
+
+    # ------------------------------------------------------------------
+    # CoinCap
+    # ------------------------------------------------------------------
+
+    def _asset(self, asset: Dict[str, Any]) -> Dict[str, Any]:
+        return {**asset, 'priceUsd': self._price('coincap', asset['priceUsd'])}
+
+    async def _coincap_assets(self, request: web.Request) -> web.Response:
+        failure = await self._prelude('coincap')
+        if failure is not None:
+            return failure
+
+        if 'ids' in request.query:
+            ids = request.query['ids'].split(',')
+            data = [self._asset(self.assets_by_id[i]) for i in ids if i in self.assets_by_id]
+        else:
+            data = [self._asset(asset) for asset in self.assets[:int(request.query.get('limit', 100))]]
+        return self._json({'data': data, 'timestamp': int(time.time() * 1000)})
+
+    async def _coincap_asset(self, request: web.Request) -> web.Response:
+        failure = await self._prelude('coincap')
+        if failure is not None:
+            return failure
+
+        asset = self.assets_by_id.get(request.match_info['asset_id'])
+        if asset is None:
+            return self._json({'error': f"{request.match_info['asset_id']} not found"}, status=404)
+        return self._json({'data': self._asset(asset), 'timestamp': int(time.time() * 1000)})
+
+
+def replay_sources(
+    base_url: str,
+    registry: Optional[SymbolRegistry] = None,
+    rate_limits: bool = False
+) -> List:
+    """
+    Fontes REST do agregador apontando para um servidor de replay
+
+    Args:
+        base_url: URL raiz do servidor (ReplayExchangeServer.url)
+        registry: Registro de símbolos próprio (padrão: um novo, isolado do
+            registro do processo)
+        rate_limits: Manter os limiters locais (desligados por padrão para
+            medir o agregador, não a quota)
+    """
+    from src.data.data_aggregator import BinanceSource, CoinCapSource, CoinGeckoSource
+
+    registry = registry if registry is not None else SymbolRegistry()
+    paths = {
+        BinanceSource: "/binance/api/v3",
+        CoinGeckoSource: "/coingecko/api/v3",
+        CoinCapSource: "/coincap/v2",
+    }
+    sources = []
+    for source_class, path in paths.items():
+        source = source_class()
+        source.BASE_URL = f"{base_url.rstrip('/')}{path}"
+        source.registry = registry
+        registry.register(source.name, getattr(source_class, 'SYMBOL_MAP', {}))
+        if not rate_limits:
+            source.rate_limiter = None
+        sources.append(source)
+    return sources
+
+
+def _profiles_from_args(args) -> Dict[str, ReplayProfile]:
+    profile = ReplayProfile(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        outlier_rate=args.outlier_rate,
+        outlier_factor=args.outlier_factor,
+    )
+    return {exchange: profile for exchange in EXCHANGES}
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """Opções de latência/erros/outliers (compartilhadas com os benchmarks)"""
+    parser.add_argument('--latency-ms', type=float, default=20.0, help="Latência mediana por resposta")
+    parser.add_argument('--latency-sigma', type=float, default=0.5, help="Dispersão log-normal da latência")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fração de respostas HTTP 500")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="Fração de respostas HTTP 429")
+    parser.add_argument('--outlier-rate', type=float, default=0.0, help="Fração de preços distorcidos")
+    parser.add_argument('--outlier-factor', type=float, default=1.2, help="Multiplicador dos outliers")
+    parser.add_argument('--payloads', help="Diretório com respostas gravadas (--record)")
+    parser.add_argument('--assets', type=int, default=500, help="Ativos do mercado sintético")
+    parser.add_argument('--seed', type=int, default=42)
+
+
+def build_server(args, host: str = "127.0.0.1", port: int = 0) -> ReplayExchangeServer:
+    """Servidor a partir das opções de add_profile_arguments"""
+    market = load_recordings(args.payloads) if args.payloads else synthetic_market(args.assets, seed=args.seed)
+    return ReplayExchangeServer(market, _profiles_from_args(args), host=host, port=port, seed=args.seed)
+
+
+async def _serve(args):
+    async with build_server(args, host=args.host, port=args.port) as server:
+        print(f"🎬 Replay em {server.url} (Binance /binance, CoinGecko /coingecko, CoinCap /coincap)", flush=True)
+        await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de replay das exchanges (offline)")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--record', help="Grava respostas reais neste diretório e sai")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record_fixtures(args.record))
+        return
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,341 @@
+"""
+DecAI Oracle - Aggregator Snapshots
+Versão 2.0 - Warm restarts
+
+Snapshot binário do estado do agregador para reinícios a quente:
+- Cache de consenso (campos fixos + preços individuais por fonte)
+- SourceHealth de cada fonte
+- Histogramas de latência (buckets das janelas atual/anterior)
+- Histórico de ticks (registros TickBatch.RECORD_DTYPE)
+
+Formato (little-endian):
+    b"DECAISN1" | uint32 tamanho do cabeçalho | cabeçalho JSON | padding
+    tabelas NumPy contíguas, alinhadas a 64 bytes
+
+O cabeçalho descreve dtype/shape/offset de cada tabela, de modo que cada
+uma pode ser mapeada diretamente com np.memmap. A escrita é atômica
+(arquivo temporário único + os.replace).
+"""
+
+import contextlib
+import json
+import math
+import os
+import struct
+import tempfile
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.data.latency import LatencyHistogram
+from src.data.ticks import SymbolTable, TickBatch, from_epoch_ns, to_epoch_ns
+
+MAGIC = b"DECAISN1"
+VERSION = 1
+ALIGN = 64
+MAX_SOURCES = 64  # sources_mask é um uint64
+
+CACHE_DTYPE = np.dtype([
+    ('symbol', '<i4'),
+    ('num_sources', '<i4'),
+    ('sources_mask', '<u8'),
+    ('price', '<f8'),
+    ('volume', '<f8'),          # NaN = sem volume
+    ('confidence', '<f8'),
+    ('std_dev', '<f8'),
+    ('deviation_pct', '<f8'),
+    ('ts_ns', '<i8'),
+    ('saved_at_ns', '<i8'),
+])
+
+HEALTH_DTYPE = np.dtype([
+    ('name', '<i4'),
+    ('status', '<i4'),
+    ('consecutive_failures', '<i4'),
+    ('latency_current', '<i4'),
+    ('latency_previous', '<i4'),
+    ('success_rate', '<f8'),
+    ('avg_response_time', '<f8'),
+    ('last_success_ns', '<i8'),  # 0 = None
+    ('last_failure_ns', '<i8'),
+    ('total_requests', '<i8'),
+    ('total_failures', '<i8'),
+    ('latency_total', '<i8'),
+])
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _ns(value: Optional[datetime]) -> int:
+    return to_epoch_ns(value) if value is not None else 0
+
+
+def _dt(value: int) -> Optional[datetime]:
+    return from_epoch_ns(int(value)) if value else None
+
+
+def _write(path: str, header: Dict[str, Any], tables: Dict[str, np.ndarray]) -> int:
+    """Serializa tabelas + cabeçalho de forma atômica; retorna o tamanho em bytes"""
+    layout = {}
+    offset = 0
+    for name, table in tables.items():
+        table = np.ascontiguousarray(table)
+        tables[name] = table
+        layout[name] = {
+            'dtype': table.dtype.descr if table.dtype.names else table.dtype.str,
+            'shape': list(table.shape),
+            'offset': offset,
+        }
+        offset = _align(offset + table.nbytes)
+    header = {**header, 'tables': layout}
+
+    raw_header = json.dumps(header, separators=(',', ':')).encode()
+    data_start = _align(len(MAGIC) + 4 + len(raw_header))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # Temporário único: processos/threads gravando o mesmo snapshot não colidem
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<I', len(raw_header)))
+            f.write(raw_header)
+            for name, table in tables.items():
+                f.seek(data_start + layout[name]['offset'])
+                f.write(table.tobytes())
+            size = f.tell()
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return size
+
+
+def read_snapshot(path: str) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Lê o cabeçalho e mapeia as tabelas (np.memmap, somente leitura)
+
+    Returns:
+        (cabeçalho, tabelas por nome)
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Arquivo não é um snapshot do agregador: {path}")
+        (header_len,) = struct.unpack('<I', f.read(4))
+        header = json.loads(f.read(header_len))
+
+    if header.get('version') != VERSION:
+        raise ValueError(f"Versão de snapshot não suportada: {header.get('version')}")
+
+    data_start = _align(len(MAGIC) + 4 + header_len)
+    tables = {}
+    for name, spec in header['tables'].items():
+        descr = spec['dtype']
+        dtype = np.dtype([tuple(field) for field in descr] if isinstance(descr, list) else descr)
+        shape = tuple(spec['shape'])
+        if int(np.prod(shape)) == 0:
+            tables[name] = np.empty(shape, dtype)
+            continue
+        tables[name] = np.memmap(path, dtype=dtype, mode='r', offset=data_start + spec['offset'], shape=shape)
+    return header, tables
+
+
+def save_snapshot(path: str, cache, sources: List, ticks: Optional[TickBatch] = None) -> int:
+    """
+    Grava o snapshot do cache, das fontes e do histórico de ticks
+
+    Pode rodar fora do event loop: o histórico chega já copiado
+    (TickHistory.export()), pois os ring buffers são alterados no loop.
+
+    Args:
+        path: Caminho do arquivo
+        cache: PriceCacheBase do agregador
+        sources: Fontes do agregador (SourceHealth + LatencyHistogram)
+        ticks: Cópia do histórico de ticks do agregador (opcional)
+
+    Returns:
+        Tamanho do arquivo em bytes
+    """
+    from src.data.data_aggregator import DataSourceStatus
+
+    # Nomes de fontes (bits de sources_mask / colunas de preços) e de símbolos
+    source_names = SymbolTable()
+    for source in sources:
+        source_names.intern(source.name)
+    symbols: List[str] = []
+
+    entries = cache.entries()
+    cache_rows = np.zeros(len(entries), CACHE_DTYPE)
+    source_prices = np.full((len(entries), MAX_SOURCES), np.nan)
+    columns: Dict[str, list] = {name: [] for name in CACHE_DTYPE.names}
+
+    for i, (symbol, (data, saved_at)) in enumerate(entries):
+        metadata = data.metadata
+        mask = 0
+        for source_name in metadata.get('sources_used', []):
+            ident = source_names.intern(source_name)
+            if ident < MAX_SOURCES:
+                mask |= 1 << ident
+        for source_name, price in metadata.get('individual_prices', {}).items():
+            ident = source_names.intern(source_name)
+            if ident < MAX_SOURCES:
+                source_prices[i, ident] = price
+
+        columns['symbol'].append(len(symbols))
+        symbols.append(symbol)
+        columns['num_sources'].append(metadata.get('num_sources', 0))
+        columns['sources_mask'].append(mask)
+        columns['price'].append(data.price)
+        columns['volume'].append(data.volume_24h if data.volume_24h is not None else np.nan)
+        columns['confidence'].append(data.confidence)
+        columns['std_dev'].append(metadata.get('price_std_dev', 0.0))
+        columns['deviation_pct'].append(metadata.get('price_deviation_pct', 0.0))
+        columns['ts_ns'].append(to_epoch_ns(data.timestamp))
+        columns['saved_at_ns'].append(to_epoch_ns(saved_at))
+
+    for name, values in columns.items():
+        cache_rows[name] = values
+
+    # Só as colunas de fontes realmente usadas
+    source_prices = source_prices[:, :min(len(source_names), MAX_SOURCES)]
+
+    statuses = [status.value for status in DataSourceStatus]
+    health_rows = np.zeros(len(sources), HEALTH_DTYPE)
+    latency = np.zeros((len(sources), 2, len(LatencyHistogram.BOUNDS) + 1), '<i8')
+
+    for i, source in enumerate(sources):
+        health = source.health
+        current, previous, current_count, previous_count = source.latency.export_counts()
+        row = health_rows[i]
+        row['name'] = source_names.lookup(source.name)
+        row['status'] = statuses.index(health.status.value)
+        row['consecutive_failures'] = health.consecutive_failures
+        row['success_rate'] = health.success_rate
+        row['avg_response_time'] = health.avg_response_time
+        row['last_success_ns'] = _ns(health.last_success)
+        row['last_failure_ns'] = _ns(health.last_failure)
+        row['total_requests'] = health.total_requests
+        row['total_failures'] = health.total_failures
+        row['latency_current'] = current_count
+        row['latency_previous'] = previous_count
+        row['latency_total'] = source.latency.total_samples
+        latency[i, 0] = current
+        latency[i, 1] = previous
+
+    header = {
+        'version': VERSION,
+        'created_at': datetime.now().isoformat(),
+        'sources': [source_names.name(i) for i in range(len(source_names))],
+        'symbols': symbols,
+        'statuses': statuses,
+        'latency_buckets': len(LatencyHistogram.BOUNDS) + 1,
+    }
+    tables = {
+        'cache': cache_rows,
+        'cache_source_prices': source_prices,
+        'health': health_rows,
+        'latency': latency,
+    }
+    if ticks is not None:
+        # Ids de fonte/símbolo dos ticks referem-se a tick_names
+        header['tick_names'] = [ticks.table.name(i) for i in range(len(ticks.table))]
+        tables['ticks'] = ticks.to_records()
+    return _write(path, header, tables)
+
+
+def load_snapshot(path: str, cache, sources: List, history=None) -> Dict[str, int]:
+    """
+    Restaura cache, SourceHealth, latências e histórico de ticks
+
+    Fontes são associadas pelo nome; entradas já além do max_age do cache são
+    descartadas na primeira leitura.
+
+    Returns:
+        Contagem de itens restaurados ({'cache': n, 'sources': m, 'ticks': k})
+    """
+    from src.data.data_aggregator import DataSourceStatus, PriceData
+
+    header, tables = read_snapshot(path)
+    source_names: List[str] = header['sources']
+    symbols: List[str] = header['symbols']
+    statuses: List[str] = header['statuses']
+
+    # Colunas convertidas de uma vez (acesso linha a linha no memmap é lento)
+    cache_rows = tables['cache']
+    columns = {name: cache_rows[name].tolist() for name in CACHE_DTYPE.names}
+    source_prices = tables['cache_source_prices'].tolist()
+    mask_names = source_names[:MAX_SOURCES]
+
+    for i in range(len(cache_rows)):
+        mask = columns['sources_mask'][i]
+        volume = columns['volume'][i]
+        symbol = symbols[columns['symbol'][i]]
+        data = PriceData(
+            source="MultiSource-Aggregator",
+            symbol=symbol,
+            price=columns['price'][i],
+            volume_24h=None if math.isnan(volume) else volume,
+            timestamp=from_epoch_ns(columns['ts_ns'][i]),
+            confidence=columns['confidence'][i],
+            metadata={
+                'sources_used': [name for j, name in enumerate(mask_names) if mask >> j & 1],
+                'num_sources': columns['num_sources'][i],
+                'price_std_dev': columns['std_dev'][i],
+                'price_deviation_pct': columns['deviation_pct'][i],
+                'individual_prices': {
+                    source_names[j]: price
+                    for j, price in enumerate(source_prices[i])
+                    if not math.isnan(price)
+                },
+            }
+        )
+        cache[symbol] = (data, from_epoch_ns(columns['saved_at_ns'][i]))
+    restored_cache = len(cache_rows)
+
+    by_name = {source.name: source for source in sources}
+    restored_sources = 0
+    latency_compatible = header.get('latency_buckets') == len(LatencyHistogram.BOUNDS) + 1
+    health_rows = tables['health']
+    for i in range(len(health_rows)):
+        row = health_rows[i]
+        source = by_name.get(source_names[int(row['name'])])
+        if source is None:
+            continue
+
+        health = source.health
+        health.status = DataSourceStatus(statuses[int(row['status'])])
+        health.success_rate = float(row['success_rate'])
+        health.avg_response_time = float(row['avg_response_time'])
+        health.last_success = _dt(row['last_success_ns'])
+        health.last_failure = _dt(row['last_failure_ns'])
+        health.consecutive_failures = int(row['consecutive_failures'])
+        health.total_requests = int(row['total_requests'])
+        health.total_failures = int(row['total_failures'])
+
+        if latency_compatible:
+            source.latency.restore_counts(
+                tables['latency'][i, 0],
+                tables['latency'][i, 1],
+                int(row['latency_current']),
+                int(row['latency_previous']),
+                int(row['latency_total']),
+            )
+        restored_sources += 1
+
+    restored_ticks = 0
+    if history is not None and 'ticks' in tables:
+        tick_names = SymbolTable()
+        for name in header['tick_names']:
+            tick_names.intern(name)
+        ticks = TickBatch.from_records(tables['ticks'], tick_names)
+        history.restore(ticks)
+        restored_ticks = len(ticks)
+
+    return {'cache': restored_cache, 'sources': restored_sources, 'ticks': restored_ticks}
@@ -0,0 +1,82 @@
+"""
+DecAI Oracle - Source Quality
+Versão 2.0 - Adaptive source weighting
+
+Peso dinâmico de cada fonte no consenso, atualizado incrementalmente:
+- Taxa de sucesso recente (média móvel exponencial de 1/0 por requisição)
+- Desvio recente em relação ao consenso (média móvel exponencial, em %)
+
+peso = sucesso × 1 / (1 + desvio / deviation_scale), limitado a
+[min_weight, 1]. Até min_samples desvios observados o peso é 1 (fonte
+sem histórico não é penalizada nem favorecida).
+
+O peso multiplica a confiança estática da fonte na média ponderada do
+consenso; a confiança reportada não muda.
+"""
+
+from typing import Any, Dict, Optional
+
+from src.utils.config import settings
+
+
+class SourceQuality:
+    """
+    Estatísticas incrementais (O(1) por observação) de uma fonte
+
+    Args:
+        alpha: Fator de suavização das médias móveis (0-1]
+        deviation_scale: Desvio (%) que reduz o peso à metade
+        min_weight: Piso do peso (a fonte nunca some do consenso)
+        min_samples: Desvios observados antes de aplicar o peso
+    """
+
+    def __init__(
+        self,
+        alpha: Optional[float] = None,
+        deviation_scale: Optional[float] = None,
+        min_weight: Optional[float] = None,
+        min_samples: Optional[int] = None
+    ):
+        self.alpha = alpha if alpha is not None else settings.SOURCE_WEIGHT_ALPHA
+        self.deviation_scale = (
+            deviation_scale if deviation_scale is not None else settings.SOURCE_WEIGHT_DEVIATION_SCALE_PCT
+        )
+        self.min_weight = min_weight if min_weight is not None else settings.SOURCE_WEIGHT_MIN
+        self.min_samples = min_samples if min_samples is not None else settings.SOURCE_WEIGHT_MIN_SAMPLES
+
+        self.success = 1.0        # média móvel de sucesso (1 = sempre respondeu)
+        self.deviation = 0.0      # média móvel de |preço - consenso| / consenso (%)
+        self.outcomes = 0
+        self.deviation_samples = 0
+
+    def _ewma(self, current: float, value: float, samples: int) -> float:
+        # Nas primeiras amostras usa a média simples (sem viés do valor inicial)
+        alpha = max(self.alpha, 1.0 / samples)
+        return current + alpha * (value - current)
+
+    def record_outcome(self, success: bool):
+        """Registra o resultado de uma requisição à fonte"""
+        self.outcomes += 1
+        self.success = self._ewma(self.success, 1.0 if success else 0.0, self.outcomes)
+
+    def record_deviation(self, deviation_pct: float):
+        """Registra o desvio (%) do preço da fonte em relação ao consenso"""
+        self.deviation_samples += 1
+        self.deviation = self._ewma(self.deviation, abs(deviation_pct), self.deviation_samples)
+
+    @property
+    def weight(self) -> float:
+        """Peso atual da fonte no consenso (entre min_weight e 1)"""
+        if self.deviation_samples < self.min_samples:
+            return 1.0
+        accuracy = 1.0 / (1.0 + self.deviation / self.deviation_scale)
+        return max(self.min_weight, min(1.0, self.success * accuracy))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Estado para relatórios de saúde"""
+        return {
+            'weight': round(self.weight, 4),
+            'success_ewma': round(self.success, 4),
+            'deviation_ewma_pct': round(self.deviation, 4),
+            'deviation_samples': self.deviation_samples,
+        }
@@ -0,0 +1,312 @@
+"""
+DecAI Oracle - Streaming Data Sources
+Versão 2.0 - Push-based price feeds
+
+Variantes WebSocket das fontes Binance e CoinCap:
+- Assinatura persistente (um único socket por fonte)
+- Livro de preços em memória com o último tick por símbolo
+- Reconexão automática com backoff exponencial
+- Detecção de dados obsoletos refletida em SourceHealth (sem abrir o
+  circuit breaker)
+
+As fontes de streaming implementam a mesma interface de DataSourceBase,
+então MultiSourceAggregator.get_price lê o livro local sem esperar HTTP.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+
+from src.data import fast_json
+from src.data.data_aggregator import (
+    BinanceSource,
+    CoinCapSource,
+    DataSourceBase,
+    DataSourceStatus,
+    PriceData,
+)
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PriceBook:
+    """Último tick recebido por símbolo (com instante de recebimento monotônico)"""
+
+    def __init__(self):
+        self._ticks: Dict[str, Tuple[PriceData, float]] = {}
+
+    def update(self, tick: PriceData):
+        """Registra um novo tick, substituindo o anterior do mesmo símbolo"""
+        self._ticks[tick.symbol] = (tick, time.monotonic())
+
+    def get(self, symbol: str) -> Optional[PriceData]:
+        """Retorna o último tick do símbolo, independente da idade"""
+        entry = self._ticks.get(symbol)
+        return entry[0] if entry else None
+
+    def age(self, symbol: str) -> Optional[float]:
+        """Idade (segundos) do último tick do símbolo, ou None se nunca recebido"""
+        entry = self._ticks.get(symbol)
+        return time.monotonic() - entry[1] if entry else None
+
+    def symbols(self) -> List[str]:
+        return list(self._ticks)
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+
+class StreamingSourceBase(DataSourceBase):
+    """
+    Classe base para fontes push (WebSocket)
+
+    Subclasses implementam _stream_url() e _handle_message(); a base cuida
+    da conexão, reconexão com backoff e da leitura do livro de preços.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        url: Optional[str] = None,
+        stale_after: Optional[float] = None,
+        reconnect_initial: Optional[float] = None,
+        reconnect_max: Optional[float] = None,
+        heartbeat: float = 20.0
+    ):
+        super().__init__(name)
+        self.url = url
+        self.stale_after = stale_after if stale_after is not None else settings.STREAM_STALE_AFTER_SECONDS
+        self.reconnect_initial = (
+            reconnect_initial if reconnect_initial is not None
+            else settings.STREAM_RECONNECT_INITIAL_SECONDS
+        )
+        self.reconnect_max = reconnect_max if reconnect_max is not None else settings.STREAM_RECONNECT_MAX_SECONDS
+        self.heartbeat = heartbeat
+
+        self.book = PriceBook()
+        self.symbols: List[str] = []
+        self._subscribed: Set[str] = set()
+        self.connected = False
+        self.connections = 0
+        self.messages_received = 0
+
+        self._task: Optional[asyncio.Task] = None
+        self._connected_event = asyncio.Event()
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    async def start(self, symbols: List[str]):
+        """Inicia (ou reinicia com nova lista de símbolos) a assinatura"""
+        symbols = list(dict.fromkeys(symbols))
+        if self._task is not None and not self._task.done():
+            if symbols == self.symbols:
+                return
+            await self.stop()
+
+        self.symbols = symbols
+        self._subscribed = set(symbols)
+        self._connected_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name=f"stream-{self.name}")
+        logger.info("📡 %s: stream iniciado para %d símbolos", self.name, len(symbols))
+
+    async def stop(self):
+        """Encerra a assinatura"""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.connected = False
+
+    async def wait_connected(self, timeout: float = 5.0) -> bool:
+        """Aguarda a primeira conexão bem-sucedida"""
+        try:
+            await asyncio.wait_for(self._connected_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self):
+        await self.stop()
+        await super().close()
+
+    # ------------------------------------------------------------------
+    # Loop de conexão
+    # ------------------------------------------------------------------
+
+    async def _run(self):
+        delay = self.reconnect_initial
+
+        while True:
+            try:
+                session = self._get_session()
+                async with session.ws_connect(self._stream_url(), heartbeat=self.heartbeat) as ws:
+                    self.connected = True
+                    self.connections += 1
+                    self._connected_event.set()
+                    delay = self.reconnect_initial
+                    logger.info("🟢 %s: WebSocket conectado", self.name)
+
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            self._dispatch(msg.data)
+                        elif msg.type in (aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED):
+                            break
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("❌ %s: erro no WebSocket: %s", self.name, e)
+            finally:
+                self.connected = False
+
+            self._record_disconnect()
+
+            # Backoff exponencial com jitter
+            sleep_for = delay * random.uniform(0.9, 1.1)
+            logger.warning("🔄 %s: reconectando em %.1fs", self.name, sleep_for)
+            await asyncio.sleep(sleep_for)
+            delay = min(delay * 2, self.reconnect_max)
+
+    def _dispatch(self, raw: str):
+        """Decodifica uma mensagem e atualiza o livro (mensagens inválidas são ignoradas)"""
+        try:
+            for tick in self._handle_message(fast_json.loads(raw)):
+                self.book.update(tick)
+            self.messages_received += 1
+        except Exception as e:
+            logger.debug("%s: mensagem ignorada (%s)", self.name, e)
+
+    def _record_disconnect(self):
+        """Queda de conexão degrada a fonte sem contar como requisição"""
+        self.health.last_failure = datetime.now()
+        if self.health.status != DataSourceStatus.DOWN:
+            self.health.status = DataSourceStatus.DEGRADED
+
+    # ------------------------------------------------------------------
+    # Interface DataSourceBase
+    # ------------------------------------------------------------------
+
+    def supports(self, symbol: str) -> bool:
+        """Apenas símbolos assinados (os demais nunca recebem ticks)"""
+        return symbol in self._subscribed
+
+    async def fetch_price(self, symbol: str) -> Optional[PriceData]:
+        """
+        Lê o último tick do livro local (sem I/O)
+
+        Sem tick, ou com tick mais antigo que stale_after, retorna None sem
+        registrar falha: um stream quieto não é uma requisição falha e não
+        deve abrir o circuit breaker. Ticks obsoletos apenas degradam a
+        fonte. A leitura não tem round-trip, então a idade do tick não entra
+        no histograma de latência (hedging/timeout adaptativo).
+        """
+        age = self.book.age(symbol)
+
+        if age is None:
+            return None
+        if age > self.stale_after:
+            if self.health.status == DataSourceStatus.HEALTHY:
+                self.health.status = DataSourceStatus.DEGRADED
+            logger.warning("⏳ %s: tick obsoleto para %s (%.1fs)", self.name, symbol, age)
+            return None
+
+        self.update_health(True, 0.0, record_latency=False)
+        return self.book.get(symbol)
+
+    def _stream_url(self) -> str:
+        """Implementar em subclasses"""
+        raise NotImplementedError
+
+    def _handle_message(self, message: Any) -> List[PriceData]:
+        """Implementar em subclasses: mensagem decodificada → lista de ticks"""
+        raise NotImplementedError
+
+
+class BinanceStreamSource(StreamingSourceBase):
+    """Fonte de dados: Binance WebSocket (stream combinado <symbol>@ticker)"""
+
+    WS_URL = "wss://stream.binance.com:9443/stream"
+
+    def __init__(self, **kwargs):
+        super().__init__("Binance", **kwargs)
+        self._by_stream_symbol: Dict[str, str] = {}
+
+    def supports(self, symbol: str) -> bool:
+        return super().supports(symbol) and BinanceSource._to_binance_symbol(symbol, self.registry) is not None
+
+    def _stream_url(self) -> str:
+        self._by_stream_symbol = {}
+        for symbol in self.symbols:
+            stream_symbol = BinanceSource._to_binance_symbol(symbol, self.registry)
+            if stream_symbol is not None:
+                self._by_stream_symbol[stream_symbol] = symbol
+        streams = '/'.join(f"{s.lower()}@ticker" for s in self._by_stream_symbol)
+        return f"{self.url or self.WS_URL}?streams={streams}"
+
+    def _handle_message(self, message: Any) -> List[PriceData]:
+        data = message.get('data', message)
+        symbol = self._by_stream_symbol.get(data.get('s'))
+        if symbol is None:
+            return []
+
+        return [PriceData(
+            source=self.name,
+            symbol=symbol,
+            price=float(data['c']),
+            volume_24h=float(data['v']),
+            timestamp=datetime.now(),
+            confidence=95.0,
+            metadata={
+                'high_24h': float(data['h']),
+                'low_24h': float(data['l']),
+                'price_change_pct': float(data['P'])
+            }
+        )]
+
+
+class CoinCapStreamSource(StreamingSourceBase):
+    """Fonte de dados: CoinCap WebSocket (prices?assets=a,b,c)"""
+
+    WS_URL = "wss://ws.coincap.io/prices"
+
+    def __init__(self, **kwargs):
+        super().__init__("CoinCap", **kwargs)
+        self.registry.register(self.name, CoinCapSource.SYMBOL_MAP)
+        self._by_asset_id: Dict[str, str] = {}
+
+    def supports(self, symbol: str) -> bool:
+        return super().supports(symbol) and self.registry.to_source(self.name, symbol) is not None
+
+    def _stream_url(self) -> str:
+        self._by_asset_id = {}
+        for symbol in self.symbols:
+            asset_id = self.registry.to_source(self.name, symbol)
+            if asset_id is not None:
+                self._by_asset_id[asset_id] = symbol
+        return f"{self.url or self.WS_URL}?assets={','.join(self._by_asset_id)}"
+
+    def _handle_message(self, message: Any) -> List[PriceData]:
+        now = datetime.now()
+        return [
+            PriceData(
+                source=self.name,
+                symbol=self._by_asset_id[asset_id],
+                price=float(price),
+                volume_24h=None,
+                timestamp=now,
+                confidence=85.0
+            )
+            for asset_id, price in message.items()
+            if asset_id in self._by_asset_id
+        ]
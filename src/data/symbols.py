@@ -0,0 +1,70 @@
+"""
+DecAI Oracle - Symbol Registry
+Versão 2.0 - Asset universe
+
+Registro central de símbolos:
+- Símbolo canônico BASE/QUOTE (ex: BTC/USD) ↔ id de cada fonte
+  (BTCUSDT na Binance, 'bitcoin' no CoinGecko/CoinCap)
+- Mapas bidirecionais pré-computados (lookup O(1), sem conversão por chamada)
+- Universo completo carregado uma vez por fonte (DataSourceBase.load_symbols)
+  e substituído atomicamente em cada atualização
+
+Uma fonte com universo carregado é autoritativa: símbolos fora do mapa
+não são suportados e o agregador nem chega a consultá-la.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Mapping, Optional
+
+
+class SymbolRegistry:
+    """Mapeamentos símbolo canônico ↔ id por fonte"""
+
+    def __init__(self):
+        self._to_source: Dict[str, Dict[str, str]] = {}
+        self._from_source: Dict[str, Dict[str, str]] = {}
+        self._loaded_at: Dict[str, datetime] = {}
+
+    def register(self, source: str, mapping: Mapping[str, str]):
+        """Adiciona mapeamentos estáticos (não torna a fonte autoritativa)"""
+        to_source = self._to_source.setdefault(source, {})
+        from_source = self._from_source.setdefault(source, {})
+        for symbol, source_id in mapping.items():
+            to_source[symbol] = source_id
+            from_source.setdefault(source_id, symbol)
+
+    def replace(self, source: str, mapping: Mapping[str, str]):
+        """Substitui o universo da fonte (resultado de load_symbols)"""
+        from_source: Dict[str, str] = {}
+        for symbol, source_id in mapping.items():
+            from_source.setdefault(source_id, symbol)
+        self._to_source[source] = dict(mapping)
+        self._from_source[source] = from_source
+        self._loaded_at[source] = datetime.now()
+
+    def to_source(self, source: str, symbol: str) -> Optional[str]:
+        """Id do símbolo na fonte (None se desconhecido)"""
+        return self._to_source.get(source, {}).get(symbol)
+
+    def from_source(self, source: str, source_id: str) -> Optional[str]:
+        """Símbolo canônico para o id da fonte"""
+        return self._from_source.get(source, {}).get(source_id)
+
+    def is_loaded(self, source: str) -> bool:
+        """Universo completo da fonte já carregado"""
+        return source in self._loaded_at
+
+    def loaded_at(self, source: str) -> Optional[datetime]:
+        return self._loaded_at.get(source)
+
+    def symbols(self, source: str) -> List[str]:
+        """Símbolos canônicos conhecidos para a fonte"""
+        return sorted(self._to_source.get(source, {}))
+
+    def sources_for(self, symbol: str) -> List[str]:
+        """Fontes com mapeamento conhecido para o símbolo"""
+        return sorted(source for source, mapping in self._to_source.items() if symbol in mapping)
+
+
+# Registro do processo (compartilhado pelas fontes por padrão)
+SYMBOL_REGISTRY = SymbolRegistry()
@@ -0,0 +1,226 @@
+"""
+DecAI Oracle - Tick History
+Versão 2.0 - Local high-frequency history
+
+Histórico de ticks por símbolo em ring buffers NumPy:
+- Um buffer para o consenso e um por (símbolo, fonte)
+- Capacidade fixa; memória cresce por duplicação até o teto
+- Armazenamento no formato de src.data.ticks (colunas de TickBatch,
+  ids internados, epoch-ns)
+- Janelas (últimos N ticks / últimos N minutos) como TickBatch sem cópia
+
+Cada coluna é espelhada (posições i e i + capacidade), de modo que a
+janela mais recente é sempre um trecho contíguo do array.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.data.ticks import NAMES, SymbolTable, Tick, TickBatch
+
+
+class TickRingBuffer:
+    """
+    Ring buffer de capacidade fixa sobre as colunas de TickBatch
+
+    Janelas são TickBatch somente leitura (views, em ordem cronológica).
+
+    Args:
+        capacity: Número máximo de ticks retidos
+        initial_capacity: Alocação inicial (dobra até capacity)
+        table: Tabela de nomes dos ids de fonte/símbolo
+    """
+
+    def __init__(self, capacity: int = 2048, initial_capacity: int = 64, table: SymbolTable = NAMES):
+        self.capacity = capacity
+        self.table = table
+        self._size = min(initial_capacity, capacity)
+        self._columns = TickBatch.empty_columns(2 * self._size)
+        self._head = 0        # próxima posição de escrita
+        self.count = 0        # ticks retidos (≤ capacity)
+        self.total = 0        # ticks já registrados
+
+    def _grow(self):
+        new_size = min(self._size * 2, self.capacity)
+        window = self.last()
+        columns = TickBatch.empty_columns(2 * new_size)
+        for name, grown in columns.items():
+            values = window.column(name)
+            grown[:self.count] = values
+            grown[new_size:new_size + self.count] = values
+        self._columns = columns
+        # Os ticks retidos passam a ocupar [0, count), em ordem cronológica
+        self._head = self.count
+        self._size = new_size
+
+    def append(self, tick: Tick):
+        """Registra um tick (sobrescreve o mais antigo quando cheio)"""
+        if self.count == self._size and self._size < self.capacity:
+            self._grow()
+
+        i = self._head
+        mirror = i + self._size
+        columns = self._columns
+        for name in Tick.__slots__:
+            column = columns[name]
+            column[i] = column[mirror] = getattr(tick, name)
+
+        self._head = (i + 1) % self._size
+        self.count = min(self.count + 1, self._size)
+        self.total += 1
+
+    def extend(self, batch: TickBatch):
+        """Registra um lote em ordem (apenas os últimos capacity ticks ficam)"""
+        k = min(len(batch), self.capacity)
+        if k == 0:
+            return
+        while self.count + k > self._size and self._size < self.capacity:
+            self._grow()
+
+        k = min(k, self._size)
+        positions = (self._head + np.arange(k)) % self._size
+        for name, column in self._columns.items():
+            values = batch.column(name)[-k:]
+            column[positions] = values
+            column[positions + self._size] = values
+
+        self._head = (self._head + k) % self._size
+        self.count = min(self.count + k, self._size)
+        self.total += len(batch)
+
+    def last(self, n: Optional[int] = None) -> TickBatch:
+        """Últimos n ticks (todos se n for None), sem cópia"""
+        n = self.count if n is None else max(0, min(n, self.count))
+        end = self._head + self._size if self.count == self._size else self._head
+        start = end - n
+        views = {}
+        for name, column in self._columns.items():
+            view = column[start:end]
+            view.flags.writeable = False
+            views[name] = view
+        return TickBatch.from_columns(views, self.table)
+
+    def since(self, ts_ns: int) -> TickBatch:
+        """Ticks com timestamp ≥ ts_ns (appends em ordem cronológica)"""
+        window = self.last()
+        return window[int(np.searchsorted(window.ts_ns, ts_ns, side='left')):]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._columns.values())
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class TickHistory:
+    """
+    Histórico local do agregador: consenso e ticks por fonte, por símbolo
+
+    Ticks de consenso são gravados com a fonte CONSENSUS, de modo que cada
+    tick identifica o próprio buffer.
+
+    Args:
+        capacity: Ticks retidos por buffer
+        table: Tabela de nomes dos ids de fonte/símbolo
+    """
+
+    CONSENSUS = "consensus"
+
+    def __init__(self, capacity: int = 2048, table: SymbolTable = NAMES):
+        self.capacity = capacity
+        self.table = table
+        self._buffers: Dict[Tuple[str, str], TickRingBuffer] = {}
+
+    def _buffer(self, symbol: str, source: str) -> TickRingBuffer:
+        key = (symbol, source)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = self._buffers[key] = TickRingBuffer(self.capacity, table=self.table)
+        return buffer
+
+    def record_consensus(self, data):
+        """Registra um consenso (PriceData do agregador)"""
+        tick = Tick.from_price_data(data, self.table)
+        tick.source_id = self.table.intern(self.CONSENSUS)
+        self._buffer(data.symbol, self.CONSENSUS).append(tick)
+
+    def record_source(self, data):
+        """Registra o tick de uma fonte individual"""
+        self._buffer(data.symbol, data.source).append(Tick.from_price_data(data, self.table))
+
+    def window(
+        self,
+        symbol: str,
+        source: Optional[str] = None,
+        minutes: Optional[float] = None,
+        last: Optional[int] = None
+    ) -> TickBatch:
+        """
+        Janela do histórico (consenso por padrão, ou de uma fonte)
+
+        Args:
+            symbol: Par de negociação
+            source: Nome da fonte (None = consenso)
+            minutes: Apenas ticks dos últimos N minutos
+            last: Apenas os últimos N ticks
+        """
+        buffer = self._buffers.get((symbol, source or self.CONSENSUS))
+        if buffer is None:
+            return TickBatch.from_columns(TickBatch.empty_columns(0), self.table)
+
+        if minutes is not None:
+            cutoff = time.time_ns() - int(minutes * 60 * 1e9)
+            window = buffer.since(cutoff)
+            if last is not None:
+                window = window[-last:] if last else window[:0]
+            return window
+        return buffer.last(last)
+
+    def export(self) -> TickBatch:
+        """Cópia de todos os buffers em um único lote (para snapshots)"""
+        return TickBatch.concatenate((buffer.last() for buffer in self._buffers.values()), self.table)
+
+    def restore(self, batch: TickBatch):
+        """
+        Recarrega ticks exportados por export()
+
+        Os ids são remapeados pelo nome (batch.table → self.table); cada par
+        (símbolo, fonte) volta ao seu buffer, em ordem.
+        """
+        if not len(batch):
+            return
+        remap = np.array(
+            [self.table.intern(batch.table.name(i)) for i in range(len(batch.table))],
+            dtype=np.int32
+        )
+        columns = {name: batch.column(name) for name in TickBatch.DTYPES}
+        columns['source_id'] = remap[columns['source_id']]
+        columns['symbol_id'] = remap[columns['symbol_id']]
+
+        pairs = columns['symbol_id'].astype(np.int64) << 32 | columns['source_id'].astype(np.int64)
+        for pair in np.unique(pairs):
+            selected = pairs == pair
+            ticks = TickBatch.from_columns(
+                {name: column[selected] for name, column in columns.items()},
+                self.table
+            )
+            symbol = self.table.name(int(pair >> 32))
+            source = self.table.name(int(pair & 0xFFFFFFFF))
+            self._buffer(symbol, source).extend(ticks)
+
+    def symbols(self) -> List[str]:
+        return sorted({symbol for symbol, _ in self._buffers})
+
+    def sources(self, symbol: str) -> List[str]:
+        return sorted(
+            source for sym, source in self._buffers
+            if sym == symbol and source != self.CONSENSUS
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memória alocada por todos os buffers"""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
@@ -0,0 +1,306 @@
+"""
+DecAI Oracle - Compact Ticks
+Versão 2.0 - Tick storage
+
+Representação compacta de preços para histórico de ticks:
+- Tick: objeto com __slots__ (sem __dict__ nem metadata livre)
+- Timestamps em inteiros epoch-ns
+- Fonte/símbolo internados em ids inteiros (SymbolTable)
+- TickBatch: contêiner colunar (arrays NumPy) para muitos ticks
+
+PriceData continua sendo o formato da API; Tick/TickBatch são o formato de
+armazenamento, com conversão nos dois sentidos.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+
+class SymbolTable:
+    """Interna nomes (fontes, símbolos) em ids inteiros estáveis"""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def intern(self, name: str) -> int:
+        """Id do nome, registrando-o se for novo"""
+        ident = self._ids.get(name)
+        if ident is None:
+            ident = len(self._names)
+            self._ids[name] = ident
+            self._names.append(name)
+        return ident
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Id do nome sem registrá-lo"""
+        return self._ids.get(name)
+
+    def name(self, ident: int) -> str:
+        return self._names[ident]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._ids
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+# Tabela do processo (compartilhada por todos os ticks/lotes por padrão)
+NAMES = SymbolTable()
+
+
+def to_epoch_ns(timestamp: datetime) -> int:
+    """datetime → inteiro epoch-ns"""
+    return int(round(timestamp.timestamp() * 1e6)) * 1000
+
+
+def from_epoch_ns(ts_ns: int) -> datetime:
+    """Inteiro epoch-ns → datetime local (precisão de microssegundos)"""
+    return datetime.fromtimestamp(ts_ns // 1000 / 1e6)
+
+
+class Tick:
+    """
+    Preço de uma fonte em formato compacto
+
+    volume NaN representa volume ausente (None em PriceData).
+    """
+
+    __slots__ = ('source_id', 'symbol_id', 'price', 'volume', 'confidence', 'ts_ns')
+
+    def __init__(
+        self,
+        source_id: int,
+        symbol_id: int,
+        price: float,
+        volume: float,
+        confidence: float,
+        ts_ns: int
+    ):
+        self.source_id = source_id
+        self.symbol_id = symbol_id
+        self.price = price
+        self.volume = volume
+        self.confidence = confidence
+        self.ts_ns = ts_ns
+
+    @classmethod
+    def from_price_data(cls, data, table: SymbolTable = NAMES) -> "Tick":
+        """Converte um PriceData (metadata é descartado)"""
+        return cls(
+            table.intern(data.source),
+            table.intern(data.symbol),
+            float(data.price),
+            float(data.volume_24h) if data.volume_24h is not None else float('nan'),
+            float(data.confidence),
+            to_epoch_ns(data.timestamp),
+        )
+
+    def to_price_data(self, table: SymbolTable = NAMES):
+        """Reconstrói um PriceData (metadata vazio)"""
+        from src.data.data_aggregator import PriceData
+
+        return PriceData(
+            source=table.name(self.source_id),
+            symbol=table.name(self.symbol_id),
+            price=self.price,
+            volume_24h=None if self.volume != self.volume else self.volume,
+            timestamp=from_epoch_ns(self.ts_ns),
+            confidence=self.confidence,
+        )
+
+    def _key(self):
+        volume = None if self.volume != self.volume else self.volume
+        return (self.source_id, self.symbol_id, self.price, volume, self.confidence, self.ts_ns)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Tick):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __repr__(self) -> str:
+        return (
+            f"Tick(source_id={self.source_id}, symbol_id={self.symbol_id}, "
+            f"price={self.price}, volume={self.volume}, "
+            f"confidence={self.confidence}, ts_ns={self.ts_ns})"
+        )
+
+
+class TickBatch:
+    """
+    Contêiner colunar de ticks (uma coluna NumPy por campo)
+
+    As colunas crescem por duplicação; as propriedades expõem views do
+    trecho preenchido, sem cópia. Lotes criados com from_columns (ou por
+    fatiamento) apenas envolvem arrays existentes; um append neles copia
+    as colunas antes de escrever.
+
+    Args:
+        capacity: Capacidade inicial
+        table: Tabela de nomes usada para internar fonte/símbolo
+    """
+
+    DTYPES = {
+        'source_id': np.int32,
+        'symbol_id': np.int32,
+        'price': np.float64,
+        'volume': np.float64,
+        'confidence': np.float64,
+        'ts_ns': np.int64,
+    }
+
+    # Registro little-endian usado em disco (snapshots)
+    RECORD_DTYPE = np.dtype([(name, np.dtype(dtype).newbyteorder('<')) for name, dtype in DTYPES.items()])
+
+    def __init__(self, capacity: int = 1024, table: SymbolTable = NAMES):
+        self.table = table
+        self._size = 0
+        self._columns = {name: np.empty(max(1, capacity), dtype) for name, dtype in self.DTYPES.items()}
+
+    @classmethod
+    def empty_columns(cls, capacity: int) -> Dict[str, np.ndarray]:
+        """Colunas não inicializadas no formato do lote"""
+        return {name: np.empty(capacity, dtype) for name, dtype in cls.DTYPES.items()}
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray], table: SymbolTable = NAMES) -> "TickBatch":
+        """Envolve colunas de mesmo tamanho (views, sem cópia)"""
+        batch = cls.__new__(cls)
+        batch.table = table
+        batch._columns = {name: columns[name] for name in cls.DTYPES}
+        batch._size = len(batch._columns['price'])
+        return batch
+
+    @classmethod
+    def from_records(cls, records: np.ndarray, table: SymbolTable = NAMES) -> "TickBatch":
+        """Lote a partir de um array estruturado RECORD_DTYPE (copia as colunas)"""
+        return cls.from_columns(
+            {name: np.ascontiguousarray(records[name], dtype) for name, dtype in cls.DTYPES.items()},
+            table
+        )
+
+    @classmethod
+    def concatenate(cls, batches: Iterable["TickBatch"], table: SymbolTable = NAMES) -> "TickBatch":
+        """Novo lote com os ticks de todos os lotes (mesma tabela de nomes)"""
+        batches = list(batches)
+        if not batches:
+            return cls.from_columns(cls.empty_columns(0), table)
+        return cls.from_columns(
+            {name: np.concatenate([batch.column(name) for batch in batches]) for name in cls.DTYPES},
+            table
+        )
+
+    @classmethod
+    def from_price_data(cls, items: Iterable, table: SymbolTable = NAMES) -> "TickBatch":
+        items = list(items)
+        batch = cls(capacity=len(items), table=table)
+        for data in items:
+            batch.append_price_data(data)
+        return batch
+
+    def _reserve(self, needed: int):
+        capacity = len(self._columns['price'])
+        if needed <= capacity:
+            return
+        capacity = max(1, capacity)
+        while capacity < needed:
+            capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def append(self, tick: Tick):
+        """Adiciona um tick ao fim do lote"""
+        self._reserve(self._size + 1)
+        i = self._size
+        for name in Tick.__slots__:
+            self._columns[name][i] = getattr(tick, name)
+        self._size += 1
+
+    def append_price_data(self, data):
+        """Adiciona um PriceData sem criar um Tick intermediário"""
+        self._reserve(self._size + 1)
+        i = self._size
+        columns = self._columns
+        columns['source_id'][i] = self.table.intern(data.source)
+        columns['symbol_id'][i] = self.table.intern(data.symbol)
+        columns['price'][i] = data.price
+        columns['volume'][i] = data.volume_24h if data.volume_24h is not None else np.nan
+        columns['confidence'][i] = data.confidence
+        columns['ts_ns'][i] = to_epoch_ns(data.timestamp)
+        self._size += 1
+
+    def column(self, name: str) -> np.ndarray:
+        """View (sem cópia) da coluna preenchida"""
+        return self._columns[name][:self._size]
+
+    @property
+    def price(self) -> np.ndarray:
+        return self.column('price')
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.column('volume')
+
+    @property
+    def confidence(self) -> np.ndarray:
+        return self.column('confidence')
+
+    @property
+    def ts_ns(self) -> np.ndarray:
+        return self.column('ts_ns')
+
+    @property
+    def source_id(self) -> np.ndarray:
+        return self.column('source_id')
+
+    @property
+    def symbol_id(self) -> np.ndarray:
+        return self.column('symbol_id')
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelas colunas (capacidade alocada)"""
+        return sum(column.nbytes for column in self._columns.values())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Tick, "TickBatch"]:
+        if isinstance(index, slice):
+            return self.from_columns(
+                {name: column[:self._size][index] for name, column in self._columns.items()},
+                self.table
+            )
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        columns = self._columns
+        return Tick(
+            int(columns['source_id'][index]),
+            int(columns['symbol_id'][index]),
+            float(columns['price'][index]),
+            float(columns['volume'][index]),
+            float(columns['confidence'][index]),
+            int(columns['ts_ns'][index]),
+        )
+
+    def __iter__(self) -> Iterator[Tick]:
+        for i in range(self._size):
+            yield self[i]
+
+    def to_records(self) -> np.ndarray:
+        """Cópia do lote como array estruturado RECORD_DTYPE"""
+        records = np.empty(self._size, self.RECORD_DTYPE)
+        for name in self.DTYPES:
+            records[name] = self.column(name)
+        return records
+
+    def to_price_data(self) -> List:
+        """Converte todo o lote para PriceData (metadata vazio)"""
+        return [tick.to_price_data(self.table) for tick in self]
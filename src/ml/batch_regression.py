@@ -0,0 +1,209 @@
+"""
+Batched Linear Regression - Closed-form trend fits for many assets at once
+
+Each asset's price history is regressed on its day index (price = a + b*t).
+With a single feature the least-squares solution is closed-form:
+
+    b = sum((t - t_mean) * (y - y_mean)) / sum((t - t_mean)^2)
+    a = y_mean - b * t_mean
+
+Stacking the histories into an (assets x days) matrix turns every fit,
+R² and RMSE into a handful of vectorized NumPy reductions. The train/test
+split is the same shuffled split Predictor has always used
+(train_test_split with random_state=42), computed once per history length
+and shared by every asset, so results match the scikit-learn path.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sklearn.model_selection import train_test_split
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@lru_cache(maxsize=64)
+def split_indices(n_samples: int, test_size: float = 0.2, random_state: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Train/test day indices for a history of `n_samples` points
+
+    Returns:
+        (train_idx, test_idx), read-only
+    """
+    train_idx, test_idx = train_test_split(
+        np.arange(n_samples), test_size=test_size, random_state=random_state
+    )
+    train_idx.setflags(write=False)
+    test_idx.setflags(write=False)
+    return train_idx, test_idx
+
+
+def _scores(y: np.ndarray, y_pred: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-wise R² and RMSE (R² follows sklearn's r2_score conventions)"""
+    n = y.shape[1]
+    residual = ((y - y_pred) ** 2).sum(axis=1)
+    rmse = np.sqrt(residual / n)
+
+    if n < 2:
+        # r2_score is undefined for a single sample
+        return np.full(y.shape[0], np.nan), rmse
+
+    total = ((y - y.mean(axis=1, keepdims=True)) ** 2).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r2 = 1.0 - residual / total
+    # Constant targets: perfect fit scores 1.0, anything else 0.0
+    constant = total == 0
+    r2[constant] = np.where(residual[constant] == 0, 1.0, 0.0)
+    return r2, rmse
+
+
+@dataclass
+class LinearTrendFit:
+    """Fitted trend lines and their scores, one row per asset"""
+    slope: np.ndarray
+    intercept: np.ndarray
+    train_r2: np.ndarray
+    test_r2: np.ndarray
+    train_rmse: np.ndarray
+    test_rmse: np.ndarray
+    n_samples: int
+
+    def __len__(self) -> int:
+        return len(self.slope)
+
+    def __getitem__(self, index: int) -> "LinearTrendFit":
+        """Single-asset fit (arrays of length 1)"""
+        index = range(len(self))[index]
+        row = slice(index, index + 1)
+        return LinearTrendFit(
+            slope=self.slope[row],
+            intercept=self.intercept[row],
+            train_r2=self.train_r2[row],
+            test_r2=self.test_r2[row],
+            train_rmse=self.train_rmse[row],
+            test_rmse=self.test_rmse[row],
+            n_samples=self.n_samples,
+        )
+
+    def predict(self, days) -> np.ndarray:
+        """
+        Predicted prices at the given day indices
+
+        Returns:
+            Array of shape (assets, len(days))
+        """
+        days = np.asarray(days, dtype=float)
+        return self.intercept[:, None] + self.slope[:, None] * days[None, :]
+
+
+def fit_linear_trend(
+    prices: np.ndarray,
+    test_size: float = 0.2,
+    random_state: int = 42
+) -> LinearTrendFit:
+    """
+    Fit price = intercept + slope * day for every row of `prices`
+
+    Args:
+        prices: (days,) or (assets, days) array of historical prices
+        test_size: Fraction of days held out for the test scores
+        random_state: Seed of the shuffled train/test split
+
+    Returns:
+        LinearTrendFit with one row per asset
+    """
+    y = np.asarray(prices, dtype=float)
+    if y.ndim == 1:
+        y = y[None, :]
+    if y.ndim != 2:
+        raise ValueError(f"Expected a 1-D or 2-D price array, got shape {y.shape}")
+
+    n_samples = y.shape[1]
+    train_idx, test_idx = split_indices(n_samples, test_size, random_state)
+
+    # Closed-form least squares on the training days
+    t = train_idx.astype(float)
+    t_centered = t - t.mean()
+    y_train = y[:, train_idx]
+    y_mean = y_train.mean(axis=1)
+    slope = ((y_train - y_mean[:, None]) @ t_centered) / (t_centered @ t_centered)
+    intercept = y_mean - slope * t.mean()
+
+    def line(days):
+        return intercept[:, None] + slope[:, None] * days[None, :]
+
+    train_r2, train_rmse = _scores(y_train, line(t))
+    test_r2, test_rmse = _scores(y[:, test_idx], line(test_idx.astype(float)))
+    return LinearTrendFit(
+        slope=slope,
+        intercept=intercept,
+        train_r2=train_r2,
+        test_r2=test_r2,
+        train_rmse=train_rmse,
+        test_rmse=test_rmse,
+        n_samples=n_samples,
+    )
+
+
+class BatchPredictor:
+    """Trains the linear trend model for many assets in one pass"""
+
+    def __init__(self, test_size: float = 0.2):
+        self.test_size = test_size
+        self.asset_ids: List[str] = []
+        self.prices: Optional[np.ndarray] = None
+        self.fit: Optional[LinearTrendFit] = None
+
+    @property
+    def is_trained(self) -> bool:
+        return self.fit is not None
+
+    def train(self, prices: Dict[str, np.ndarray]):
+        """
+        Train on equal-length price histories
+
+        Args:
+            prices: Mapping of asset_id -> array of historical prices
+        """
+        lengths = {len(history) for history in prices.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"Price histories must have the same length, got {sorted(lengths)}")
+
+        self.asset_ids = list(prices)
+        self.prices = np.vstack([np.asarray(history, dtype=float) for history in prices.values()])
+        self.fit = fit_linear_trend(self.prices, test_size=self.test_size)
+        logger.info(f"✅ Trained {len(self.asset_ids)} models on {self.prices.shape[1]} days")
+
+    def predict_next_day(self) -> Dict[str, float]:
+        """Next-day prediction for every asset"""
+        self._check_trained()
+        predictions = self.fit.predict([self.fit.n_samples])[:, 0]
+        return dict(zip(self.asset_ids, predictions.tolist()))
+
+    def get_confidence(self) -> Dict[str, float]:
+        """Test R² clamped to 0-1 for every asset"""
+        self._check_trained()
+        return {
+            asset_id: max(0.0, min(1.0, score))
+            for asset_id, score in zip(self.asset_ids, self.fit.test_r2.tolist())
+        }
+
+    def predictors(self, asset_ids: Optional[Iterable[str]] = None) -> Dict:
+        """Per-asset Predictor views sharing this batch fit"""
+        from src.ml.predictor import Predictor
+
+        self._check_trained()
+        wanted = set(asset_ids) if asset_ids is not None else None
+        result = {}
+        for i, asset_id in enumerate(self.asset_ids):
+            if wanted is None or asset_id in wanted:
+                result[asset_id] = Predictor.from_fit(self.fit[i], self.prices[i])
+        return result
+
+    def _check_trained(self):
+        if not self.is_trained:
+            raise ValueError("Model not trained yet. Call train() first.")
@@ -4,7 +4,9 @@ Predicts optimal gas fees for Ethereum transactions
 """
 
 import asyncio
-from typing import Dict, List, Tuple
+import json
+import os
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 from datetime import datetime, timedelta
 from sklearn.ensemble import RandomForestRegressor
@@ -21,6 +23,8 @@ class GasFeesPredictor:
         self.model = RandomForestRegressor(n_estimators=100, random_state=42)
         self.is_trained = False
         self.historical_data = []
+        self.train_score = None
+        self.data_range = None
     
     async def fetch_gas_history(self, hours: int = 24) -> List[Dict]:
         """
@@ -155,9 +159,58 @@ class GasFeesPredictor:
         # Evaluate
         score = self.model.score(X, y)
         
+        timestamps = [point['timestamp'] for point in gas_data]
+        self.train_score = float(score)
+        self.data_range = {
+            'start': datetime.fromtimestamp(min(timestamps)).isoformat(),
+            'end': datetime.fromtimestamp(max(timestamps)).isoformat(),
+            'points': len(gas_data)
+        }
+        
         logger.info(f"✅ Model trained with R² score: {score:.4f}")
         self.is_trained = True
     
+    def save_artifact(self, directory: str) -> Dict:
+        """
+        Write the trained forest into `directory` (see model_store)
+        
+        Returns:
+            Metadata: training data range and metrics
+        """
+        import joblib
+        
+        if not self.is_trained:
+            raise ValueError("Model not trained yet. Call train() first.")
+        
+        # Uncompressed so the tree arrays can be memory-mapped on load
+        joblib.dump(self.model, os.path.join(directory, "model.joblib"))
+        return {
+            'data_range': self.data_range,
+            'metrics': {'train_r2': self.train_score},
+            'n_estimators': self.model.n_estimators
+        }
+    
+    @classmethod
+    def load_artifact(cls, directory: str, mmap_mode: Optional[str] = 'r') -> "GasFeesPredictor":
+        """
+        Restore a model written by save_artifact
+        
+        Args:
+            directory: Artifact directory
+            mmap_mode: joblib mmap mode for the tree arrays (None reads them)
+        """
+        import joblib
+        
+        with open(os.path.join(directory, "metadata.json")) as f:
+            metadata = json.load(f)
+        
+        predictor = cls()
+        predictor.model = joblib.load(os.path.join(directory, "model.joblib"), mmap_mode=mmap_mode)
+        predictor.train_score = metadata['metrics']['train_r2']
+        predictor.data_range = metadata['data_range']
+        predictor.is_trained = True
+        return predictor
+    
     def predict_gas_fee(
         self,
         current_fee: float,
@@ -0,0 +1,170 @@
+"""
+Incremental Linear Regression - O(1) trend updates per new price
+
+Keeps the weighted sufficient statistics of a price-vs-day regression
+(total weight, means and central co-moments) and updates them one point
+at a time, so a new tick never requires a pass over the history:
+- Fixed window: the oldest point leaves the fit when a new one arrives
+- Exponential decay: every existing point's weight is multiplied by
+  `decay` per new point (recursive least squares with a forgetting factor)
+
+Both give the same slope/intercept as a full weighted least-squares refit
+over the same points and weights. Co-moments are updated with the
+weighted Welford recurrences, which avoid the cancellation of raw
+sum-of-squares formulas; the fixed window is additionally recomputed
+from its buffer once per `window` updates (amortized O(1)) so rounding
+from removals cannot accumulate.
+"""
+
+from collections import deque
+from typing import Deque, Iterable, Optional, Tuple
+
+import numpy as np
+
+
+class IncrementalTrend:
+    """Online fit of price = intercept + slope * day"""
+
+    def __init__(self, window: Optional[int] = None, decay: float = 1.0):
+        """
+        Args:
+            window: Keep only the last `window` points (None = unbounded)
+            decay: Forgetting factor in (0, 1]; 1.0 weights all points equally
+        """
+        if window is not None and window < 2:
+            raise ValueError("window must be at least 2")
+        if not 0.0 < decay <= 1.0:
+            raise ValueError("decay must be in (0, 1]")
+
+        self.window = window
+        self.decay = decay
+        self.next_day = 0
+        self._count = 0
+        self._points: Deque[Tuple[float, float]] = deque()
+        self._updates_since_resync = 0
+        self._reset()
+
+    def _reset(self):
+        self.weight = 0.0
+        self.mean_t = 0.0
+        self.mean_y = 0.0
+        self.c_tt = 0.0
+        self.c_ty = 0.0
+        self.c_yy = 0.0
+
+    @property
+    def count(self) -> int:
+        """Points currently in the fit"""
+        return self._count if self.window is None else min(self._count, self.window)
+
+    def fit(self, prices: Iterable[float]) -> "IncrementalTrend":
+        """Seed from a price history (days 0..n-1); replaces the current state"""
+        self.next_day = 0
+        self._count = 0
+        self._points.clear()
+        self._reset()
+        for price in prices:
+            self.update(price)
+        return self
+
+    def update(self, price: float):
+        """Add the price of the next day"""
+        t, y = float(self.next_day), float(price)
+        self.next_day += 1
+        self._count += 1
+
+        if self.decay < 1.0:
+            self.weight *= self.decay
+            self.c_tt *= self.decay
+            self.c_ty *= self.decay
+            self.c_yy *= self.decay
+
+        if self.window is not None:
+            self._points.append((t, y))
+            if len(self._points) > self.window:
+                old_t, old_y = self._points.popleft()
+                self._remove(old_t, old_y, self.decay ** self.window)
+            self._updates_since_resync += 1
+            if self._updates_since_resync >= self.window:
+                self._resync()
+
+        self._add(t, y, 1.0)
+
+    def _add(self, t: float, y: float, w: float):
+        self.weight += w
+        dt, dy = t - self.mean_t, y - self.mean_y
+        self.mean_t += w / self.weight * dt
+        self.mean_y += w / self.weight * dy
+        self.c_tt += w * dt * (t - self.mean_t)
+        self.c_ty += w * dt * (y - self.mean_y)
+        self.c_yy += w * dy * (y - self.mean_y)
+
+    def _remove(self, t: float, y: float, w: float):
+        remaining = self.weight - w
+        if remaining <= 0.0:
+            self._reset()
+            return
+        old_mean_t, old_mean_y = self.mean_t, self.mean_y
+        self.mean_t = (self.weight * old_mean_t - w * t) / remaining
+        self.mean_y = (self.weight * old_mean_y - w * y) / remaining
+        self.c_tt -= w * (t - self.mean_t) * (t - old_mean_t)
+        self.c_ty -= w * (t - self.mean_t) * (y - old_mean_y)
+        self.c_yy -= w * (y - self.mean_y) * (y - old_mean_y)
+        self.weight = remaining
+
+    def _resync(self):
+        """Recompute the statistics exactly from the window buffer"""
+        # The newest point is added by update() right after this call
+        points = list(self._points)[:-1]
+        self._updates_since_resync = 0
+        self._reset()
+        for age, (t, y) in enumerate(reversed(points), start=1):
+            self._add(t, y, self.decay ** age)
+
+    _STATE = ('window', 'decay', 'next_day', '_count', '_updates_since_resync',
+              'weight', 'mean_t', 'mean_y', 'c_tt', 'c_ty', 'c_yy')
+
+    def get_state(self) -> dict:
+        """JSON-serializable snapshot of the fit (restore with from_state)"""
+        state = {name: getattr(self, name) for name in self._STATE}
+        state['points'] = [list(point) for point in self._points]
+        return state
+
+    @classmethod
+    def from_state(cls, state: dict) -> "IncrementalTrend":
+        trend = cls(window=state['window'], decay=state['decay'])
+        for name in cls._STATE:
+            setattr(trend, name, state[name])
+        trend._points.extend(tuple(point) for point in state['points'])
+        return trend
+
+    @property
+    def slope(self) -> float:
+        if self.c_tt <= 0.0:
+            return 0.0
+        return self.c_ty / self.c_tt
+
+    @property
+    def intercept(self) -> float:
+        return self.mean_y - self.slope * self.mean_t
+
+    @property
+    def r2(self) -> float:
+        """Weighted in-sample R² (sklearn conventions for constant prices)"""
+        if self.c_yy <= 0.0:
+            return 1.0
+        if self.c_tt <= 0.0:
+            return 0.0
+        return max(0.0, min(1.0, self.c_ty ** 2 / (self.c_tt * self.c_yy)))
+
+    @property
+    def rmse(self) -> float:
+        """Weighted in-sample root mean squared error"""
+        if self.weight <= 0.0:
+            return 0.0
+        residual = self.c_yy - (self.c_ty ** 2 / self.c_tt if self.c_tt > 0.0 else 0.0)
+        return float(np.sqrt(max(residual, 0.0) / self.weight))
+
+    def predict(self, days) -> np.ndarray:
+        """Predicted prices at the given day indices"""
+        return self.intercept + self.slope * np.asarray(days, dtype=float)
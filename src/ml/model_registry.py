@@ -0,0 +1,307 @@
+"""
+Model Registry - In-memory cache of trained predictors
+
+Trained models are kept per (asset_id, days_back, model_version) so that a
+prediction request only has to run inference:
+- Entries younger than `refresh_after` are served as-is
+- Older entries are still served while a single background retrain
+  replaces them (stale-while-revalidate)
+- Entries older than `ttl` are evicted; the next request trains in the
+  foreground, with concurrent requests for the same key sharing one fit
+- At most `max_entries` models are kept (least recently used evicted)
+
+Invalidation is age-based only: nothing pushes "new data" into this
+process, and every retrain pulls the latest price history, so
+`refresh_after` (MODEL_UPDATE_INTERVAL) is the cadence at which new data
+reaches the served models. invalidate() drops models explicitly.
+
+With MODEL_STORE_DIR set, the default loader also persists fits through
+model_store, so a restarted process maps recent models instead of
+retraining them. train_gas_predictor applies the same policy to the
+gas-fees forest, serving the published artifact through WatchedModel.
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.utils.config import settings
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MODEL_VERSION = "v2.0-linear"
+GAS_MODEL_NAME = "gas-fees"
+
+ModelKey = Tuple[str, int, str]
+ModelLoader = Callable[[str, int], Awaitable[Any]]
+
+
+def _artifact_name(asset_id: str, days_back: int) -> str:
+    return f"predictor-{asset_id}-{days_back}d"
+
+
+_store = None
+
+
+def _model_store():
+    """Shared ModelStore, or None when MODEL_STORE_DIR is unset"""
+    global _store
+    if _store is None and settings.MODEL_STORE_DIR:
+        from src.ml.model_store import ModelStore
+        _store = ModelStore()
+    return _store
+
+
+def _load_fresh_artifact(store, name: str):
+    try:
+        metadata = store.metadata(name)
+        if metadata.get('model_version') != MODEL_VERSION:
+            return None
+        if time.time() - metadata.get('created_ts', 0) >= settings.MODEL_UPDATE_INTERVAL:
+            return None
+        predictor, _ = store.load(name, metadata['version'])
+        logger.info(f"📦 Loaded {name} v{metadata['version']} from model store")
+        return predictor
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"⚠️ Could not load model {name}: {e}")
+        return None
+
+
+async def train_predictor(asset_id: str, days_back: int):
+    """
+    Default loader: fetch price history and fit a Predictor off the event loop
+
+    When MODEL_STORE_DIR is set, an artifact of the same model version
+    younger than MODEL_UPDATE_INTERVAL is loaded instead (warm start, or a
+    model published by another worker), and every new fit is saved.
+    """
+    from src.ml.data_collector import DataCollector
+    from src.ml.predictor import Predictor
+    from src.ml.training_executor import training_executor
+
+    store = _model_store()
+    name = _artifact_name(asset_id, days_back)
+    # Artifact reads/writes are blocking disk I/O: keep them off the event loop
+    loop = asyncio.get_running_loop()
+    if store is not None:
+        predictor = await loop.run_in_executor(None, _load_fresh_artifact, store, name)
+        if predictor is not None:
+            return predictor
+
+    prices = await DataCollector().fetch_asset_data(asset_id, days=days_back)
+    predictor = await training_executor.fit(Predictor(), prices)
+
+    if store is not None:
+        metadata = {
+            'model_version': MODEL_VERSION,
+            'asset_id': asset_id,
+            'data_range': {
+                'days_back': days_back,
+                'end': datetime.now().isoformat(),
+                'points': len(prices)
+            }
+        }
+        try:
+            await loop.run_in_executor(None, functools.partial(store.save, name, predictor, metadata))
+        except Exception as e:
+            logger.warning(f"⚠️ Could not save model {name}: {e}")
+    return predictor
+
+
+_gas_watch = None
+_gas_model: Optional[Tuple[Any, float]] = None  # (predictor, time.time() of the fit)
+
+
+def _stored_gas_predictor(store):
+    """Published gas model if younger than MODEL_UPDATE_INTERVAL (blocking I/O)"""
+    global _gas_watch
+    if _gas_watch is None or _gas_watch.store is not store:
+        from src.ml.model_store import WatchedModel
+        _gas_watch = WatchedModel(store, GAS_MODEL_NAME)
+    predictor = _gas_watch.get()
+    if predictor is None:
+        return None
+    if time.time() - _gas_watch.metadata.get('created_ts', 0) >= settings.MODEL_UPDATE_INTERVAL:
+        return None
+    return predictor
+
+
+async def train_gas_predictor(gas_data: List[Dict]):
+    """
+    Trained GasFeesPredictor, refit on `gas_data` at most every MODEL_UPDATE_INTERVAL
+
+    With MODEL_STORE_DIR set, the latest published artifact (from a previous
+    run or another process) is served through WatchedModel and every new fit
+    is published; otherwise the last fit is reused in memory.
+    """
+    from src.ml.gas_fees_predictor import GasFeesPredictor
+    from src.ml.training_executor import training_executor
+
+    global _gas_model
+    store = _model_store()
+    loop = asyncio.get_running_loop()
+    if store is not None:
+        predictor = await loop.run_in_executor(None, _stored_gas_predictor, store)
+        if predictor is not None:
+            return predictor
+    elif _gas_model is not None and time.time() - _gas_model[1] < settings.MODEL_UPDATE_INTERVAL:
+        return _gas_model[0]
+
+    predictor = await training_executor.fit(GasFeesPredictor(), gas_data)
+    _gas_model = (predictor, time.time())
+
+    if store is not None:
+        try:
+            await loop.run_in_executor(None, store.save, GAS_MODEL_NAME, predictor)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not save model {GAS_MODEL_NAME}: {e}")
+    return predictor
+
+
+class _Entry:
+    __slots__ = ('model', 'trained_at', 'refresh')
+
+    def __init__(self, model: Any, trained_at: float):
+        self.model = model
+        self.trained_at = trained_at
+        self.refresh: Optional[asyncio.Task] = None
+
+
+class ModelRegistry:
+    """LRU + TTL cache of trained models with background refresh"""
+
+    def __init__(
+        self,
+        loader: ModelLoader = train_predictor,
+        model_version: str = MODEL_VERSION,
+        ttl: Optional[float] = None,
+        refresh_after: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            loader: Coroutine (asset_id, days_back) -> trained model
+            model_version: Version tag stored in the cache key
+            ttl: Max model age in seconds before it is no longer served
+            refresh_after: Model age in seconds that triggers a background retrain
+            max_entries: Max number of cached models
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.loader = loader
+        self.model_version = model_version
+        self.ttl = ttl if ttl is not None else settings.MODEL_CACHE_TTL_SECONDS
+        self.refresh_after = refresh_after if refresh_after is not None else settings.MODEL_UPDATE_INTERVAL
+        self.max_entries = max_entries if max_entries is not None else settings.MODEL_CACHE_MAX_ENTRIES
+        self.clock = clock
+
+        self._entries: "OrderedDict[ModelKey, _Entry]" = OrderedDict()
+        self._inflight: Dict[ModelKey, asyncio.Task] = {}
+        self.stats = {'hits': 0, 'misses': 0, 'refreshes': 0, 'evictions': 0, 'errors': 0}
+
+    def key(self, asset_id: str, days_back: int) -> ModelKey:
+        return (asset_id, days_back, self.model_version)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: ModelKey) -> bool:
+        return key in self._entries
+
+    async def get(self, asset_id: str, days_back: int) -> Any:
+        """
+        Trained model for an asset, training it if needed
+
+        Raises:
+            Whatever the loader raises when no cached model can be served
+        """
+        key = self.key(asset_id, days_back)
+        entry = self._entries.get(key)
+        now = self.clock()
+
+        if entry is not None:
+            age = now - entry.trained_at
+            if age < self.ttl:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                if age >= self.refresh_after and entry.refresh is None:
+                    entry.refresh = asyncio.ensure_future(self._refresh(key, entry))
+                return entry.model
+            self._evict(key)
+
+        self.stats['misses'] += 1
+        return await self._load(key)
+
+    def invalidate(self, asset_id: Optional[str] = None):
+        """Drop cached models (all, or every variant of one asset)"""
+        for key in [k for k in self._entries if asset_id is None or k[0] == asset_id]:
+            self._evict(key)
+
+    async def close(self):
+        """Cancel pending foreground fits and background retrains"""
+        tasks = [entry.refresh for entry in self._entries.values() if entry.refresh is not None]
+        tasks.extend(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _load(self, key: ModelKey) -> Any:
+        # Single-flight: concurrent misses for a key share one fit, run in its
+        # own task; shield: a cancelled caller does not cancel the shared fit
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fit(key))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._clear_inflight, key))
+        return await asyncio.shield(task)
+
+    async def _fit(self, key: ModelKey) -> Any:
+        try:
+            model = await self.loader(key[0], key[1])
+        except Exception:
+            self.stats['errors'] += 1
+            raise
+        self._store(key, model)
+        return model
+
+    def _clear_inflight(self, key: ModelKey, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the error retrieved when every caller was cancelled
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Fit for {key[0]} ({key[1]}d) failed: {task.exception()}")
+
+    async def _refresh(self, key: ModelKey, entry: _Entry):
+        try:
+            model = await self.loader(key[0], key[1])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Keep serving the previous model until it expires
+            self.stats['errors'] += 1
+            logger.warning(f"⚠️ Background retrain failed for {key[0]} ({key[1]}d): {e}")
+            return
+        finally:
+            entry.refresh = None
+
+        self.stats['refreshes'] += 1
+        if self._entries.get(key) is entry:
+            self._store(key, model)
+
+    def _store(self, key: ModelKey, model: Any):
+        self._entries[key] = _Entry(model, self.clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: ModelKey):
+        entry = self._entries.pop(key)
+        if entry.refresh is not None:
+            entry.refresh.cancel()
+        self.stats['evictions'] += 1
@@ -0,0 +1,232 @@
+"""
+Model Store - Versioned on-disk model artifacts
+
+Layout (one directory per model name):
+
+    <root>/<name>/v000001/metadata.json   model class, metrics, data range
+    <root>/<name>/v000001/...             files written by the model
+    <root>/<name>/LATEST                  version currently published
+
+Publishing is atomic: the artifact is written to a temporary directory,
+renamed into place, and only then is LATEST replaced (os.replace), so a
+reader never sees a partial artifact. Models implement
+
+    save_artifact(directory) -> dict   (extra metadata)
+    load_artifact(directory, mmap_mode) -> model   (classmethod)
+
+and store their arrays as .npy/joblib files that can be memory-mapped on
+load, so a process start maps the model instead of retraining it.
+WatchedModel serves the latest artifact and swaps in newer ones as they
+are published.
+"""
+
+import importlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.config import settings
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ARTIFACT_FORMAT = 1
+METADATA_FILE = "metadata.json"
+LATEST_FILE = "LATEST"
+
+_VERSION_DIR = re.compile(r"^v(\d{6})$")
+_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+# Only model classes from this package can be instantiated from metadata
+_ALLOWED_MODULE_PREFIX = "src.ml."
+
+
+class ModelStore:
+    """Versioned model artifacts under a root directory"""
+
+    def __init__(self, root: Optional[str] = None, keep_versions: Optional[int] = None):
+        """
+        Args:
+            root: Store directory (defaults to MODEL_STORE_DIR)
+            keep_versions: Versions kept per model when publishing (older are pruned)
+        """
+        root = root or settings.MODEL_STORE_DIR
+        if not root:
+            raise ValueError("ModelStore requires a root directory (MODEL_STORE_DIR)")
+        self.root = root
+        self.keep_versions = keep_versions if keep_versions is not None else settings.MODEL_STORE_KEEP_VERSIONS
+        self._lock = threading.Lock()
+
+    def _model_dir(self, name: str) -> str:
+        if not _NAME.match(name):
+            raise ValueError(f"Invalid model name: {name!r}")
+        return os.path.join(self.root, name)
+
+    def _version_dir(self, name: str, version: int) -> str:
+        return os.path.join(self._model_dir(name), f"v{version:06d}")
+
+    def versions(self, name: str) -> List[int]:
+        """Published and unpublished artifact versions on disk, ascending"""
+        try:
+            entries = os.listdir(self._model_dir(name))
+        except FileNotFoundError:
+            return []
+        return sorted(int(m.group(1)) for m in map(_VERSION_DIR.match, entries) if m)
+
+    def latest_version(self, name: str) -> Optional[int]:
+        """Version currently published for `name` (None if never published)"""
+        try:
+            with open(os.path.join(self._model_dir(name), LATEST_FILE)) as f:
+                return int(f.read().strip())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def save(self, name: str, model: Any, metadata: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Write and publish a new artifact version
+
+        Args:
+            name: Model name (e.g. "predictor-bitcoin-30d")
+            model: Object implementing save_artifact(directory)
+            metadata: Extra metadata (e.g. training data range)
+
+        Returns:
+            Published version number
+        """
+        model_dir = self._model_dir(name)
+        os.makedirs(model_dir, exist_ok=True)
+
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=model_dir)
+        try:
+            info = {
+                'format': ARTIFACT_FORMAT,
+                'name': name,
+                'class': f"{type(model).__module__}:{type(model).__qualname__}",
+                'created_at': datetime.now().isoformat(),
+                'created_ts': time.time(),
+            }
+            info.update(model.save_artifact(staging) or {})
+            info.update(metadata or {})
+
+            with self._lock:
+                # Another process may claim the same version number first
+                for attempt in range(3):
+                    version = max(self.versions(name) + [self.latest_version(name) or 0]) + 1
+                    info['version'] = version
+                    with open(os.path.join(staging, METADATA_FILE), 'w') as f:
+                        json.dump(info, f, indent=2, default=str)
+                    try:
+                        os.rename(staging, self._version_dir(name, version))
+                        break
+                    except OSError:
+                        if attempt == 2:
+                            raise
+                self._publish(model_dir, version)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        logger.info(f"💾 Saved model {name} v{version}")
+        self.prune(name)
+        return version
+
+    @staticmethod
+    def _publish(model_dir: str, version: int):
+        fd, tmp = tempfile.mkstemp(prefix=".latest-", dir=model_dir)
+        with os.fdopen(fd, 'w') as f:
+            f.write(f"{version}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, os.path.join(model_dir, LATEST_FILE))
+
+    def metadata(self, name: str, version: Optional[int] = None) -> Dict[str, Any]:
+        """Metadata of a version (latest by default) without loading the model"""
+        version = version if version is not None else self.latest_version(name)
+        if version is None:
+            raise FileNotFoundError(f"No published artifact for {name}")
+        with open(os.path.join(self._version_dir(name, version), METADATA_FILE)) as f:
+            return json.load(f)
+
+    def load(self, name: str, version: Optional[int] = None, mmap: bool = True) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Load an artifact (latest by default)
+
+        Args:
+            mmap: Memory-map stored arrays (read-only) instead of reading them
+
+        Returns:
+            (model, metadata)
+
+        Raises:
+            FileNotFoundError: Nothing published for `name`
+            ValueError: Unknown artifact format or model class
+        """
+        info = self.metadata(name, version)
+        if info.get('format') != ARTIFACT_FORMAT:
+            raise ValueError(f"Unsupported artifact format {info.get('format')} for {name}")
+
+        module_name, _, qualname = info['class'].partition(':')
+        if not module_name.startswith(_ALLOWED_MODULE_PREFIX):
+            raise ValueError(f"Refusing to load model class {info['class']}")
+        cls = getattr(importlib.import_module(module_name), qualname)
+
+        model = cls.load_artifact(self._version_dir(name, info['version']), mmap_mode='r' if mmap else None)
+        return model, info
+
+    def prune(self, name: str, keep: Optional[int] = None):
+        """Delete all but the newest `keep` versions (never the published one)"""
+        keep = keep if keep is not None else self.keep_versions
+        if not keep:
+            return
+        latest = self.latest_version(name)
+        for version in self.versions(name)[:-keep]:
+            if version != latest:
+                shutil.rmtree(self._version_dir(name, version), ignore_errors=True)
+
+
+class WatchedModel:
+    """
+    Latest published artifact of one model, reloaded when a newer one appears
+
+    The model is loaded lazily on first get(); afterwards LATEST is checked at
+    most every `check_interval` seconds and a newer version is swapped in
+    with a single reference assignment, so callers holding the previous model
+    keep a consistent object.
+    """
+
+    def __init__(self, store: ModelStore, name: str, check_interval: float = 5.0, mmap: bool = True):
+        self.store = store
+        self.name = name
+        self.check_interval = check_interval
+        self.mmap = mmap
+        self.model: Any = None
+        self.metadata: Dict[str, Any] = {}
+        self.version: Optional[int] = None
+        self._checked_at = float('-inf')
+
+    def get(self) -> Any:
+        """
+        Current model (None if nothing has been published yet)
+
+        A newer artifact that fails to load is logged and skipped; the
+        previous model keeps being served.
+        """
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return self.model
+        self._checked_at = now
+
+        latest = self.store.latest_version(self.name)
+        if latest is not None and latest != self.version:
+            try:
+                self.model, self.metadata = self.store.load(self.name, latest, mmap=self.mmap)
+                self.version = latest
+                logger.info(f"🔄 Loaded model {self.name} v{latest}")
+            except Exception as e:
+                logger.warning(f"⚠️ Could not load model {self.name} v{latest}: {e}")
+        return self.model
@@ -1,11 +1,19 @@
 """
 ML Predictor - Trains models and makes predictions
+
+Single-asset view over the closed-form trend fit in batch_regression; use
+BatchPredictor to train many assets at once. With `window` or `decay` set
+the predictor runs in incremental mode (incremental_regression): train()
+seeds the fit and update() adds one new price in O(1).
 """
 
+import json
+import os
+from typing import Optional
+
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score
+from src.ml.batch_regression import LinearTrendFit, fit_linear_trend
+from src.ml.incremental_regression import IncrementalTrend
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -14,13 +22,25 @@ logger = setup_logger(__name__)
 class Predictor:
     """Machine Learning predictor for crypto prices"""
     
-    def __init__(self):
-        self.model = LinearRegression()
+    def __init__(self, window: Optional[int] = None, decay: Optional[float] = None):
+        """
+        Args:
+            window: Incremental mode, fit only the last `window` prices
+            decay: Incremental mode, per-day forgetting factor in (0, 1]
+        """
+        self.model: LinearTrendFit = None
+        self.online: Optional[IncrementalTrend] = None
+        if window is not None or decay is not None:
+            self.online = IncrementalTrend(window=window, decay=decay if decay is not None else 1.0)
         self.is_trained = False
         self.train_score = None
         self.test_score = None
         self.prices = None
     
+    @property
+    def incremental(self) -> bool:
+        return self.online is not None
+    
     def train(self, prices: np.ndarray, test_size: float = 0.2):
         """
         Train the prediction model
@@ -31,33 +51,126 @@ class Predictor:
         """
         logger.info("Training ML model...")
         
-        # Prepare features (days) and targets (prices)
         self.prices = prices
-        dates = np.arange(len(prices)).reshape(-1, 1)
+        if self.incremental:
+            # No hold-out split: scores are the in-sample fit of the window
+            self.online.fit(prices)
+            self.train_score = self.test_score = self.online.r2
+            logger.info(f"✅ Incremental model seeded on {self.online.count} prices, "
+                        f"R²: {self.train_score:.4f}, RMSE: ${self.online.rmse:.2f}")
+            self.is_trained = True
+            return
         
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            dates, prices, test_size=test_size, random_state=42
-        )
+        self.model = fit_linear_trend(prices, test_size=test_size)
         
-        # Train model
-        self.model.fit(X_train, y_train)
+        self.train_score = float(self.model.train_r2[0])
+        self.test_score = float(self.model.test_r2[0])
         
-        # Evaluate
-        train_pred = self.model.predict(X_train)
-        test_pred = self.model.predict(X_test)
+        logger.info(f"✅ Model trained successfully")
+        logger.info(f"Train R²: {self.train_score:.4f}, RMSE: ${self.model.train_rmse[0]:.2f}")
+        logger.info(f"Test R²: {self.test_score:.4f}, RMSE: ${self.model.test_rmse[0]:.2f}")
         
-        self.train_score = r2_score(y_train, train_pred)
-        self.test_score = r2_score(y_test, test_pred)
+        self.is_trained = True
+    
+    def update(self, price: float):
+        """
+        Add the next day's price without retraining (incremental mode)
         
-        train_rmse = np.sqrt(mean_squared_error(y_train, train_pred))
-        test_rmse = np.sqrt(mean_squared_error(y_test, test_pred))
+        Args:
+            price: Price observed for the day after the last one seen
+        """
+        if not self.incremental:
+            raise ValueError("update() requires incremental mode (window or decay)")
+        if not self.is_trained:
+            raise ValueError("Model not trained yet. Call train() first.")
         
-        logger.info(f"✅ Model trained successfully")
-        logger.info(f"Train R²: {self.train_score:.4f}, RMSE: ${train_rmse:.2f}")
-        logger.info(f"Test R²: {self.test_score:.4f}, RMSE: ${test_rmse:.2f}")
+        self.online.update(price)
+        self.train_score = self.test_score = self.online.r2
+    
+    def save_artifact(self, directory: str) -> dict:
+        """
+        Write the trained model into `directory` (see model_store)
         
-        self.is_trained = True
+        Returns:
+            Metadata: sample count, metrics and the state needed to reload
+        """
+        if not self.is_trained:
+            raise ValueError("Model not trained yet. Call train() first.")
+        
+        prices = np.asarray(self.prices, dtype=float)
+        np.save(os.path.join(directory, "prices.npy"), prices)
+        
+        metadata = {
+            'n_samples': int(len(prices)),
+            'metrics': {'train_r2': self.train_score, 'test_r2': self.test_score},
+        }
+        if self.incremental:
+            metadata['online'] = self.online.get_state()
+            metadata['metrics']['rmse'] = self.online.rmse
+        else:
+            metadata['fit'] = {
+                field: float(getattr(self.model, field)[0])
+                for field in ('slope', 'intercept', 'train_r2', 'test_r2', 'train_rmse', 'test_rmse')
+            }
+            metadata['metrics'].update(train_rmse=metadata['fit']['train_rmse'], test_rmse=metadata['fit']['test_rmse'])
+        return metadata
+    
+    @classmethod
+    def load_artifact(cls, directory: str, mmap_mode: Optional[str] = 'r') -> "Predictor":
+        """
+        Restore a model written by save_artifact
+        
+        Args:
+            directory: Artifact directory
+            mmap_mode: np.load mmap mode for the price history (None reads it)
+        """
+        with open(os.path.join(directory, "metadata.json")) as f:
+            metadata = json.load(f)
+        prices = np.load(os.path.join(directory, "prices.npy"), mmap_mode=mmap_mode)
+        
+        if 'online' in metadata:
+            predictor = cls()
+            predictor.online = IncrementalTrend.from_state(metadata['online'])
+            predictor.prices = prices
+            predictor.train_score = metadata['metrics']['train_r2']
+            predictor.test_score = metadata['metrics']['test_r2']
+            predictor.is_trained = True
+            return predictor
+        
+        fit = LinearTrendFit(
+            **{field: np.array([value]) for field, value in metadata['fit'].items()},
+            n_samples=metadata['n_samples']
+        )
+        return cls.from_fit(fit, prices)
+    
+    def _predict(self, days: np.ndarray) -> np.ndarray:
+        if self.incremental:
+            return self.online.predict(days)
+        return self.model.predict(days)[0]
+    
+    @property
+    def _next_day(self) -> int:
+        return self.online.next_day if self.incremental else len(self.prices)
+    
+    @classmethod
+    def from_fit(cls, fit: LinearTrendFit, prices: np.ndarray) -> "Predictor":
+        """
+        Wrap an existing single-asset fit (e.g. one row of a BatchPredictor)
+        
+        Args:
+            fit: LinearTrendFit with exactly one row
+            prices: Price history the fit was trained on
+        """
+        if len(fit) != 1:
+            raise ValueError(f"Expected a single-asset fit, got {len(fit)} rows")
+        
+        predictor = cls()
+        predictor.model = fit
+        predictor.prices = prices
+        predictor.train_score = float(fit.train_r2[0])
+        predictor.test_score = float(fit.test_r2[0])
+        predictor.is_trained = True
+        return predictor
     
     def predict_next_day(self) -> float:
         """
@@ -70,8 +183,7 @@ class Predictor:
             raise ValueError("Model not trained yet. Call train() first.")
         
         # Predict for day after last data point
-        next_day = np.array([[len(self.prices)]])
-        prediction = self.model.predict(next_day)[0]
+        prediction = self._predict([self._next_day])[0]
         
         logger.info(f"Predicted next day price: ${prediction:.2f}")
         
@@ -104,7 +216,7 @@ class Predictor:
         if not self.is_trained:
             raise ValueError("Model not trained yet. Call train() first.")
         
-        future_days = np.arange(len(self.prices), len(self.prices) + days).reshape(-1, 1)
-        predictions = self.model.predict(future_days)
+        future_days = np.arange(self._next_day, self._next_day + days)
+        predictions = self._predict(future_days)
         
         return predictions
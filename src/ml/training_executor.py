@@ -0,0 +1,267 @@
+"""
+Training Executor - Runs CPU-bound model fits off the event loop
+
+Fits are submitted as (model, training data); a worker process calls
+`model.train(*args)` and the trained model is sent back:
+- Process pool created lazily on first use (spawn start method, safe with
+  the logging and event-loop threads of the parent)
+- Bounded capacity: at most `max_pending` fits queued or running;
+  submitting beyond that raises TrainingQueueFull instead of queueing
+  without limit
+- Large NumPy arrays travel through shared memory instead of being
+  pickled; attributes of the trained model that still reference them are
+  re-pointed at the caller's array instead of being copied back
+- Timeouts and cancellation: a fit that has not started is cancelled; a
+  fit already running cannot be interrupted, its result is discarded and
+  it keeps its capacity slot until the worker finishes
+
+With `max_workers=0` fits run on a single background thread instead (no
+process isolation or parallelism; useful where multiprocessing is
+unavailable).
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.config import settings
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TrainingQueueFull(RuntimeError):
+    """Raised when the executor already holds `max_pending` fits"""
+
+
+class TrainingTimeout(TimeoutError):
+    """Raised when a fit does not finish within its timeout"""
+
+
+class _SharedArray:
+    """Pickle-friendly handle to an array stored in shared memory"""
+    __slots__ = ('name', 'shape', 'dtype')
+
+    def __init__(self, name: str, shape: Tuple[int, ...], dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+
+class _CallerArgument:
+    """Placeholder for a model attribute that references a shared input array"""
+    __slots__ = ('index',)
+
+    def __init__(self, index: int):
+        self.index = index
+
+
+def _attach(handle: _SharedArray) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=handle.name, track=False)
+    except TypeError:  # Python < 3.13: no track flag
+        from multiprocessing import resource_tracker
+        shm = shared_memory.SharedMemory(name=handle.name)
+        # The creating process owns (and unlinks) the segment
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+def _train_in_worker(model: Any, args: Tuple[Any, ...]) -> Any:
+    """Worker entry point: materialize shared arrays, train, strip them from the result"""
+    segments = []
+    materialized = []
+    try:
+        for arg in args:
+            if isinstance(arg, _SharedArray):
+                shm = _attach(arg)
+                segments.append(shm)
+                materialized.append(np.ndarray(arg.shape, dtype=np.dtype(arg.dtype), buffer=shm.buf))
+            else:
+                materialized.append(arg)
+
+        model.train(*materialized)
+
+        # Don't send the (caller-owned) training arrays back through the pipe
+        shared = {id(value): index for index, value in enumerate(materialized) if isinstance(args[index], _SharedArray)}
+        for name, value in list(vars(model).items()):
+            if id(value) in shared:
+                setattr(model, name, _CallerArgument(shared[id(value)]))
+        return model
+    finally:
+        materialized.clear()
+        for shm in segments:
+            try:
+                shm.close()
+            except BufferError:
+                # A model attribute still views the segment; the mapping is
+                # released once the result has been pickled and collected
+                pass
+
+
+def _train_inline(model: Any, args: Tuple[Any, ...]) -> Any:
+    model.train(*args)
+    return model
+
+
+class TrainingExecutor:
+    """Bounded process pool for model training"""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        timeout: Optional[float] = None,
+        shared_memory_min_bytes: Optional[int] = None,
+        start_method: str = "spawn"
+    ):
+        """
+        Args:
+            max_workers: Worker processes (0 = train on a thread instead)
+            max_pending: Max fits queued or running at once
+            timeout: Default per-fit timeout in seconds
+            shared_memory_min_bytes: Arrays at least this large use shared memory
+            start_method: multiprocessing start method for the workers
+        """
+        self.max_workers = max_workers if max_workers is not None else settings.TRAINING_WORKERS
+        self.max_pending = max_pending if max_pending is not None else settings.TRAINING_MAX_PENDING
+        self.timeout = timeout if timeout is not None else settings.TRAINING_TIMEOUT_SECONDS
+        self.shared_memory_min_bytes = (
+            shared_memory_min_bytes if shared_memory_min_bytes is not None
+            else settings.TRAINING_SHARED_MEMORY_MIN_BYTES
+        )
+        self.start_method = start_method
+
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.stats = {'submitted': 0, 'completed': 0, 'failed': 0, 'rejected': 0, 'timeouts': 0, 'cancelled': 0}
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                if self.max_workers == 0:
+                    self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="training")
+                    logger.info("🧵 Training thread started (process pool disabled)")
+                else:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context(self.start_method)
+                    )
+                    logger.info(f"🧵 Training pool started with {self.max_workers} workers")
+            return self._pool
+
+    def _reserve(self):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.stats['rejected'] += 1
+                raise TrainingQueueFull(f"Training queue full ({self.pending}/{self.max_pending} fits pending)")
+            self.pending += 1
+            self.stats['submitted'] += 1
+
+    def _on_done(self, segments: List[shared_memory.SharedMemory], future: Future):
+        self._unlink(segments)
+        with self._lock:
+            self.pending -= 1
+            if future.cancelled():
+                self.stats['cancelled'] += 1
+            elif future.exception() is not None:
+                self.stats['failed'] += 1
+            else:
+                self.stats['completed'] += 1
+
+    def _share(self, args: Tuple[Any, ...]) -> Tuple[Tuple[Any, ...], List[shared_memory.SharedMemory]]:
+        """Move large arrays into shared memory segments owned by this process"""
+        shipped, segments = [], []
+        try:
+            for arg in args:
+                if (isinstance(arg, np.ndarray) and not arg.dtype.hasobject
+                        and arg.nbytes >= max(self.shared_memory_min_bytes, 1)):
+                    shm = shared_memory.SharedMemory(create=True, size=arg.nbytes)
+                    segments.append(shm)
+                    np.ndarray(arg.shape, dtype=arg.dtype, buffer=shm.buf)[...] = arg
+                    shipped.append(_SharedArray(shm.name, arg.shape, arg.dtype.str))
+                else:
+                    shipped.append(arg)
+        except BaseException:
+            self._unlink(segments)
+            raise
+        return tuple(shipped), segments
+
+    @staticmethod
+    def _unlink(segments: List[shared_memory.SharedMemory]):
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+
+    async def fit(self, model: Any, *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Train `model` on `args` without blocking the event loop
+
+        Args:
+            model: Object with a train(*args) method (e.g. Predictor, GasFeesPredictor)
+            *args: Training data passed to model.train
+            timeout: Seconds to wait for the fit (defaults to the executor timeout)
+
+        Returns:
+            The trained model (a copy when trained in a worker process)
+
+        Raises:
+            TrainingQueueFull: Too many fits pending
+            TrainingTimeout: Fit did not finish in time
+        """
+        self._reserve()
+        timeout = timeout if timeout is not None else self.timeout
+
+        segments: List[shared_memory.SharedMemory] = []
+        try:
+            if self.max_workers == 0:
+                pool_future = self._get_pool().submit(_train_inline, model, args)
+            else:
+                shipped, segments = self._share(args)
+                pool_future = self._get_pool().submit(_train_in_worker, model, shipped)
+        except BaseException:
+            self._unlink(segments)
+            with self._lock:
+                self.pending -= 1
+            raise
+        # The capacity slot and shared segments are released when the fit ends
+        pool_future.add_done_callback(functools.partial(self._on_done, segments))
+        future = asyncio.wrap_future(pool_future)
+
+        try:
+            trained = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            self.stats['timeouts'] += 1
+            raise TrainingTimeout(f"{type(model).__name__} fit exceeded {timeout:.1f}s") from None
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        # Re-point attributes that referenced the shared inputs at the caller's arrays
+        for name, value in list(vars(trained).items()):
+            if isinstance(value, _CallerArgument):
+                setattr(trained, name, args[value.index])
+        return trained
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes (cancels fits that have not started)"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        try:
+            pool.shutdown(wait=wait, cancel_futures=True)
+        except TypeError:  # Python 3.8: no cancel_futures
+            pool.shutdown(wait=wait)
+
+
+# Shared by the API, dashboard and bots
+training_executor = TrainingExecutor()
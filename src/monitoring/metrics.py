@@ -34,6 +34,24 @@ ACTIVE_PREDICTORS = Gauge(
     'Number of authorized predictors on-chain'
 )
 
+SOURCE_QUOTA_HEADROOM = Gauge(
+    'oracle_source_quota_headroom_ratio',
+    'Remaining request-weight budget of a data source (0-1)',
+    ['source']
+)
+
+SOURCE_REQUESTS_SHED = Counter(
+    'oracle_source_requests_shed_total',
+    'Requests dropped locally because the source quota was exhausted',
+    ['source']
+)
+
+SOURCE_REQUESTS_THROTTLED = Counter(
+    'oracle_source_requests_throttled_total',
+    'Requests rejected by the source with HTTP 429/418',
+    ['source']
+)
+
 def metrics_endpoint():
     """Returns the latest metrics in Prometheus format"""
     return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -56,3 +74,15 @@ class MetricsManager:
     @staticmethod
     def set_blockchain_status(connected: bool):
         BLOCKCHAIN_STATUS.set(1 if connected else 0)
+
+    @staticmethod
+    def update_source_quota(source: str, headroom: float):
+        SOURCE_QUOTA_HEADROOM.labels(source=source).set(headroom)
+
+    @staticmethod
+    def log_request_shed(source: str):
+        SOURCE_REQUESTS_SHED.labels(source=source).inc()
+
+    @staticmethod
+    def log_request_throttled(source: str):
+        SOURCE_REQUESTS_THROTTLED.labels(source=source).inc()
@@ -29,6 +29,10 @@ class ResilientOracleSystem:
         self.contract_manager = ContractManager()
         self.predictions_count = 0
     
+    async def close(self):
+        """Libera recursos de rede (pool HTTP do agregador)"""
+        await self.aggregator.close()
+    
     async def generate_prediction(self, symbol: str) -> Dict[str, Any]:
         """
         Gera previsão baseada em dados de múltiplas fontes
@@ -224,7 +228,10 @@ async def main():
     # Executar ciclo de previsões
     symbols = ['BTC/USD', 'ETH/USD']
     
-    results = await oracle.run_prediction_cycle(symbols)
+    try:
+        results = await oracle.run_prediction_cycle(symbols)
+    finally:
+        await oracle.close()
     
     print("\n✅ Ciclo completo finalizado!")
     print(f"📊 {len(results)} previsões processadas")
@@ -12,6 +12,7 @@ from src.utils.logger import setup_logger
 from src.utils.config import settings
 from src.ml.data_collector import DataCollector
 from src.ml.predictor import Predictor
+from src.ml.training_executor import training_executor
 
 logger = setup_logger(__name__)
 
@@ -63,8 +64,7 @@ class TwitterBot:
             collector = DataCollector()
             data = await collector.fetch_bitcoin_data(days=30)
             
-            predictor = Predictor()
-            predictor.train(data)
+            predictor = await training_executor.fit(Predictor(), data)
             
             current_price = data[-1]
             predicted_price = predictor.predict_next_day()
@@ -131,10 +131,11 @@ Powered by AI + Blockchain
         
         try:
             from src.ml.gas_fees_predictor import GasFeesPredictor
+            from src.ml.model_registry import train_gas_predictor
             
-            predictor = GasFeesPredictor()
-            gas_data = await predictor.fetch_gas_history(hours=24)
-            predictor.train(gas_data)
+            gas_data = await GasFeesPredictor().fetch_gas_history(hours=24)
+            # Stored/recent fit when available instead of refitting the forest
+            predictor = await train_gas_predictor(gas_data)
             
             current_fee = gas_data[0]['base_fee']
             optimal = predictor.get_optimal_time(gas_data, hours_ahead=24)
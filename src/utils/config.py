@@ -24,6 +24,10 @@ class Settings(BaseSettings):
     # Environment
     ENVIRONMENT: str = Field(default="development")
     LOG_LEVEL: str = Field(default="INFO")
+    LOG_ASYNC: bool = Field(default=True)  # queue + background writer thread
+    LOG_QUEUE_SIZE: int = Field(default=10000)  # records beyond this are dropped
+    LOG_SAMPLE_INTERVAL_SECONDS: float = Field(default=10.0)  # per-call data-layer logs
+    LOG_SUMMARY_INTERVAL_SECONDS: float = Field(default=60.0)  # aggregator counters summary
     
     # Blockchain
     INFURA_API_KEY: Optional[str] = Field(default=None)
@@ -42,8 +46,80 @@ class Settings(BaseSettings):
     MIN_SOURCES: int = Field(default=2)
     MAX_DEVIATION_PERCENT: float = Field(default=5.0)
     CACHE_TTL_SECONDS: int = Field(default=30)
+    CACHE_REFRESH_AHEAD_SECONDS: float = Field(default=10.0)
+    CACHE_MAX_STALENESS_SECONDS: float = Field(default=300.0)
     REQUEST_TIMEOUT_SECONDS: int = Field(default=5)
     
+    # Price Cache (bounded LRU in memory, or Redis)
+    CACHE_BACKEND: str = Field(default="memory")  # memory | redis
+    CACHE_MAX_ENTRIES: int = Field(default=10000)
+    CACHE_MAJOR_SYMBOLS: str = Field(default="BTC/USD,ETH/USD")
+    CACHE_MAJOR_TTL_SECONDS: int = Field(default=30)
+    REDIS_URL: str = Field(default="redis://localhost:6379/0")
+    
+    # Symbol Registry (asset universe discovered from each source)
+    SYMBOL_UNIVERSE_SIZE: int = Field(default=500)
+    SYMBOL_UNIVERSE_AUTOLOAD: bool = Field(default=False)
+    
+    # Local Tick History (ticks retained per ring buffer; 0 disables)
+    TICK_HISTORY_CAPACITY: int = Field(default=2048)
+    
+    # Chainlink Price Feeds (on-chain source; enabled when CHAINLINK_RPC_URL is set)
+    CHAINLINK_RPC_URL: Optional[str] = Field(default=None)
+    CHAINLINK_FEEDS: str = Field(
+        default="BTC/USD=0xF4030086522a5bEEa4988F8cA5B36dbC97BeE88c,"
+                "ETH/USD=0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419"
+    )  # Ethereum mainnet
+    CHAINLINK_MULTICALL_ADDRESS: str = Field(default="0xcA11bde05977b3631167028862bE2a173976CA11")
+    CHAINLINK_MAX_FEED_AGE_SECONDS: float = Field(default=3600.0)
+    CHAINLINK_MAX_BLOCK_LAG: int = Field(default=5)
+    
+    # Aggregator Snapshots (warm restarts; unset disables)
+    SNAPSHOT_PATH: Optional[str] = Field(default=None)
+    SNAPSHOT_INTERVAL_SECONDS: float = Field(default=30.0)
+    
+    # Per-source Rate Limits (request weight per minute)
+    BINANCE_RATE_LIMIT_WEIGHT_PER_MINUTE: float = Field(default=6000)
+    COINGECKO_RATE_LIMIT_PER_MINUTE: float = Field(default=30)
+    COINCAP_RATE_LIMIT_PER_MINUTE: float = Field(default=200)
+    RATE_LIMIT_MAX_WAIT_SECONDS: float = Field(default=2.0)
+    
+    # Source Circuit Breaker
+    BREAKER_FAILURE_THRESHOLD: int = Field(default=3)
+    BREAKER_COOLDOWN_SECONDS: float = Field(default=5.0)
+    BREAKER_MAX_COOLDOWN_SECONDS: float = Field(default=300.0)
+    BREAKER_PROBE_TIMEOUT_SECONDS: float = Field(default=30.0)
+    
+    # Hedged Requests (tail latency)
+    HEDGE_PERCENTILE: float = Field(default=95.0)
+    HEDGE_MIN_SAMPLES: int = Field(default=20)
+    HEDGE_MIN_DELAY_MS: float = Field(default=25.0)
+    
+    # Adaptive Request Timeouts (multiple of each source's latency percentile,
+    # capped at REQUEST_TIMEOUT_SECONDS)
+    ADAPTIVE_TIMEOUT_ENABLED: bool = Field(default=True)
+    ADAPTIVE_TIMEOUT_PERCENTILE: float = Field(default=99.0)
+    ADAPTIVE_TIMEOUT_MULTIPLIER: float = Field(default=2.0)
+    ADAPTIVE_TIMEOUT_MIN_SECONDS: float = Field(default=0.5)
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES: int = Field(default=50)
+    
+    # Dynamic Source Weights (success rate and deviation from consensus)
+    SOURCE_WEIGHT_ALPHA: float = Field(default=0.05)
+    SOURCE_WEIGHT_DEVIATION_SCALE_PCT: float = Field(default=0.5)
+    SOURCE_WEIGHT_MIN: float = Field(default=0.05)
+    SOURCE_WEIGHT_MIN_SAMPLES: int = Field(default=10)
+    
+    # HTTP Connection Pool (shared by all data sources)
+    HTTP_POOL_LIMIT: int = Field(default=100)
+    HTTP_POOL_LIMIT_PER_HOST: int = Field(default=10)
+    HTTP_KEEPALIVE_SECONDS: int = Field(default=30)
+    HTTP_DNS_CACHE_TTL_SECONDS: int = Field(default=300)
+    
+    # WebSocket Streaming Sources
+    STREAM_STALE_AFTER_SECONDS: float = Field(default=10.0)
+    STREAM_RECONNECT_INITIAL_SECONDS: float = Field(default=1.0)
+    STREAM_RECONNECT_MAX_SECONDS: float = Field(default=30.0)
+    
     # IPFS
     PINATA_JWT: Optional[str] = Field(default=None)
     IPFS_ENABLED: bool = Field(default=False)
@@ -53,6 +129,20 @@ class Settings(BaseSettings):
     PREDICTION_CONFIDENCE_THRESHOLD: float = Field(default=0.7)
     SUPPORTED_ASSETS: str = Field(default="BTC,ETH,SOL")
     
+    # Trained Model Cache (retrained in the background after MODEL_UPDATE_INTERVAL)
+    MODEL_CACHE_TTL_SECONDS: float = Field(default=21600.0)
+    MODEL_CACHE_MAX_ENTRIES: int = Field(default=256)
+    
+    # Model Artifacts (versioned on-disk models for warm starts; unset disables)
+    MODEL_STORE_DIR: Optional[str] = Field(default=None)
+    MODEL_STORE_KEEP_VERSIONS: int = Field(default=3)
+    
+    # Training Executor (model fits run in worker processes; 0 workers = background thread)
+    TRAINING_WORKERS: int = Field(default=2)
+    TRAINING_MAX_PENDING: int = Field(default=16)
+    TRAINING_TIMEOUT_SECONDS: float = Field(default=60.0)
+    TRAINING_SHARED_MEMORY_MIN_BYTES: int = Field(default=65536)
+    
     # API Settings
     API_HOST: str = Field(default="0.0.0.0")
     API_PORT: int = Field(default=8000)
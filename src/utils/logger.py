@@ -1,46 +1,165 @@
 """
 Logging configuration with structured logging
+
+Records are handed to a bounded in-memory queue and written to stdout by a
+single background listener thread, so logging calls on hot paths never
+block on I/O or message formatting. Set LOG_ASYNC=false to write
+synchronously (e.g. short-lived scripts).
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Tuple
+
 from pythonjsonlogger import jsonlogger
 from src.utils.config import settings
 
+_listener: Optional[QueueListener] = None
+_queue: Optional[queue.Queue] = None
+_lock = threading.Lock()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks the caller
+
+    Records are enqueued unformatted (formatting happens on the listener
+    thread); when the queue is full the record is dropped and counted.
+    Arguments should therefore be immutable values (numbers, strings).
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Lets through at most one record per (logger, message template) every
+    `interval` seconds for levels below WARNING
+
+    The next record let through reports how many were suppressed. Templates
+    are kept in emission order: expired ones with nothing suppressed are
+    dropped, and at most `max_templates` are tracked (oldest evicted), so
+    messages formatted before logging cannot grow the table without bound.
+    """
+
+    def __init__(self, interval: float, max_templates: int = 1024):
+        super().__init__()
+        self.interval = interval
+        self.max_templates = max_templates
+        self._last: "OrderedDict[Tuple[str, str], Tuple[float, int]]" = OrderedDict()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        last, suppressed = self._last.get(key, (float('-inf'), 0))
+        if now - last < self.interval:
+            self._last[key] = (last, suppressed + 1)
+            return False
+
+        self._last[key] = (now, 0)
+        self._last.move_to_end(key)
+        self._prune(now)
+        if suppressed:
+            record.msg = f"{record.msg} [+{suppressed} similar suppressed]"
+        return True
+
+    def _prune(self, now: float):
+        while self._last:
+            key, (last, suppressed) = next(iter(self._last.items()))
+            if len(self._last) <= self.max_templates and (suppressed or now - last < self.interval):
+                break
+            del self._last[key]
+
+
+def _build_formatter() -> logging.Formatter:
+    # JSON formatter for production, simple for development
+    if settings.ENVIRONMENT == "production":
+        return jsonlogger.JsonFormatter(
+            fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+    return logging.Formatter(
+        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+
+
+def _build_stream_handler() -> logging.Handler:
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_build_formatter())
+    return handler
+
+
+def _get_queue() -> queue.Queue:
+    """Shared log queue; starts the listener thread on first use"""
+    global _listener, _queue
+    with _lock:
+        if _queue is None:
+            _queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+            _listener = QueueListener(_queue, _build_stream_handler(), respect_handler_level=True)
+            _listener.start()
+            atexit.register(shutdown_logging)
+    return _queue
 
-def setup_logger(name: str) -> logging.Logger:
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener, _queue
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+        _listener = None
+        _queue = None
+
+
+def setup_logger(name: str, sample_interval: Optional[float] = None) -> logging.Logger:
     """
     Setup structured logger with JSON formatting
-    
+
     Args:
         name: Logger name (usually __name__)
-    
+        sample_interval: If set, DEBUG/INFO records repeating the same
+            message template are rate-limited to one per interval (seconds)
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, settings.LOG_LEVEL))
-    
+
     # Avoid duplicate handlers
     if logger.handlers:
         return logger
-    
-    # Console handler
-    handler = logging.StreamHandler(sys.stdout)
-    
-    # JSON formatter for production, simple for development
-    if settings.ENVIRONMENT == "production":
-        formatter = jsonlogger.JsonFormatter(
-            fmt="%(asctime)s %(name)s %(levelname)s %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
+
+    # Non-blocking queue handler (or console handler when LOG_ASYNC is off)
+    if settings.LOG_ASYNC:
+        handler: logging.Handler = DroppingQueueHandler(_get_queue())
     else:
-        formatter = logging.Formatter(
-            fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-    
-    handler.setFormatter(formatter)
+        handler = _build_stream_handler()
+
+    if sample_interval:
+        handler.addFilter(RateLimitFilter(sample_interval))
+
     logger.addHandler(handler)
-    
+
     return logger
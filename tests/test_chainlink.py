@@ -0,0 +1,142 @@
+import pytest
+import time
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.data.data_aggregator import ChainlinkSource, DataSourceStatus, MultiSourceAggregator
+from src.data import multicall
+
+eth_abi = pytest.importorskip("eth_abi")
+
+BTC_FEED = "0xF4030086522a5bEEa4988F8cA5B36dbC97BeE88c"
+ETH_FEED = "0x5f4eC3Df9cbd43714FE2740f5E3616155c5b8419"
+FEEDS = {"BTC/USD": BTC_FEED, "ETH/USD": ETH_FEED}
+
+
+class FakeDevChain:
+    """
+    Nó JSON-RPC local que executa Multicall3.aggregate3 sobre feeds em memória.
+
+    rounds: endereço do feed → (roundId, answer, startedAt, updatedAt, answeredInRound)
+    """
+
+    def __init__(self, rounds, decimals=8, block_number=1000):
+        self.rounds = {address.lower(): data for address, data in rounds.items()}
+        self.decimals = decimals
+        self.block_number = block_number
+        self.block_time = int(time.time())
+        self.eth_calls = []
+        app = web.Application()
+        app.router.add_post('/', self._handler)
+        self.server = TestServer(app)
+
+    def _execute(self, target, call_data):
+        selector = call_data[:4]
+        if target.lower() == multicall.MULTICALL3_ADDRESS.lower():
+            if selector == multicall.GET_BLOCK_NUMBER:
+                return True, eth_abi.encode(['uint256'], [self.block_number])
+            if selector == multicall.GET_CURRENT_BLOCK_TIMESTAMP:
+                return True, eth_abi.encode(['uint256'], [self.block_time])
+        feed = self.rounds.get(target.lower())
+        if feed is not None:
+            if selector == multicall.LATEST_ROUND_DATA:
+                return True, eth_abi.encode(['uint80', 'int256', 'uint256', 'uint256', 'uint80'], list(feed))
+            if selector == multicall.DECIMALS:
+                return True, eth_abi.encode(['uint8'], [self.decimals])
+        return False, b''
+
+    async def _handler(self, request):
+        body = await request.json()
+        assert body['method'] == 'eth_call'
+        call = body['params'][0]
+        assert call['to'].lower() == multicall.MULTICALL3_ADDRESS.lower()
+
+        data = bytes.fromhex(call['data'][2:])
+        assert data[:4] == multicall.AGGREGATE3
+        (calls,) = eth_abi.decode(['(address,bool,bytes)[]'], data[4:])
+        self.eth_calls.append(calls)
+
+        results = [self._execute(target, call_data) for target, _, call_data in calls]
+        encoded = eth_abi.encode(['(bool,bytes)[]'], [results])
+        return web.json_response({'jsonrpc': '2.0', 'id': body['id'], 'result': '0x' + encoded.hex()})
+
+    async def __aenter__(self):
+        await self.server.start_server()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.server.close()
+
+    @property
+    def url(self):
+        return str(self.server.make_url('/'))
+
+
+def fresh_round(price, decimals=8, round_id=100):
+    updated_at = int(time.time()) - 30
+    return (round_id, int(price * 10 ** decimals), updated_at, updated_at, round_id)
+
+
+class TestChainlinkSource:
+
+    @pytest.mark.asyncio
+    async def test_all_feeds_read_in_one_eth_call(self):
+        rounds = {BTC_FEED: fresh_round(50000.0), ETH_FEED: fresh_round(3000.5)}
+        async with FakeDevChain(rounds) as chain:
+            source = ChainlinkSource(rpc_url=chain.url, feeds=FEEDS)
+            try:
+                prices = await source.fetch_prices(["BTC/USD", "ETH/USD", "DOGE/USD"])
+                assert prices["BTC/USD"].price == 50000.0
+                assert prices["ETH/USD"].price == 3000.5
+                assert "DOGE/USD" not in prices
+                assert prices["BTC/USD"].metadata['block_number'] == 1000
+                assert len(chain.eth_calls) == 1
+                # blockNumber + timestamp + 2 × latestRoundData + 2 × decimals
+                assert len(chain.eth_calls[0]) == 6
+
+                # decimals ficam em cache após o primeiro ciclo
+                await source.fetch_prices(["BTC/USD", "ETH/USD"])
+                assert len(chain.eth_calls) == 2
+                assert len(chain.eth_calls[1]) == 4
+                assert source.health.status == DataSourceStatus.HEALTHY
+            finally:
+                await source.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_and_incomplete_rounds_are_dropped(self):
+        stale = (7, 5000000000000, 0, int(time.time()) - 7200, 7)
+        incomplete = (9, 300000000000, 0, int(time.time()), 8)
+        async with FakeDevChain({BTC_FEED: stale, ETH_FEED: incomplete}) as chain:
+            source = ChainlinkSource(rpc_url=chain.url, feeds=FEEDS, max_feed_age=3600)
+            try:
+                prices = await source.fetch_prices(["BTC/USD", "ETH/USD"])
+                assert prices == {}
+                # O nó respondeu: não é falha da fonte
+                assert source.health.consecutive_failures == 0
+            finally:
+                await source.close()
+
+    @pytest.mark.asyncio
+    async def test_lagging_rpc_node_counts_as_failure(self):
+        async with FakeDevChain({BTC_FEED: fresh_round(50000.0)}, block_number=2000) as chain:
+            source = ChainlinkSource(rpc_url=chain.url, feeds=FEEDS, max_block_lag=5)
+            try:
+                assert await source.fetch_price("BTC/USD") is not None
+
+                chain.block_number = 1990  # nó atrás do maior bloco já visto
+                assert await source.fetch_price("BTC/USD") is None
+                assert source.health.consecutive_failures == 1
+
+                chain.block_number = 1997  # dentro da tolerância
+                assert await source.fetch_price("BTC/USD") is not None
+            finally:
+                await source.close()
+
+    @pytest.mark.asyncio
+    async def test_plugs_into_aggregator_batch_path(self):
+        rounds = {BTC_FEED: fresh_round(50000.0), ETH_FEED: fresh_round(3000.0)}
+        async with FakeDevChain(rounds) as chain:
+            async with MultiSourceAggregator(sources=[ChainlinkSource(rpc_url=chain.url, feeds=FEEDS)]) as aggregator:
+                results = await aggregator.get_prices(["BTC/USD", "ETH/USD"], min_sources=1)
+                assert results["BTC/USD"].price == 50000.0
+                assert results["ETH/USD"].metadata['sources_used'] == ["Chainlink"]
+                assert len(chain.eth_calls) == 1
@@ -0,0 +1,79 @@
+import pytest
+from src.data.data_aggregator import DataSourceStatus, MultiSourceAggregator
+from src.data.replay import ReplayExchangeServer, ReplayProfile, replay_sources, synthetic_market
+
+NO_LATENCY = ReplayProfile(latency_ms=0)
+
+
+def profiles(**overrides):
+    base = {exchange: NO_LATENCY for exchange in ("binance", "coingecko", "coincap")}
+    base.update(overrides)
+    return base
+
+
+class TestReplayExchange:
+
+    @pytest.mark.asyncio
+    async def test_aggregator_runs_against_replay(self):
+        async with ReplayExchangeServer(synthetic_market(50), profiles()) as server:
+            async with MultiSourceAggregator(sources=replay_sources(server.url)) as aggregator:
+                universe = await aggregator.load_symbol_universe()
+                assert universe == {'Binance': 50, 'CoinGecko': 50, 'CoinCap': 50}
+                
+                btc = await aggregator.get_price("BTC/USD")
+                assert btc.price == pytest.approx(50000.0, rel=0.01)
+                assert btc.metadata['num_sources'] == 3
+                
+                symbols = ["ETH/USD", "A0001/USD", "A0040/USD"]
+                batch = await aggregator.get_prices(symbols)
+                assert all(batch[symbol] is not None for symbol in symbols)
+                # Um round-trip por fonte no lote
+                assert server.requests['binance'] == 1 + 1 + 1  # exchangeInfo + ticker + lote
+                assert server.requests['coincap'] == 3
+
+    @pytest.mark.asyncio
+    async def test_injected_errors(self):
+        replay = profiles(binance=ReplayProfile(latency_ms=0, error_rate=1.0))
+        async with ReplayExchangeServer(synthetic_market(10), replay) as server:
+            sources = replay_sources(server.url)
+            async with MultiSourceAggregator(sources=sources) as aggregator:
+                result = await aggregator.get_price("BTC/USD")
+                
+                assert server.requests['binance_errors'] == 1
+                assert sources[0].health.status == DataSourceStatus.DEGRADED
+                assert set(result.metadata['sources_used']) == {"CoinGecko", "CoinCap"}
+
+    @pytest.mark.asyncio
+    async def test_injected_outliers_are_filtered(self):
+        replay = profiles(coincap=ReplayProfile(latency_ms=0, outlier_rate=1.0, outlier_factor=1.5))
+        async with ReplayExchangeServer(synthetic_market(10), replay) as server:
+            async with MultiSourceAggregator(sources=replay_sources(server.url)) as aggregator:
+                result = await aggregator.get_price("BTC/USD")
+                
+                assert server.requests['coincap_outliers'] == 1
+                assert "CoinCap" not in result.metadata['sources_used']
+                assert result.price == pytest.approx(50000.0, rel=0.01)
+
+    @pytest.mark.asyncio
+    async def test_binance_rejects_batch_with_invalid_symbol(self):
+        async with ReplayExchangeServer(synthetic_market(10), profiles()) as server:
+            source = replay_sources(server.url)[0]
+            try:
+                assert set(await source.fetch_prices(["BTC/USD", "ETH/USD"])) == {"BTC/USD", "ETH/USD"}
+                # Lote recusado (-1121): símbolos válidos buscados um a um, sem falha
+                assert set(await source.fetch_prices(["BTC/USD", "ZZZ/USD"])) == {"BTC/USD"}
+                assert source.health.total_failures == 0
+                assert not source.supports("ZZZ/USD")
+            finally:
+                await source.close()
+
+    @pytest.mark.asyncio
+    async def test_latency_profile(self):
+        replay = profiles(coincap=ReplayProfile(latency_ms=30, latency_sigma=0))
+        async with ReplayExchangeServer(synthetic_market(10), replay) as server:
+            source = replay_sources(server.url)[2]
+            try:
+                assert await source.fetch_price("BTC/USD") is not None
+                assert source.health.avg_response_time >= 30
+            finally:
+                await source.close()
@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+import json
 import statistics
 from unittest.mock import patch, MagicMock, AsyncMock
 from datetime import datetime
@@ -7,8 +8,10 @@ from src.data.data_aggregator import MultiSourceAggregator, PriceData, DataSourc
 
 class TestResilience:
     @pytest.fixture
-    def aggregator(self):
-        return MultiSourceAggregator()
+    async def aggregator(self):
+        aggregator = MultiSourceAggregator()
+        yield aggregator
+        await aggregator.close()
 
     @pytest.mark.asyncio
     async def test_scenario_primary_source_down(self, aggregator):
@@ -121,3 +124,697 @@ class TestResilience:
             second_result = await aggregator.get_price("BTC/USD")
             assert second_result.price == 50000.0
             assert second_result.timestamp == first_result.timestamp
+
+    @pytest.mark.asyncio
+    async def test_shared_connection_pool(self, aggregator):
+        """
+        Todas as fontes devem reutilizar a mesma sessão HTTP do agregador,
+        e close() deve encerrar o pool.
+        """
+        session = aggregator._ensure_session()
+        
+        assert all(source.session is session for source in aggregator.sources)
+        assert aggregator._ensure_session() is session
+        assert session.connector.limit_per_host > 0
+        
+        await aggregator.close()
+        
+        assert session.closed
+        assert all(source.session is None for source in aggregator.sources)
+
+    @pytest.mark.asyncio
+    async def test_get_prices_single_round_trip_per_source(self, aggregator):
+        """
+        get_prices deve fazer uma única chamada em lote por fonte,
+        independente do número de símbolos.
+        """
+        def batch(source, confidence, offset):
+            return {
+                "BTC/USD": PriceData(
+                    source=source, symbol="BTC/USD", price=50000.0 + offset,
+                    volume_24h=1000, timestamp=datetime.now(), confidence=confidence
+                ),
+                "ETH/USD": PriceData(
+                    source=source, symbol="ETH/USD", price=3000.0 + offset,
+                    volume_24h=500, timestamp=datetime.now(), confidence=confidence
+                ),
+            }
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_prices', new_callable=AsyncMock) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_prices', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_prices', new_callable=AsyncMock) as mock_cap:
+            
+            mock_binance.return_value = batch("Binance", 95.0, 0)
+            mock_gecko.return_value = batch("CoinGecko", 90.0, 5)
+            mock_cap.return_value = {}  # CoinCap fora do ar
+            
+            results = await aggregator.get_prices(["BTC/USD", "ETH/USD", "DOGE/USD"])
+            
+            assert mock_binance.await_count == 1
+            assert mock_gecko.await_count == 1
+            mock_binance.assert_awaited_with(["BTC/USD", "ETH/USD", "DOGE/USD"])
+            
+            assert results["BTC/USD"].metadata['num_sources'] == 2
+            assert 3000.0 <= results["ETH/USD"].price <= 3005.0
+            assert results["DOGE/USD"] is None
+            
+            # Segunda chamada é servida pelo cache
+            cached = await aggregator.get_prices(["BTC/USD", "ETH/USD"])
+            assert mock_binance.await_count == 1
+            assert cached["BTC/USD"] is results["BTC/USD"]
+
+    @pytest.mark.asyncio
+    async def test_binance_batch_request_format(self):
+        """BinanceSource.fetch_prices usa o parâmetro symbols=[...] em uma requisição"""
+        from src.data.data_aggregator import BinanceSource
+        
+        ticker = {
+            'lastPrice': '50000', 'volume': '10', 'highPrice': '51000',
+            'lowPrice': '49000', 'priceChangePercent': '1.5'
+        }
+        response = MagicMock(status=200, headers={'X-MBX-USED-WEIGHT-1M': '12'})
+        response.read = AsyncMock(return_value=json.dumps([
+            dict(ticker, symbol='BTCUSDT'),
+            dict(ticker, symbol='ETHUSDT', lastPrice='3000'),
+        ]).encode())
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock(closed=False)
+        session.get.return_value = context
+        
+        source = BinanceSource()
+        source.bind_session(session)
+        results = await source.fetch_prices(["BTC/USD", "ETH/USD"])
+        
+        assert session.get.call_count == 1
+        params = session.get.call_args.kwargs['params']
+        assert params['symbols'] == '["BTCUSDT","ETHUSDT"]'
+        assert results["ETH/USD"].price == 3000.0
+        assert source.health.total_requests == 1
+        # Peso informado pela Binance sincroniza o orçamento local
+        assert source.rate_limiter.tokens == pytest.approx(source.rate_limiter.capacity - 12, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_binance_invalid_symbol_is_not_a_source_failure(self):
+        """
+        Antes do universo carregado, um palpite BASE+USDT inexistente faz a
+        Binance recusar o lote (HTTP 400, -1121): sem falha registrada, os
+        símbolos válidos são buscados um a um e o inválido sai dos próximos lotes.
+        """
+        from src.data.circuit_breaker import BreakerState
+        from src.data.data_aggregator import BinanceSource
+        
+        ticker = {
+            'symbol': 'BTCUSDT', 'lastPrice': '50000', 'volume': '10',
+            'highPrice': '51000', 'lowPrice': '49000', 'priceChangePercent': '1.5'
+        }
+        invalid = json.dumps({'code': -1121, 'msg': 'Invalid symbol.'}).encode()
+        
+        def respond(url, params=None, timeout=None):
+            if params is not None:
+                body = ticker if 'FOOUSDT' not in params['symbols'] else None
+                response = MagicMock(status=200 if body else 400, headers={})
+                response.read = AsyncMock(return_value=json.dumps([body]).encode() if body else invalid)
+            elif url.endswith('FOOUSDT'):
+                response = MagicMock(status=400, headers={})
+                response.read = AsyncMock(return_value=invalid)
+            else:
+                response = MagicMock(status=200, headers={})
+                response.read = AsyncMock(return_value=json.dumps(ticker).encode())
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+        
+        session = MagicMock(closed=False)
+        session.get.side_effect = respond
+        
+        source = BinanceSource()
+        source.bind_session(session)
+        results = await source.fetch_prices(["BTC/USD", "FOO/USD"])
+        
+        assert set(results) == {"BTC/USD"}
+        assert source.health.total_failures == 0
+        assert source.breaker.state == BreakerState.CLOSED
+        assert not source.supports("FOO/USD")
+        
+        # Próximo lote: apenas o símbolo válido, em uma requisição
+        session.get.reset_mock()
+        results = await source.fetch_prices(["BTC/USD", "FOO/USD"])
+        assert set(results) == {"BTC/USD"}
+        assert session.get.call_count == 1
+        assert session.get.call_args.kwargs['params']['symbols'] == '["BTCUSDT"]'
+
+    @pytest.mark.asyncio
+    async def test_batch_parse_error_counts_only_as_failure(self):
+        """Resposta 200 malformada: falha registrada, sem sucesso antes do parse"""
+        from src.data.data_aggregator import BinanceSource
+        
+        response = MagicMock(status=200, headers={})
+        response.read = AsyncMock(return_value=json.dumps([{'symbol': 'BTCUSDT'}]).encode())
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock(closed=False)
+        session.get.return_value = context
+        
+        source = BinanceSource()
+        source.bind_session(session)
+        
+        assert await source.fetch_prices(["BTC/USD", "ETH/USD"]) == {}
+        assert source.health.total_requests == 1
+        assert source.health.total_failures == 1
+        assert source.health.last_success is None
+
+    @pytest.mark.asyncio
+    async def test_http_429_pauses_source_without_health_failure(self):
+        """HTTP 429 pausa o limiter (Retry-After) e não abre o circuit breaker"""
+        from src.data.data_aggregator import CoinGeckoSource
+        
+        response = MagicMock(status=429, headers={'Retry-After': '30'})
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+        session = MagicMock(closed=False)
+        session.get.return_value = context
+        
+        source = CoinGeckoSource()
+        source.bind_session(session)
+        
+        assert await source.fetch_price("BTC/USD") is None
+        assert source.health.total_failures == 0
+        assert source.rate_limiter.throttled == 1
+        assert source.rate_limiter.headroom() == 0.0
+        
+        # Durante a pausa as chamadas são descartadas localmente, sem HTTP
+        assert await source.fetch_price("BTC/USD") is None
+        assert session.get.call_count == 1
+        assert source.rate_limiter.shed == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_price_is_coalesced(self, aggregator):
+        """
+        Chamadores concorrentes com cache frio devem compartilhar um único
+        fan-out para as fontes (single-flight).
+        """
+        async def slow_price(source, price, confidence):
+            await asyncio.sleep(0.05)
+            return PriceData(
+                source=source, symbol="BTC/USD", price=price,
+                volume_24h=1000, timestamp=datetime.now(), confidence=confidence
+            )
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', new_callable=AsyncMock) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', new_callable=AsyncMock) as mock_cap:
+            
+            async def binance(symbol):
+                return await slow_price("Binance", 50000.0, 95.0)
+            
+            async def gecko(symbol):
+                return await slow_price("CoinGecko", 50010.0, 90.0)
+            
+            async def cap(symbol):
+                return await slow_price("CoinCap", 50020.0, 85.0)
+            
+            mock_binance.side_effect = binance
+            mock_gecko.side_effect = gecko
+            mock_cap.side_effect = cap
+            
+            results = await asyncio.gather(
+                *(aggregator.get_price("BTC/USD") for _ in range(10))
+            )
+            
+            assert mock_binance.await_count == 1
+            assert mock_gecko.await_count == 1
+            assert mock_cap.await_count == 1
+            assert results[0] is not None
+            assert results[0].metadata['num_sources'] == 3
+            assert all(r is results[0] for r in results)
+            assert aggregator.coalesced_requests == 9
+            assert aggregator._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self):
+        """
+        Com stale_while_revalidate, uma entrada expirada (dentro de
+        max_staleness) é servida imediatamente e atualizada em background;
+        acima de max_staleness a chamada volta a aguardar a rede.
+        """
+        from datetime import timedelta
+        aggregator = MultiSourceAggregator(stale_while_revalidate=True)
+        
+        def price_data(source, price, confidence):
+            return PriceData(
+                source=source, symbol="BTC/USD", price=price,
+                volume_24h=1000, timestamp=datetime.now(), confidence=confidence
+            )
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', new_callable=AsyncMock) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', new_callable=AsyncMock) as mock_cap:
+            
+            mock_binance.return_value = price_data("Binance", 50000.0, 95.0)
+            mock_gecko.return_value = price_data("CoinGecko", 50000.0, 90.0)
+            mock_cap.return_value = None
+            
+            await aggregator.get_price("BTC/USD")
+            
+            # Envelhecer a entrada além do TTL, mas dentro de max_staleness
+            data, saved_at = aggregator.cache["BTC/USD"]
+            aggregator.cache["BTC/USD"] = (data, saved_at - aggregator.cache.ttl_for("BTC/USD") - timedelta(seconds=5))
+            
+            mock_binance.return_value = price_data("Binance", 51000.0, 95.0)
+            mock_gecko.return_value = price_data("CoinGecko", 51000.0, 90.0)
+            
+            stale = await aggregator.get_price("BTC/USD")
+            assert stale.price == 50000.0
+            assert stale.metadata['stale'] is True
+            assert stale.metadata['cache_age_seconds'] >= aggregator.cache.ttl_for("BTC/USD").total_seconds()
+            
+            # A atualização em background substitui o cache
+            await asyncio.gather(*aggregator._inflight.values())
+            fresh = await aggregator.get_price("BTC/USD")
+            assert fresh.price == 51000.0
+            assert fresh.metadata['stale'] is False
+            
+            # Acima do limite rígido a chamada bloqueia na rede
+            data, saved_at = aggregator.cache["BTC/USD"]
+            aggregator.cache["BTC/USD"] = (data, saved_at - aggregator.max_staleness)
+            mock_binance.return_value = price_data("Binance", 52000.0, 95.0)
+            mock_gecko.return_value = price_data("CoinGecko", 52000.0, 90.0)
+            
+            blocking = await aggregator.get_price("BTC/USD")
+            assert blocking.price == 52000.0
+        
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_background_revalidation(self):
+        """Atualizações disparadas por stale-while-revalidate não sobrevivem ao close()"""
+        from datetime import timedelta
+        aggregator = MultiSourceAggregator(stale_while_revalidate=True)
+        data = PriceData(
+            source="MultiSource-Aggregator", symbol="BTC/USD", price=50000.0,
+            volume_24h=None, timestamp=datetime.now(), confidence=90.0
+        )
+        aggregator.cache["BTC/USD"] = (data, datetime.now() - aggregator.cache.ttl_for("BTC/USD") - timedelta(seconds=5))
+        
+        started = asyncio.Event()
+        
+        async def hang(symbol):
+            started.set()
+            await asyncio.sleep(60)
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', side_effect=hang), \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', side_effect=hang), \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', side_effect=hang):
+            stale = await aggregator.get_price("BTC/USD")
+            assert stale.metadata['stale'] is True
+            await asyncio.wait_for(started.wait(), 1.0)
+            
+            revalidation, = aggregator._inflight.values()
+            assert revalidation in aggregator._background_tasks
+            
+            await aggregator.close()
+            assert revalidation.cancelled()
+            assert aggregator._background_tasks == set()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_prices_share_one_revalidation(self):
+        """Chamadas concorrentes sobre a mesma entrada obsoleta disparam um único lote"""
+        from datetime import timedelta
+        aggregator = MultiSourceAggregator(stale_while_revalidate=True)
+        data = PriceData(
+            source="MultiSource-Aggregator", symbol="BTC/USD", price=50000.0,
+            volume_24h=None, timestamp=datetime.now(), confidence=90.0
+        )
+        aggregator.cache["BTC/USD"] = (data, datetime.now() - aggregator.cache.ttl_for("BTC/USD") - timedelta(seconds=5))
+        
+        async def slow_batch(symbols):
+            await asyncio.sleep(0.05)
+            return {}
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_prices', side_effect=slow_batch) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_prices', side_effect=slow_batch) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_prices', side_effect=slow_batch) as mock_cap:
+            results = await asyncio.gather(*(aggregator.get_prices(["BTC/USD"]) for _ in range(10)))
+            assert all(r["BTC/USD"].metadata['stale'] is True for r in results)
+            await asyncio.gather(*aggregator._background_tasks)
+            
+            assert (mock_binance.call_count, mock_gecko.call_count, mock_cap.call_count) == (1, 1, 1)
+            assert aggregator._refreshing == set()
+        
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_stop_refresher_spares_foreground_fetches(self):
+        """stop_refresher() não cancela um get_price aguardando a rede"""
+        aggregator = MultiSourceAggregator(stale_while_revalidate=True)
+        
+        async def slow_price(symbol):
+            await asyncio.sleep(0.05)
+            return PriceData(
+                source="Binance", symbol=symbol, price=50000.0,
+                volume_24h=None, timestamp=datetime.now(), confidence=95.0
+            )
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', side_effect=slow_price), \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', side_effect=slow_price), \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', side_effect=slow_price):
+            caller = asyncio.ensure_future(aggregator.get_price("BTC/USD"))
+            await asyncio.sleep(0.01)
+            await aggregator.stop_refresher()
+            result = await caller
+            assert result.price == pytest.approx(50000.0)
+        
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_refresher_keeps_tracked_symbols_warm(self):
+        """O refresher popula o cache dos símbolos rastreados em lote"""
+        aggregator = MultiSourceAggregator(stale_while_revalidate=True)
+        
+        def batch(source, confidence):
+            return {
+                s: PriceData(source=source, symbol=s, price=100.0,
+                             volume_24h=None, timestamp=datetime.now(), confidence=confidence)
+                for s in ("BTC/USD", "ETH/USD")
+            }
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_prices', new_callable=AsyncMock) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_prices', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_prices', new_callable=AsyncMock) as mock_cap:
+            
+            mock_binance.return_value = batch("Binance", 95.0)
+            mock_gecko.return_value = batch("CoinGecko", 90.0)
+            mock_cap.return_value = {}
+            
+            await aggregator.start_refresher(["BTC/USD", "ETH/USD"], interval=0.01)
+            for _ in range(100):
+                if len(aggregator.cache) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            
+            assert set(aggregator.cache) == {"BTC/USD", "ETH/USD"}
+            # Cache quente: não há nova ida à rede enquanto fora da janela de refresh
+            calls = mock_binance.await_count
+            await asyncio.sleep(0.05)
+            assert mock_binance.await_count == calls
+            
+            await aggregator.close()
+            assert aggregator._refresher is None
+
+    @pytest.mark.asyncio
+    async def test_early_quorum_does_not_wait_for_slowest_source(self):
+        """
+        Com early_quorum, o consenso sai assim que 2 fontes concordam; a fonte
+        lenta segue em background (sem cancelamento) e conclui depois.
+        """
+        aggregator = MultiSourceAggregator(early_quorum=True)
+        slow_finished = asyncio.Event()
+        
+        async def slow_cap(symbol):
+            await asyncio.sleep(0.3)
+            slow_finished.set()
+            return PriceData(
+                source="CoinCap", symbol=symbol, price=50020.0,
+                volume_24h=1000, timestamp=datetime.now(), confidence=85.0
+            )
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', new_callable=AsyncMock) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', side_effect=slow_cap):
+            
+            mock_binance.return_value = PriceData(
+                source="Binance", symbol="BTC/USD", price=50000.0,
+                volume_24h=1000, timestamp=datetime.now(), confidence=95.0
+            )
+            mock_gecko.return_value = PriceData(
+                source="CoinGecko", symbol="BTC/USD", price=50010.0,
+                volume_24h=1000, timestamp=datetime.now(), confidence=90.0
+            )
+            
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            result = await aggregator.get_price("BTC/USD", min_sources=2)
+            elapsed = loop.time() - started
+            
+            assert elapsed < 0.2
+            assert set(result.metadata['sources_used']) == {"Binance", "CoinGecko"}
+            assert len(aggregator._background_tasks) == 1
+            
+            await asyncio.wait_for(slow_finished.wait(), timeout=1.0)
+        
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_early_quorum_waits_when_first_sources_disagree(self):
+        """Sem concordância entre as primeiras fontes, aguarda a terceira e remove o outlier"""
+        aggregator = MultiSourceAggregator(early_quorum=True)
+        
+        def delayed(source, price, confidence, delay):
+            async def fetch(symbol):
+                await asyncio.sleep(delay)
+                return PriceData(
+                    source=source, symbol=symbol, price=price,
+                    volume_24h=1000, timestamp=datetime.now(), confidence=confidence
+                )
+            return fetch
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', side_effect=delayed("Binance", 50000.0, 95.0, 0)), \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', side_effect=delayed("CoinGecko", 80000.0, 90.0, 0.01)), \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', side_effect=delayed("CoinCap", 50050.0, 85.0, 0.05)):
+            
+            result = await aggregator.get_price("BTC/USD", min_sources=2, max_deviation=5.0)
+            
+            assert result is not None
+            assert "CoinGecko" not in result.metadata['sources_used']
+            assert result.price < 55000.0
+        
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_after_source_p95(self):
+        """
+        Com hedging, uma fonte que passa do seu p95 recebe uma requisição
+        duplicada e a primeira resposta válida é usada.
+        """
+        aggregator = MultiSourceAggregator(hedging=True)
+        binance = aggregator.sources[0]
+        for _ in range(50):
+            binance.latency.record(10.0)  # p95 histórico ~10ms
+        
+        calls = []
+        
+        async def flaky_binance(symbol):
+            calls.append(symbol)
+            # Primeira chamada "trava"; a duplicada responde rápido
+            await asyncio.sleep(1.0 if len(calls) == 1 else 0.01)
+            return PriceData(
+                source="Binance", symbol=symbol, price=50000.0,
+                volume_24h=1000, timestamp=datetime.now(), confidence=95.0
+            )
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', side_effect=flaky_binance), \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', new_callable=AsyncMock) as mock_cap:
+            
+            mock_gecko.return_value = PriceData(
+                source="CoinGecko", symbol="BTC/USD", price=50010.0,
+                volume_24h=1000, timestamp=datetime.now(), confidence=90.0
+            )
+            mock_cap.return_value = None
+            
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            result = await aggregator.get_price("BTC/USD")
+            
+            assert loop.time() - started < 0.5
+            assert len(calls) == 2
+            assert aggregator.hedged_requests == 1
+            assert "Binance" in result.metadata['sources_used']
+            # Sem histórico suficiente nas outras fontes, não há hedge
+            assert aggregator.sources[1].hedge_delay() is None
+        
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_cancels_unhedged_primary(self):
+        """Cancelamento durante a espera pelo hedge_delay cancela a requisição primária"""
+        aggregator = MultiSourceAggregator(hedging=True)
+        binance = aggregator.sources[0]
+        for _ in range(50):
+            binance.latency.record(500.0)
+        
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+        
+        async def slow_binance(symbol):
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', side_effect=slow_binance):
+            caller = asyncio.ensure_future(aggregator._fetch_from(binance, "BTC/USD"))
+            await asyncio.wait_for(started.wait(), 1.0)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+            await asyncio.wait_for(cancelled.wait(), 1.0)
+        
+        await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_source_until_probe(self, aggregator):
+        """
+        Fonte com circuito OPEN não é chamada; após o cooldown recebe uma
+        única prova e, com sucesso, o circuito fecha.
+        """
+        from src.data.circuit_breaker import BreakerState
+        binance = aggregator.sources[0]
+        for _ in range(3):
+            binance.update_health(False, 5000.0)
+        assert binance.breaker.state == BreakerState.OPEN
+        
+        def price_data(source, confidence):
+            return PriceData(
+                source=source, symbol="BTC/USD", price=50000.0,
+                volume_24h=1000, timestamp=datetime.now(), confidence=confidence
+            )
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', new_callable=AsyncMock) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', new_callable=AsyncMock) as mock_cap:
+            
+            mock_gecko.return_value = price_data("CoinGecko", 90.0)
+            mock_cap.return_value = price_data("CoinCap", 85.0)
+            
+            result = await aggregator.get_price("BTC/USD")
+            assert mock_binance.await_count == 0
+            assert "Binance" not in result.metadata['sources_used']
+            
+            report = aggregator.get_health_report()
+            assert report['sources'][0]['circuit_breaker']['state'] == 'open'
+            
+            # Fim do cooldown: prova única
+            binance.breaker.open_until = 0.0
+            aggregator.cache.clear()
+            
+            async def probe(symbol):
+                binance.update_health(True, 50.0)
+                return price_data("Binance", 95.0)
+            mock_binance.side_effect = probe
+            
+            result = await aggregator.get_price("BTC/USD")
+            assert mock_binance.await_count == 1
+            assert "Binance" in result.metadata['sources_used']
+            assert binance.breaker.state == BreakerState.CLOSED
+            assert binance.health.status == DataSourceStatus.HEALTHY
+
+    @pytest.mark.asyncio
+    async def test_consensus_and_source_ticks_recorded_in_history(self, aggregator):
+        """
+        Cada consenso e cada tick individual (inclusive outliers descartados)
+        entram no histórico local do símbolo.
+        """
+        def price_data(source, price, confidence):
+            return PriceData(
+                source=source, symbol="BTC/USD", price=price,
+                volume_24h=1000, timestamp=datetime.now(), confidence=confidence
+            )
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', new_callable=AsyncMock) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', new_callable=AsyncMock) as mock_cap:
+            
+            for i in range(3):
+                mock_binance.return_value = price_data("Binance", 50000.0 + i, 95.0)
+                mock_gecko.return_value = price_data("CoinGecko", 50010.0 + i, 90.0)
+                mock_cap.return_value = price_data("CoinCap", 80000.0, 85.0)
+                aggregator.cache.clear()
+                await aggregator.get_price("BTC/USD")
+        
+        consensus = aggregator.history.window("BTC/USD")
+        assert len(consensus.price) == 3
+        assert consensus.price[-1] < 55000.0
+        assert list(aggregator.history.window("BTC/USD", source="Binance").price) == [50000.0, 50001.0, 50002.0]
+        assert aggregator.history.sources("BTC/USD") == ["Binance", "CoinCap", "CoinGecko"]
+        assert len(aggregator.history.window("BTC/USD", minutes=1).price) == 3
+
+    @pytest.mark.asyncio
+    async def test_unsupported_symbol_source_pairs_are_skipped(self, aggregator):
+        """Fontes sem mapeamento para o símbolo não recebem requisição"""
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', new_callable=AsyncMock) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', new_callable=AsyncMock) as mock_cap:
+            
+            mock_binance.return_value = PriceData(
+                source="Binance", symbol="PEPE/USD", price=0.00001,
+                volume_24h=1000, timestamp=datetime.now(), confidence=95.0
+            )
+            
+            result = await aggregator.get_price("PEPE/USD", min_sources=1)
+            
+            assert result.metadata['sources_used'] == ["Binance"]
+            assert mock_binance.await_count == 1
+            assert mock_gecko.await_count == 0
+            assert mock_cap.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_drifting_source_loses_consensus_weight(self, aggregator):
+        """Fonte que desvia do consenso perde influência no preço agregado"""
+        def quote(source, price):
+            return PriceData(
+                source=source, symbol="BTC/USD", price=price,
+                volume_24h=1000, timestamp=datetime.now(), confidence=90.0
+            )
+        
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', new_callable=AsyncMock) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', new_callable=AsyncMock) as mock_cap:
+            
+            mock_binance.return_value = quote("Binance", 50000.0)
+            mock_gecko.return_value = quote("CoinGecko", 50000.0)
+            # CoinCap sempre 1% acima (dentro do desvio aceitável)
+            mock_cap.return_value = quote("CoinCap", 50500.0)
+            
+            first = await aggregator.get_price("BTC/USD")
+            for _ in range(30):
+                aggregator.cache.clear()
+                last = await aggregator.get_price("BTC/USD")
+            
+            weights = {s.name: s.quality.weight for s in aggregator.sources}
+            assert weights["CoinCap"] < 0.5 < weights["Binance"]
+            assert abs(last.price - 50000.0) < abs(first.price - 50000.0)
+            
+            report = aggregator.get_health_report()
+            assert report['sources'][2]['consensus_weight']['weight'] == pytest.approx(weights["CoinCap"], abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_request_counters_replace_per_call_logs(self, aggregator):
+        """Cache hits e buscas são contabilizados em contadores agregados"""
+        price = PriceData(
+            source="Binance", symbol="BTC/USD", price=50000.0,
+            volume_24h=1000, timestamp=datetime.now(), confidence=95.0
+        )
+        with patch('src.data.data_aggregator.BinanceSource.fetch_price', new_callable=AsyncMock) as mock_binance, \
+             patch('src.data.data_aggregator.CoinGeckoSource.fetch_price', new_callable=AsyncMock) as mock_gecko, \
+             patch('src.data.data_aggregator.CoinCapSource.fetch_price', new_callable=AsyncMock) as mock_cap:
+            
+            mock_binance.return_value = price
+            mock_gecko.return_value = PriceData(**{**price.__dict__, 'source': "CoinGecko"})
+            mock_cap.return_value = None
+            
+            for _ in range(5):
+                await aggregator.get_price("BTC/USD")
+            
+            counters = aggregator.get_health_report()['requests']
+            assert counters['requests'] == 5
+            assert counters['fetches'] == 1
+            assert counters['consensus'] == 1
+            assert counters['cache_hits'] == 4
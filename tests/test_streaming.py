@@ -0,0 +1,160 @@
+import pytest
+import asyncio
+import json
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.data.circuit_breaker import BreakerState
+from src.data.data_aggregator import MultiSourceAggregator, DataSourceStatus
+from src.data.streaming import BinanceStreamSource, CoinCapStreamSource
+
+
+class FakeWebSocketServer:
+    """
+    Servidor WebSocket local que envia mensagens pré-gravadas.
+
+    Cada conexão recebe o próximo lote de `sessions`; depois de enviado,
+    o servidor fecha o socket (ou o mantém aberto se keep_open=True).
+    """
+
+    def __init__(self, sessions, keep_open=False):
+        self.sessions = list(sessions)
+        self.keep_open = keep_open
+        self.connections = 0
+        self.requested_urls = []
+        app = web.Application()
+        app.router.add_get('/ws', self._handler)
+        self.server = TestServer(app)
+
+    async def _handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.requested_urls.append(str(request.rel_url))
+        index = min(self.connections, len(self.sessions) - 1)
+        self.connections += 1
+        for message in self.sessions[index]:
+            await ws.send_str(json.dumps(message))
+        if self.keep_open:
+            await ws.receive()
+        await ws.close()
+        return ws
+
+    async def __aenter__(self):
+        await self.server.start_server()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.server.close()
+
+    @property
+    def url(self):
+        return str(self.server.make_url('/ws'))
+
+
+def binance_ticker(symbol, price):
+    return {
+        "stream": f"{symbol.lower()}@ticker",
+        "data": {"e": "24hrTicker", "s": symbol, "c": str(price), "v": "100",
+                 "h": str(price * 1.01), "l": str(price * 0.99), "P": "0.5"}
+    }
+
+
+async def wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condição não atingida a tempo")
+        await asyncio.sleep(0.01)
+
+
+class TestStreamingSources:
+
+    @pytest.mark.asyncio
+    async def test_binance_stream_updates_book(self):
+        async with FakeWebSocketServer([[binance_ticker("BTCUSDT", 50000.0)]], keep_open=True) as server:
+            source = BinanceStreamSource(url=server.url)
+            await source.start(["BTC/USD"])
+            try:
+                await wait_for(lambda: len(source.book) == 1)
+
+                tick = await source.fetch_price("BTC/USD")
+                assert tick.price == 50000.0
+                assert tick.metadata['price_change_pct'] == 0.5
+                assert "btcusdt@ticker" in server.requested_urls[0]
+                assert source.health.status == DataSourceStatus.HEALTHY
+            finally:
+                await source.close()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_with_backoff(self):
+        sessions = [
+            [binance_ticker("BTCUSDT", 50000.0)],
+            [binance_ticker("BTCUSDT", 50500.0)],
+        ]
+        async with FakeWebSocketServer(sessions) as server:
+            source = BinanceStreamSource(url=server.url, reconnect_initial=0.01, reconnect_max=0.05)
+            await source.start(["BTC/USD"])
+            try:
+                await wait_for(lambda: source.connections >= 2 and source.book.get("BTC/USD").price == 50500.0)
+                assert server.connections >= 2
+            finally:
+                await source.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_tick_degrades_without_tripping_breaker(self):
+        async with FakeWebSocketServer([[binance_ticker("BTCUSDT", 50000.0)]], keep_open=True) as server:
+            source = BinanceStreamSource(url=server.url, stale_after=0.05)
+            await source.start(["BTC/USD"])
+            try:
+                await wait_for(lambda: len(source.book) == 1)
+                assert await source.fetch_price("BTC/USD") is not None
+                await asyncio.sleep(0.1)
+
+                for _ in range(10):
+                    assert await source.fetch_price("BTC/USD") is None
+                assert source.health.status == DataSourceStatus.DEGRADED
+                assert source.health.consecutive_failures == 0
+                assert source.breaker.state == BreakerState.CLOSED
+
+                # Ticks resumed: the source is used again right away
+                source.book.update(source.book.get("BTC/USD"))
+                assert await source.fetch_price("BTC/USD") is not None
+                assert source.health.status == DataSourceStatus.HEALTHY
+                # Book reads are not round-trips: no latency samples
+                assert source.latency.count == 0
+            finally:
+                await source.close()
+
+    @pytest.mark.asyncio
+    async def test_missing_tick_and_unsubscribed_symbols(self):
+        async with FakeWebSocketServer([[]], keep_open=True) as server:
+            source = BinanceStreamSource(url=server.url)
+            await source.start(["BTC/USD"])
+            try:
+                assert source.supports("BTC/USD")
+                assert not source.supports("ETH/USD")
+                assert await source.fetch_price("BTC/USD") is None
+                assert source.health.total_requests == 0
+                assert source.breaker.state == BreakerState.CLOSED
+            finally:
+                await source.close()
+
+    @pytest.mark.asyncio
+    async def test_aggregator_reads_from_streams(self):
+        binance_msgs = [binance_ticker("BTCUSDT", 50000.0)]
+        coincap_msgs = [{"bitcoin": "50020.0", "dogecoin": "0.1"}]
+
+        async with FakeWebSocketServer([binance_msgs], keep_open=True) as binance_srv, \
+                FakeWebSocketServer([coincap_msgs], keep_open=True) as coincap_srv:
+            binance = BinanceStreamSource(url=binance_srv.url)
+            coincap = CoinCapStreamSource(url=coincap_srv.url)
+
+            async with MultiSourceAggregator(sources=[binance, coincap]) as aggregator:
+                await aggregator.start_streams(["BTC/USD"])
+                await wait_for(lambda: len(binance.book) == 1 and len(coincap.book) == 1)
+
+                result = await aggregator.get_price("BTC/USD", min_sources=2)
+
+                assert result is not None
+                assert set(result.metadata['sources_used']) == {"Binance", "CoinCap"}
+                assert 50000.0 <= result.price <= 50020.0
+                assert "assets=bitcoin" in coincap_srv.requested_urls[0]
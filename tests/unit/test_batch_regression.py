@@ -0,0 +1,94 @@
+"""
+Unit tests for the closed-form batched trend regression
+"""
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+
+from src.ml.batch_regression import BatchPredictor, fit_linear_trend
+from src.ml.predictor import Predictor
+
+
+def sklearn_reference(prices, test_size=0.2):
+    """Original Predictor.train implementation"""
+    dates = np.arange(len(prices)).reshape(-1, 1)
+    X_train, X_test, y_train, y_test = train_test_split(dates, prices, test_size=test_size, random_state=42)
+    model = LinearRegression().fit(X_train, y_train)
+    train_pred, test_pred = model.predict(X_train), model.predict(X_test)
+    return {
+        'slope': model.coef_[0],
+        'intercept': model.intercept_,
+        'train_r2': r2_score(y_train, train_pred),
+        'test_r2': r2_score(y_test, test_pred),
+        'train_rmse': np.sqrt(mean_squared_error(y_train, train_pred)),
+        'test_rmse': np.sqrt(mean_squared_error(y_test, test_pred)),
+        'next_day': model.predict([[len(prices)]])[0],
+    }
+
+
+@pytest.fixture
+def price_matrix():
+    rng = np.random.default_rng(3)
+    drift = rng.uniform(-50, 50, size=(40, 1))
+    noise = rng.normal(0, 200, size=(40, 31)).cumsum(axis=1)
+    return 30000 + drift * np.arange(31) + noise
+
+
+def test_batch_fit_matches_sklearn(price_matrix):
+    fit = fit_linear_trend(price_matrix)
+    next_day = fit.predict([price_matrix.shape[1]])[:, 0]
+
+    for i, prices in enumerate(price_matrix):
+        expected = sklearn_reference(prices)
+        assert fit.slope[i] == pytest.approx(expected['slope'], rel=1e-9)
+        assert fit.intercept[i] == pytest.approx(expected['intercept'], rel=1e-9)
+        assert fit.train_r2[i] == pytest.approx(expected['train_r2'], rel=1e-9, abs=1e-12)
+        assert fit.test_r2[i] == pytest.approx(expected['test_r2'], rel=1e-9, abs=1e-12)
+        assert fit.train_rmse[i] == pytest.approx(expected['train_rmse'], rel=1e-9)
+        assert fit.test_rmse[i] == pytest.approx(expected['test_rmse'], rel=1e-9)
+        assert next_day[i] == pytest.approx(expected['next_day'], rel=1e-9)
+
+
+def test_predictor_wrapper_matches_sklearn():
+    prices = np.array([40000.0, 41000.0, 40500.0, 42000.0, 43000.0, 42500.0, 44000.0])
+    predictor = Predictor()
+    predictor.train(prices)
+    expected = sklearn_reference(prices)
+
+    assert predictor.train_score == pytest.approx(expected['train_r2'])
+    assert predictor.test_score == pytest.approx(expected['test_r2'])
+    assert predictor.predict_next_day() == pytest.approx(expected['next_day'])
+    assert predictor.predict_future(3).shape == (3,)
+
+
+def test_constant_prices_follow_r2_score_convention():
+    fit = fit_linear_trend(np.full((2, 10), 100.0))
+    assert np.all(fit.slope == 0.0)
+    assert np.all(fit.train_r2 == 1.0) and np.all(fit.test_r2 == 1.0)
+
+
+def test_batch_predictor_outputs_and_views(price_matrix):
+    histories = {f"asset-{i}": row for i, row in enumerate(price_matrix[:5])}
+    batch = BatchPredictor()
+    batch.train(histories)
+
+    predictions = batch.predict_next_day()
+    confidences = batch.get_confidence()
+    assert list(predictions) == list(histories)
+    assert all(0.0 <= c <= 1.0 for c in confidences.values())
+
+    views = batch.predictors(["asset-2"])
+    assert list(views) == ["asset-2"]
+    assert views["asset-2"].predict_next_day() == pytest.approx(predictions["asset-2"])
+    assert views["asset-2"].get_confidence() == pytest.approx(confidences["asset-2"])
+
+
+def test_batch_predictor_validation():
+    batch = BatchPredictor()
+    with pytest.raises(ValueError):
+        batch.predict_next_day()
+    with pytest.raises(ValueError):
+        batch.train({"a": np.ones(10), "b": np.ones(12)})
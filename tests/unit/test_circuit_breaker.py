@@ -0,0 +1,112 @@
+"""
+Unit tests for SourceCircuitBreaker
+"""
+
+import pytest
+from src.data.circuit_breaker import SourceCircuitBreaker, BreakerState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return SourceCircuitBreaker(failure_threshold=3, cooldown=5.0, max_cooldown=20.0, clock=clock)
+
+
+def test_opens_after_threshold(breaker):
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == BreakerState.CLOSED
+    
+    breaker.record_failure()
+    assert breaker.state == BreakerState.OPEN
+    assert breaker.allow_request() is False
+    assert breaker.rejected == 1
+
+
+def test_single_probe_after_cooldown(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    
+    clock.now = 5.0
+    assert breaker.allow_request() is True
+    assert breaker.state == BreakerState.HALF_OPEN
+    # Apenas uma prova por vez
+    assert breaker.allow_request() is False
+    
+    breaker.record_success()
+    assert breaker.state == BreakerState.CLOSED
+    assert breaker.allow_request() is True
+
+
+def test_failed_probe_backs_off_exponentially(breaker, clock):
+    for _ in range(3):
+        breaker.record_failure()
+    
+    expected_cooldowns = [10.0, 20.0, 20.0]  # dobra até o teto
+    for cooldown in expected_cooldowns:
+        clock.now = breaker.open_until
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.state == BreakerState.OPEN
+        assert breaker.cooldown == cooldown
+        assert breaker.open_until == clock.now + cooldown
+
+
+def test_lost_probe_is_retried_after_probe_timeout(clock):
+    breaker = SourceCircuitBreaker(failure_threshold=1, cooldown=1.0, probe_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    
+    clock.now = 1.0
+    assert breaker.allow_request() is True
+    clock.now = 5.0
+    assert breaker.allow_request() is False
+    clock.now = 11.0
+    assert breaker.allow_request() is True
+
+
+def test_released_probe_can_be_sent_again(clock):
+    breaker = SourceCircuitBreaker(failure_threshold=1, cooldown=1.0, probe_timeout=30.0, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 1.0
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+    breaker.release_probe()
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert breaker.allow_request() is True
+    assert breaker.allow_request() is False
+
+
+def test_probe_timeout_defaults_to_settings(monkeypatch):
+    from src.utils.config import settings
+    monkeypatch.setattr(settings, "BREAKER_PROBE_TIMEOUT_SECONDS", 12.5)
+    assert SourceCircuitBreaker().probe_timeout == 12.5
+
+
+async def test_shed_probe_is_released(clock):
+    from src.data.data_aggregator import DataSourceBase
+
+    source = DataSourceBase("Binance", rate_limit_per_minute=60)
+    source.breaker = SourceCircuitBreaker(failure_threshold=1, cooldown=1.0, probe_timeout=30.0, clock=clock)
+    source.breaker.record_failure()
+    clock.now = 1.0
+    assert source.breaker.allow_request() is True
+
+    async def shed(weight, max_wait=None):
+        return False
+
+    source.rate_limiter.acquire = shed
+    assert await source._acquire_quota() is False
+    assert source.breaker.allow_request() is True
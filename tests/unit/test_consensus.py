@@ -0,0 +1,97 @@
+"""
+Unit tests for the vectorized consensus engine
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime
+from src.data.consensus import compute_consensus
+from src.data.data_aggregator import MultiSourceAggregator, PriceData
+
+
+def scalar_consensus(prices, confidences, min_sources, max_deviation, source_weights=None):
+    """Consenso de referência via MultiSourceAggregator._build_consensus"""
+    aggregator = MultiSourceAggregator(sources=[])
+    if source_weights is not None:
+        aggregator._source_weights = lambda: {f"S{i}": w for i, w in enumerate(source_weights)}
+    results = []
+    for j in range(prices.shape[1]):
+        rows = [
+            PriceData(source=f"S{i}", symbol="X", price=float(prices[i, j]),
+                      volume_24h=None, timestamp=datetime.now(),
+                      confidence=float(confidences[i, j]))
+            for i in range(prices.shape[0]) if not np.isnan(prices[i, j])
+        ]
+        results.append(aggregator._build_consensus("X", rows, min_sources, max_deviation))
+    return results
+
+
+@pytest.mark.parametrize("num_sources", [2, 3, 5, 7])
+def test_matches_scalar_consensus(num_sources):
+    rng = np.random.default_rng(42 + num_sources)
+    num_symbols = 200
+    
+    prices = 100.0 * (1 + rng.normal(0, 0.02, size=(num_sources, num_symbols)))
+    # Outliers e fontes ausentes
+    outliers = rng.random((num_sources, num_symbols)) < 0.1
+    prices[outliers] *= rng.choice([0.5, 1.6], size=outliers.sum())
+    prices[rng.random((num_sources, num_symbols)) < 0.15] = np.nan
+    confidences = rng.uniform(80, 95, size=(num_sources, num_symbols))
+    
+    result = compute_consensus(prices, confidences, min_sources=2, max_deviation=5.0)
+    expected = scalar_consensus(prices, confidences, 2, 5.0)
+    
+    for j, reference in enumerate(expected):
+        if reference is None:
+            assert not result.valid[j]
+            continue
+        assert result.valid[j]
+        assert result.price[j] == pytest.approx(reference.price, rel=1e-12)
+        assert result.confidence[j] == pytest.approx(reference.confidence, rel=1e-12)
+        assert result.num_sources[j] == reference.metadata['num_sources']
+        assert result.deviation_pct[j] == pytest.approx(reference.metadata['price_deviation_pct'], rel=1e-9, abs=1e-12)
+        kept = {f"S{i}" for i in np.flatnonzero(result.kept[:, j])}
+        assert kept == set(reference.metadata['sources_used'])
+
+
+def test_source_weights_match_scalar_consensus():
+    rng = np.random.default_rng(7)
+    prices = 100.0 * (1 + rng.normal(0, 0.02, size=(4, 100)))
+    prices[rng.random((4, 100)) < 0.1] = np.nan
+    confidences = rng.uniform(80, 95, size=(4, 100))
+    source_weights = np.array([1.0, 0.2, 0.7, 0.05])
+    
+    result = compute_consensus(prices, confidences, min_sources=2, source_weights=source_weights)
+    unweighted = compute_consensus(prices, confidences, min_sources=2)
+    expected = scalar_consensus(prices, confidences, 2, 5.0, source_weights)
+    
+    for j, reference in enumerate(expected):
+        if reference is None:
+            assert not result.valid[j]
+            continue
+        assert result.price[j] == pytest.approx(reference.price, rel=1e-12)
+        # Pesos afetam só o preço, não a confiança reportada
+        assert result.confidence[j] == pytest.approx(unweighted.confidence[j], rel=1e-12)
+
+
+def test_outlier_removed_and_volume_summed():
+    prices = np.array([[50000.0], [50100.0], [80000.0]])
+    confidences = np.array([[95.0], [90.0], [85.0]])
+    volumes = np.array([[10.0], [np.nan], [30.0]])
+    
+    result = compute_consensus(prices, confidences, min_sources=2, max_deviation=5.0, volumes=volumes)
+    
+    assert result.valid[0]
+    assert result.kept[:, 0].tolist() == [True, True, False]
+    assert result.price[0] < 55000.0
+    assert result.volume[0] == 10.0
+
+
+def test_insufficient_sources():
+    prices = np.array([[100.0, np.nan], [np.nan, np.nan]])
+    confidences = np.full((2, 2), 90.0)
+    
+    result = compute_consensus(prices, confidences, min_sources=2)
+    
+    assert not result.valid.any()
+    assert np.isnan(result.price).all()
@@ -0,0 +1,57 @@
+"""
+Unit tests for fast JSON decoding and selective extraction
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.data import fast_json
+from src.data.data_aggregator import BinanceSource
+from src.data.symbols import SymbolRegistry
+
+
+def ticker(symbol, price):
+    return {
+        'symbol': symbol, 'lastPrice': str(price), 'volume': '10', 'highPrice': '1',
+        'lowPrice': '1', 'priceChangePercent': '0.5', 'count': 3
+    }
+
+
+def test_loads_matches_stdlib():
+    document = {'a': [1, 2.5, None, True], 'b': {'c': "ação"}}
+    raw = json.dumps(document).encode()
+    assert fast_json.loads(raw) == document
+    assert fast_json.loads(raw.decode()) == document
+    assert fast_json.loads(memoryview(raw)) == document
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_objects_decodes_only_wanted(indent):
+    tickers = [ticker(f"C{i}USDT", i) for i in range(500)]
+    raw = json.dumps(tickers, indent=indent).encode()
+    
+    found = dict(fast_json.iter_objects(raw, 'symbol', {"C7USDT", "C499USDT", "MISSINGUSDT"}))
+    
+    assert found == {"C7USDT": tickers[7], "C499USDT": tickers[499]}
+
+
+@pytest.mark.asyncio
+async def test_binance_large_batch_uses_all_tickers():
+    tickers = [ticker(f"C{i}USDT", i + 1) for i in range(3000)]
+    response = MagicMock(status=200, headers={})
+    response.read = AsyncMock(return_value=json.dumps(tickers).encode())
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=False)
+    session = MagicMock(closed=False)
+    session.get.return_value = context
+    
+    source = BinanceSource()
+    source.registry = SymbolRegistry()
+    source.bind_session(session)
+    symbols = [f"C{i}/USD" for i in range(0, 3000, 20)]  # 150 > ALL_TICKERS_THRESHOLD
+    results = await source.fetch_prices(symbols)
+    
+    assert session.get.call_args.kwargs['params'] is None
+    assert set(results) == set(symbols)
+    assert results["C40/USD"].price == 41.0
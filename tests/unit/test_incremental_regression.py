@@ -0,0 +1,91 @@
+"""
+Unit tests for incremental (online) trend regression
+"""
+
+import numpy as np
+import pytest
+from src.ml.incremental_regression import IncrementalTrend
+from src.ml.predictor import Predictor
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(5)
+    return 30000 + rng.normal(0, 150, size=1500).cumsum()
+
+
+def weighted_refit(prices, window=None, decay=1.0):
+    """Full weighted least-squares refit over the same points and weights"""
+    days = np.arange(len(prices), dtype=float)
+    weights = decay ** (len(prices) - 1 - days)
+    if window is not None:
+        days, prices, weights = days[-window:], prices[-window:], weights[-window:]
+
+    slope, intercept = np.polyfit(days, prices, 1, w=np.sqrt(weights))
+    residual = prices - (intercept + slope * days)
+    mean = np.average(prices, weights=weights)
+    r2 = 1 - np.sum(weights * residual ** 2) / np.sum(weights * (prices - mean) ** 2)
+    return slope, intercept, r2
+
+
+@pytest.mark.parametrize("window,decay", [(None, 1.0), (60, 1.0), (None, 0.98), (60, 0.95)])
+def test_incremental_matches_full_refit(prices, window, decay):
+    model = IncrementalTrend(window=window, decay=decay)
+    model.fit(prices[:100])
+
+    # Check after every update, including across window resyncs
+    for n in range(100, len(prices)):
+        model.update(prices[n])
+        if n % 97 == 0 or n == len(prices) - 1:
+            slope, intercept, r2 = weighted_refit(prices[:n + 1], window, decay)
+            assert model.slope == pytest.approx(slope, rel=1e-8, abs=1e-9)
+            assert model.predict([n + 1])[0] == pytest.approx(intercept + slope * (n + 1), rel=1e-9)
+            assert model.r2 == pytest.approx(r2, rel=1e-7, abs=1e-10)
+
+    assert model.count == (window or len(prices))
+
+
+def test_unbounded_fit_matches_polyfit(prices):
+    model = IncrementalTrend().fit(prices)
+    slope, intercept = np.polyfit(np.arange(len(prices)), prices, 1)
+    assert model.slope == pytest.approx(slope, rel=1e-9)
+    assert model.intercept == pytest.approx(intercept, rel=1e-9)
+
+
+def test_constant_prices():
+    model = IncrementalTrend(window=10).fit([100.0] * 25)
+    assert model.slope == 0.0
+    assert model.r2 == 1.0
+    assert model.rmse == 0.0
+    assert model.predict([25])[0] == pytest.approx(100.0)
+
+
+def test_parameter_validation():
+    with pytest.raises(ValueError):
+        IncrementalTrend(window=1)
+    with pytest.raises(ValueError):
+        IncrementalTrend(decay=0.0)
+
+
+def test_predictor_incremental_mode(prices):
+    predictor = Predictor(window=30)
+    predictor.train(prices[:200])
+    for price in prices[200:260]:
+        predictor.update(price)
+
+    # Same model as training from scratch on the last 30 prices
+    reference = Predictor(window=30)
+    reference.train(prices[:260])
+    assert predictor.predict_next_day() == pytest.approx(reference.predict_next_day(), rel=1e-9)
+    assert predictor.get_confidence() == pytest.approx(reference.get_confidence(), rel=1e-7)
+    assert predictor.predict_future(3).shape == (3,)
+
+
+def test_predictor_update_requires_incremental_mode(prices):
+    predictor = Predictor()
+    predictor.train(prices[:30])
+    with pytest.raises(ValueError):
+        predictor.update(prices[30])
+
+    with pytest.raises(ValueError):
+        Predictor(decay=0.9).update(1.0)
@@ -0,0 +1,41 @@
+"""
+Unit tests for LatencyHistogram
+"""
+
+import pytest
+from src.data.latency import LatencyHistogram
+
+
+def test_empty_histogram_has_no_percentiles():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(95) is None
+    assert histogram.snapshot()['p50'] is None
+
+
+def test_percentiles_within_bucket_error():
+    histogram = LatencyHistogram()
+    for latency in range(1, 101):  # 1..100ms uniformes
+        histogram.record(float(latency))
+    
+    p50 = histogram.percentile(50)
+    p95 = histogram.percentile(95)
+    
+    assert 50 <= p50 <= 50 * 1.25
+    assert 95 <= p95 <= 95 * 1.25
+    assert p50 < p95 <= histogram.percentile(99)
+
+
+def test_window_rotation_keeps_memory_fixed():
+    histogram = LatencyHistogram(window_size=10)
+    buckets = len(histogram._current)
+    
+    for _ in range(10):
+        histogram.record(1000.0)
+    for _ in range(25):
+        histogram.record(10.0)
+    
+    # Amostras antigas (1000ms) saíram das duas janelas
+    assert histogram.count <= 20
+    assert histogram.total_samples == 35
+    assert histogram.percentile(99) < 20
+    assert len(histogram._current) == buckets
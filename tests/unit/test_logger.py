@@ -0,0 +1,73 @@
+"""
+Unit tests for the non-blocking logging setup
+"""
+
+import logging
+import queue
+from unittest.mock import patch
+from src.utils import logger as log_utils
+from src.utils.logger import DroppingQueueHandler, RateLimitFilter
+
+
+def make_record(msg, *args, level=logging.INFO, name="test"):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_queue_handler_defers_formatting_and_drops_when_full():
+    log_queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+    
+    for i in range(5):
+        handler.handle(make_record("tick %d", i))
+    
+    assert log_queue.qsize() == 2
+    assert handler.dropped == 3
+    record = log_queue.get_nowait()
+    # Ainda não formatado no thread do chamador
+    assert record.msg == "tick %d" and record.args == (0,)
+    assert record.getMessage() == "tick 0"
+
+
+def test_rate_limit_filter_per_template():
+    clock = [0.0]
+    log_filter = RateLimitFilter(interval=10.0)
+    
+    with patch.object(log_utils.time, 'monotonic', side_effect=lambda: clock[0]):
+        assert log_filter.filter(make_record("cache hit %s", "BTC/USD"))
+        assert not log_filter.filter(make_record("cache hit %s", "ETH/USD"))
+        assert not log_filter.filter(make_record("cache hit %s", "SOL/USD"))
+        # Outro modelo de mensagem e WARNING não são limitados
+        assert log_filter.filter(make_record("fetch %s", "BTC/USD"))
+        assert log_filter.filter(make_record("cache hit %s", "X", level=logging.WARNING))
+        
+        clock[0] = 10.0
+        record = make_record("cache hit %s", "BTC/USD")
+        assert log_filter.filter(record)
+        assert record.getMessage() == "cache hit BTC/USD [+2 similar suppressed]"
+
+
+def test_setup_logger_uses_queue_handler():
+    with patch.object(log_utils.settings, 'LOG_ASYNC', True):
+        test_logger = log_utils.setup_logger("tests.unit.queue_logger", sample_interval=5.0)
+    
+    handler, = test_logger.handlers
+    assert isinstance(handler, DroppingQueueHandler)
+    assert isinstance(handler.filters[0], RateLimitFilter)
+    assert log_utils._listener is not None
+
+
+def test_rate_limit_filter_table_is_bounded():
+    clock = [0.0]
+    log_filter = RateLimitFilter(interval=10.0, max_templates=3)
+
+    with patch.object(log_utils.time, 'monotonic', side_effect=lambda: clock[0]):
+        # Pre-formatted messages: every price is a new template
+        for i in range(100):
+            clock[0] = float(i)
+            assert log_filter.filter(make_record(f"price {i}"))
+        assert len(log_filter._last) <= 3
+
+        # Expired templates with nothing suppressed are dropped
+        clock[0] = 1000.0
+        log_filter.filter(make_record("fetch %s", "BTC/USD"))
+        assert list(log_filter._last) == [("test", "fetch %s")]
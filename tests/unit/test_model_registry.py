@@ -0,0 +1,153 @@
+"""
+Unit tests for the trained-model registry
+"""
+
+import asyncio
+import pytest
+from src.ml.model_registry import ModelRegistry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingLoader:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.calls = []
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self, asset_id, days_back):
+        self.calls.append((asset_id, days_back))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("fetch failed")
+        return {'asset_id': asset_id, 'days_back': days_back, 'version': len(self.calls)}
+
+
+async def settle():
+    """Let background retrain tasks run to completion"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def make_registry(loader, clock, **kwargs):
+    options = dict(ttl=100.0, refresh_after=10.0, max_entries=8)
+    options.update(kwargs)
+    return ModelRegistry(loader=loader, clock=clock, **options)
+
+
+@pytest.mark.asyncio
+async def test_trains_once_and_serves_cached_model():
+    loader, clock = CountingLoader(), FakeClock()
+    registry = make_registry(loader, clock)
+
+    first = await registry.get("bitcoin", 30)
+    second = await registry.get("bitcoin", 30)
+
+    assert first is second
+    assert loader.calls == [("bitcoin", 30)]
+    assert registry.stats['hits'] == 1 and registry.stats['misses'] == 1
+
+    # days_back is part of the key
+    await registry.get("bitcoin", 7)
+    assert len(loader.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fit():
+    loader, clock = CountingLoader(delay=0.01), FakeClock()
+    registry = make_registry(loader, clock)
+
+    models = await asyncio.gather(*(registry.get("ethereum", 30) for _ in range(10)))
+
+    assert len(loader.calls) == 1
+    assert all(model is models[0] for model in models)
+
+
+@pytest.mark.asyncio
+async def test_stale_model_served_while_retraining_in_background():
+    loader, clock = CountingLoader(), FakeClock()
+    registry = make_registry(loader, clock)
+    original = await registry.get("bitcoin", 30)
+
+    clock.now = 50.0  # past refresh_after, within ttl
+    assert await registry.get("bitcoin", 30) is original
+    await settle()
+
+    refreshed = await registry.get("bitcoin", 30)
+    assert refreshed is not original
+    assert refreshed['version'] == 2
+    assert registry.stats['refreshes'] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_model():
+    loader, clock = CountingLoader(), FakeClock()
+    registry = make_registry(loader, clock)
+    original = await registry.get("bitcoin", 30)
+
+    loader.fail = True
+    clock.now = 50.0
+    assert await registry.get("bitcoin", 30) is original
+    await settle()
+    assert await registry.get("bitcoin", 30) is original
+    assert registry.stats['errors'] == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_model_retrained_in_foreground():
+    loader, clock = CountingLoader(), FakeClock()
+    registry = make_registry(loader, clock)
+    await registry.get("bitcoin", 30)
+
+    clock.now = 150.0
+    model = await registry.get("bitcoin", 30)
+    assert model['version'] == 2
+
+    # No model to fall back on: the loader error reaches the caller
+    loader.fail = True
+    clock.now = 300.0
+    with pytest.raises(RuntimeError):
+        await registry.get("bitcoin", 30)
+    assert ("bitcoin", 30, registry.model_version) not in registry
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_invalidation():
+    loader, clock = CountingLoader(), FakeClock()
+    registry = make_registry(loader, clock, max_entries=2)
+
+    await registry.get("bitcoin", 30)
+    await registry.get("ethereum", 30)
+    await registry.get("bitcoin", 30)  # ethereum is now least recently used
+    await registry.get("solana", 30)
+
+    assert len(registry) == 2
+    assert registry.key("ethereum", 30) not in registry
+    assert registry.key("bitcoin", 30) in registry
+
+    registry.invalidate("bitcoin")
+    assert registry.key("bitcoin", 30) not in registry
+
+
+@pytest.mark.asyncio
+async def test_cancelled_first_caller_does_not_cancel_shared_fit():
+    loader, clock = CountingLoader(delay=0.02), FakeClock()
+    registry = make_registry(loader, clock)
+
+    first = asyncio.ensure_future(registry.get("bitcoin", 30))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(registry.get("bitcoin", 30))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    model = await follower
+    assert first.cancelled()
+    assert model['version'] == 1
+    assert loader.calls == [("bitcoin", 30)]
+    assert registry.key("bitcoin", 30) in registry
@@ -0,0 +1,197 @@
+"""
+Unit tests for versioned model artifacts
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+from src.ml import model_registry
+from src.ml.gas_fees_predictor import GasFeesPredictor
+from src.ml.model_store import ModelStore, WatchedModel
+from src.ml.predictor import Predictor
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ModelStore(root=str(tmp_path), keep_versions=2)
+
+
+@pytest.fixture
+def prices():
+    return 30000 + np.random.default_rng(9).normal(0, 120, size=90).cumsum()
+
+
+def test_predictor_round_trip_memory_mapped(store, prices):
+    predictor = Predictor()
+    predictor.train(prices)
+
+    version = store.save("predictor-bitcoin-90d", predictor, {'asset_id': "bitcoin"})
+    loaded, metadata = store.load("predictor-bitcoin-90d")
+
+    assert version == 1 and metadata['version'] == 1
+    assert metadata['asset_id'] == "bitcoin"
+    assert metadata['n_samples'] == 90
+    assert metadata['metrics']['test_r2'] == pytest.approx(predictor.test_score)
+    assert isinstance(loaded.prices, np.memmap)
+    assert loaded.predict_next_day() == pytest.approx(predictor.predict_next_day())
+    assert loaded.get_confidence() == pytest.approx(predictor.get_confidence())
+
+
+def test_incremental_predictor_round_trip(store, prices):
+    predictor = Predictor(window=30, decay=0.98)
+    predictor.train(prices[:60])
+
+    store.save("predictor-eth-online", predictor)
+    loaded, _ = store.load("predictor-eth-online", mmap=False)
+
+    for price in prices[60:]:
+        predictor.update(price)
+        loaded.update(price)
+    assert loaded.predict_next_day() == pytest.approx(predictor.predict_next_day())
+
+
+def test_gas_predictor_round_trip(store):
+    predictor = GasFeesPredictor()
+    gas_data = predictor._generate_mock_gas_data(hours=5)
+    predictor.train(gas_data)
+
+    store.save("gas-fees", predictor)
+    loaded, metadata = store.load("gas-fees")
+
+    assert metadata['data_range']['points'] == len(gas_data)
+    assert metadata['n_estimators'] == 100
+    expected = predictor.predict_gas_fee(25.0, hour=12, weekday=2)
+    actual = loaded.predict_gas_fee(25.0, hour=12, weekday=2)
+    assert actual['predicted_base'] == pytest.approx(expected['predicted_base'])
+
+
+def test_versions_latest_pointer_and_pruning(store, prices, tmp_path):
+    predictor = Predictor()
+    predictor.train(prices)
+    for _ in range(4):
+        version = store.save("predictor-sol-30d", predictor)
+
+    assert version == 4
+    assert store.latest_version("predictor-sol-30d") == 4
+    assert store.versions("predictor-sol-30d") == [3, 4]
+    # No staging leftovers
+    assert sorted(os.listdir(tmp_path / "predictor-sol-30d")) == ["LATEST", "v000003", "v000004"]
+
+
+def test_watched_model_swaps_to_newer_artifact(store, prices):
+    watched = WatchedModel(store, "predictor-btc", check_interval=0)
+    assert watched.get() is None
+
+    first = Predictor()
+    first.train(prices)
+    store.save("predictor-btc", first)
+    model_v1 = watched.get()
+    assert watched.version == 1
+    assert watched.get() is model_v1  # unchanged version is not reloaded
+
+    second = Predictor()
+    second.train(prices * 2)
+    store.save("predictor-btc", second)
+    assert watched.version == 1
+    assert watched.get().predict_next_day() == pytest.approx(second.predict_next_day())
+    assert watched.version == 2
+
+
+def test_refuses_unknown_model_class_and_bad_names(store, prices):
+    predictor = Predictor()
+    predictor.train(prices)
+    store.save("predictor-x", predictor)
+
+    metadata_path = os.path.join(store.root, "predictor-x", "v000001", "metadata.json")
+    with open(metadata_path) as f:
+        metadata = json.load(f)
+    metadata['class'] = "os:system"
+    with open(metadata_path, 'w') as f:
+        json.dump(metadata, f)
+
+    with pytest.raises(ValueError):
+        store.load("predictor-x")
+    with pytest.raises(ValueError):
+        store.save("../escape", predictor)
+
+
+@pytest.mark.asyncio
+async def test_registry_loader_warm_starts_from_store(tmp_path, monkeypatch, prices):
+    monkeypatch.setattr(model_registry.settings, "MODEL_STORE_DIR", str(tmp_path))
+    monkeypatch.setattr(model_registry, "_store", None)
+
+    fetches = []
+
+    async def fake_fetch(self, asset_id, days=30):
+        fetches.append(asset_id)
+        return prices
+
+    async def inline_fit(model, *args, **kwargs):
+        model.train(*args)
+        return model
+
+    from src.ml.data_collector import DataCollector
+    from src.ml.training_executor import training_executor
+    monkeypatch.setattr(DataCollector, "fetch_asset_data", fake_fetch)
+    monkeypatch.setattr(training_executor, "fit", inline_fit)
+
+    trained = await model_registry.train_predictor("bitcoin", 90)
+    warm = await model_registry.train_predictor("bitcoin", 90)
+
+    assert fetches == ["bitcoin"]
+    assert isinstance(warm.prices, np.memmap)
+    assert warm.predict_next_day() == pytest.approx(trained.predict_next_day())
+    assert model_registry._store.metadata("predictor-bitcoin-90d")['model_version'] == model_registry.MODEL_VERSION
+
+
+@pytest.mark.asyncio
+async def test_gas_predictor_served_from_store_across_restarts(tmp_path, monkeypatch):
+    monkeypatch.setattr(model_registry.settings, "MODEL_STORE_DIR", str(tmp_path))
+    monkeypatch.setattr(model_registry, "_store", None)
+    monkeypatch.setattr(model_registry, "_gas_watch", None)
+    monkeypatch.setattr(model_registry, "_gas_model", None)
+
+    fits = []
+
+    async def inline_fit(model, *args, **kwargs):
+        fits.append(type(model).__name__)
+        model.train(*args)
+        return model
+
+    from src.ml.training_executor import training_executor
+    monkeypatch.setattr(training_executor, "fit", inline_fit)
+
+    gas_data = GasFeesPredictor()._generate_mock_gas_data(hours=5)
+    trained = await model_registry.train_gas_predictor(gas_data)
+
+    # Simulated restart: fresh process state, same store
+    monkeypatch.setattr(model_registry, "_store", None)
+    monkeypatch.setattr(model_registry, "_gas_watch", None)
+    monkeypatch.setattr(model_registry, "_gas_model", None)
+    loaded = await model_registry.train_gas_predictor(gas_data)
+
+    assert fits == ["GasFeesPredictor"]
+    assert loaded is not trained
+    assert model_registry._gas_watch.version == 1
+    expected = trained.predict_gas_fee(25.0, hour=12, weekday=2)
+    assert loaded.predict_gas_fee(25.0, hour=12, weekday=2)['predicted_base'] == pytest.approx(expected['predicted_base'])
+
+
+@pytest.mark.asyncio
+async def test_gas_predictor_reused_in_memory_without_store(monkeypatch):
+    monkeypatch.setattr(model_registry.settings, "MODEL_STORE_DIR", None)
+    monkeypatch.setattr(model_registry, "_store", None)
+    monkeypatch.setattr(model_registry, "_gas_model", None)
+
+    async def inline_fit(model, *args, **kwargs):
+        model.train(*args)
+        return model
+
+    from src.ml.training_executor import training_executor
+    monkeypatch.setattr(training_executor, "fit", inline_fit)
+
+    gas_data = GasFeesPredictor()._generate_mock_gas_data(hours=5)
+    first = await model_registry.train_gas_predictor(gas_data)
+    assert await model_registry.train_gas_predictor(gas_data) is first
@@ -0,0 +1,164 @@
+"""
+Unit tests for the bounded price cache
+"""
+
+import fnmatch
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from src.data.data_aggregator import PriceData
+from src.data.price_cache import LRUPriceCache, RedisPriceCache
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis-py calls used by RedisPriceCache"""
+
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+        self.threads = set()
+        self.scans = 0
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.threads.add(threading.get_ident())
+        self.store[key] = value
+        self.expiry[key] = ex
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+    def scan_iter(self, match="*"):
+        self.scans += 1
+        return [k for k in list(self.store) if fnmatch.fnmatch(k, match)]
+
+
+def price(symbol, value=100.0):
+    return PriceData(
+        source="MultiSource-Aggregator",
+        symbol=symbol,
+        price=value,
+        volume_24h=1e6,
+        timestamp=datetime.now(),
+        confidence=90.0,
+        metadata={'num_sources': 2}
+    )
+
+
+def make_cache(**kwargs):
+    options = dict(
+        default_ttl=timedelta(seconds=60),
+        class_ttls={'BTC/USD': timedelta(seconds=5)},
+        max_age=timedelta(seconds=300),
+    )
+    options.update(kwargs)
+    return LRUPriceCache(**options)
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = make_cache(max_entries=2)
+    now = datetime.now()
+
+    cache["BTC/USD"] = (price("BTC/USD"), now)
+    cache["ETH/USD"] = (price("ETH/USD"), now)
+    cache.lookup("BTC/USD")  # BTC passa a ser o mais recente
+    cache["SOL/USD"] = (price("SOL/USD"), now)
+
+    assert set(cache) == {"BTC/USD", "SOL/USD"}
+    assert cache.evictions == 1
+
+
+def test_per_symbol_ttl_and_counters():
+    cache = make_cache()
+    aged = datetime.now() - timedelta(seconds=10)
+    cache["BTC/USD"] = (price("BTC/USD"), aged)
+    cache["DOGE/USD"] = (price("DOGE/USD"), aged)
+
+    assert cache.ttl_for("BTC/USD") == timedelta(seconds=5)
+    assert cache.ttl_for("DOGE/USD") == timedelta(seconds=60)
+
+    _, age = cache.lookup("BTC/USD")    # além do TTL de major: stale
+    assert age >= timedelta(seconds=10)
+    assert cache.lookup("DOGE/USD")     # long-tail ainda fresco
+    assert cache.lookup("XRP/USD") is None
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['stale_hits'], stats['misses']) == (1, 1, 1)
+    assert stats['entries'] == 2
+
+
+def test_entries_past_max_age_are_dropped():
+    cache = make_cache()
+    cache["BTC/USD"] = (price("BTC/USD"), datetime.now() - timedelta(seconds=301))
+
+    assert cache.lookup("BTC/USD") is None
+    assert "BTC/USD" not in cache
+    assert cache.expirations == 1
+
+
+def test_unrecorded_lookup_leaves_counters_untouched():
+    cache = make_cache()
+    cache["BTC/USD"] = (price("BTC/USD"), datetime.now())
+
+    assert cache.lookup("BTC/USD", record=False) is not None
+    assert cache.lookup("ETH/USD", record=False) is None
+    assert cache.hits == cache.misses == 0
+
+
+def test_redis_backend_round_trip():
+    client = FakeRedis()
+    cache = RedisPriceCache(
+        client=client,
+        default_ttl=timedelta(seconds=60),
+        max_age=timedelta(seconds=300),
+    )
+    saved_at = datetime.now()
+    original = price("BTC/USD", 50000.0)
+
+    cache["BTC/USD"] = (original, saved_at)
+    assert client.expiry["decai:price:BTC/USD"] == 300
+
+    data, restored_at = cache["BTC/USD"]
+    assert data == original
+    assert restored_at == saved_at
+    assert list(cache) == ["BTC/USD"]
+
+    cache.clear()
+    assert len(cache) == 0
+    with pytest.raises(KeyError):
+        cache["BTC/USD"]
+
+
+async def test_redis_async_calls_run_off_the_event_loop():
+    client = FakeRedis()
+    cache = RedisPriceCache(client=client, default_ttl=timedelta(seconds=60))
+
+    await cache.astore("BTC/USD", (price("BTC/USD", 50000.0), datetime.now()))
+    data, age = await cache.alookup("BTC/USD")
+    assert data.price == 50000.0
+    assert age < timedelta(seconds=60)
+    assert await cache.alookup("ETH/USD") is None
+
+    assert threading.get_ident() not in client.threads
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_redis_len_uses_local_counter():
+    client = FakeRedis()
+    cache = RedisPriceCache(client=client, default_ttl=timedelta(seconds=60))
+    cache["BTC/USD"] = (price("BTC/USD"), datetime.now())
+    cache["ETH/USD"] = (price("ETH/USD"), datetime.now())
+    cache["BTC/USD"] = (price("BTC/USD", 101.0), datetime.now())
+
+    assert len(cache) == 2
+    assert cache.stats()['entries'] == 2
+    assert client.scans == 0
+
+    # Expirada no Redis: a leitura remove o símbolo da contagem
+    client.delete("decai:price:ETH/USD")
+    assert cache.lookup("ETH/USD") is None
+    assert len(cache) == 1
@@ -0,0 +1,70 @@
+"""
+Unit tests for TokenBucketLimiter
+"""
+
+import pytest
+from src.data.rate_limiter import TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.mark.asyncio
+async def test_burst_up_to_capacity_then_shed(clock):
+    limiter = TokenBucketLimiter(limit_per_minute=60, clock=clock)  # 1 token/s
+    
+    for _ in range(60):
+        assert await limiter.acquire(1, max_wait=0) is True
+    
+    assert await limiter.acquire(1, max_wait=0) is False
+    assert limiter.shed == 1
+    assert limiter.headroom() == 0.0
+
+
+def test_refill_over_time(clock):
+    limiter = TokenBucketLimiter(limit_per_minute=60, clock=clock)
+    limiter.tokens = 0.0
+    
+    assert limiter.wait_time(5) == pytest.approx(5.0)
+    clock.now = 3.0
+    assert limiter.wait_time(5) == pytest.approx(2.0)
+    assert limiter.headroom() == pytest.approx(3 / 60)
+
+
+@pytest.mark.asyncio
+async def test_queued_request_waits_for_refill():
+    limiter = TokenBucketLimiter(limit_per_minute=600)  # 10 tokens/s
+    limiter.tokens = 0.0
+    
+    assert await limiter.acquire(1, max_wait=0.5) is True
+    assert 0.05 <= limiter.waited_seconds <= 0.15
+
+
+def test_retry_after_pauses_bucket(clock):
+    limiter = TokenBucketLimiter(limit_per_minute=60, clock=clock)
+    limiter.observe_headers({'Retry-After': '20'}, status=429)
+    
+    assert limiter.throttled == 1
+    assert limiter.wait_time(1) == pytest.approx(20.0)
+    clock.now = 21.0
+    assert limiter.wait_time(1) == 0.0
+
+
+def test_weight_headers_sync_budget(clock):
+    limiter = TokenBucketLimiter(limit_per_minute=6000, clock=clock)
+    
+    limiter.observe_headers({'X-MBX-USED-WEIGHT-1M': '5900'})
+    assert limiter.tokens == pytest.approx(100)
+    
+    limiter.observe_headers({'X-RateLimit-Remaining': '10'})
+    assert limiter.tokens == pytest.approx(10)
@@ -0,0 +1,146 @@
+"""
+Unit tests for aggregator snapshots (warm restarts)
+"""
+
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from src.data.data_aggregator import (
+    DataSourceBase, DataSourceStatus, MultiSourceAggregator, PriceData
+)
+from src.data.snapshot import read_snapshot
+from src.data.ticks import TickBatch
+
+
+def make_aggregator():
+    return MultiSourceAggregator(sources=[DataSourceBase("Binance"), DataSourceBase("CoinGecko")])
+
+
+def consensus(symbol, price):
+    return PriceData(
+        source="MultiSource-Aggregator",
+        symbol=symbol,
+        price=price,
+        volume_24h=None if symbol == "ETH/USD" else 2000.0,
+        timestamp=datetime.now(),
+        confidence=92.5,
+        metadata={
+            'sources_used': ["Binance", "CoinGecko"],
+            'num_sources': 2,
+            'price_std_dev': 7.07,
+            'price_deviation_pct': 0.014,
+            'individual_prices': {"Binance": price - 5, "CoinGecko": price + 5},
+        }
+    )
+
+
+def test_round_trip_restores_cache_health_and_latency(tmp_path):
+    path = str(tmp_path / "aggregator.snap")
+    before = make_aggregator()
+    saved_at = datetime.now() - timedelta(seconds=3)
+    before.cache["BTC/USD"] = (consensus("BTC/USD", 50000.0), saved_at)
+    before.cache["ETH/USD"] = (consensus("ETH/USD", 3000.0), saved_at)
+
+    binance = before.sources[0]
+    for latency in (20.0, 40.0, 80.0):
+        binance.update_health(True, latency)
+    before.sources[1].update_health(False, 5000.0)
+
+    assert before.save_snapshot(path) > 0
+
+    after = make_aggregator()
+    assert after.load_snapshot(path) is True
+
+    data, restored_at = after.cache["BTC/USD"]
+    original = before.cache["BTC/USD"][0]
+    assert data.price == original.price
+    assert data.metadata == original.metadata
+    assert abs((restored_at - saved_at).total_seconds()) < 1e-5
+    assert after.cache["ETH/USD"][0].volume_24h is None
+
+    restored = after.sources[0]
+    assert restored.health.status == DataSourceStatus.HEALTHY
+    assert restored.health.total_requests == 3
+    assert restored.latency.snapshot() == binance.latency.snapshot()
+    assert after.sources[1].health.consecutive_failures == 1
+
+
+def test_tables_are_memory_mapped(tmp_path):
+    path = str(tmp_path / "aggregator.snap")
+    aggregator = make_aggregator()
+    aggregator.cache["BTC/USD"] = (consensus("BTC/USD", 50000.0), datetime.now())
+    aggregator.save_snapshot(path)
+
+    header, tables = read_snapshot(path)
+    assert isinstance(tables['cache'], np.memmap)
+    assert header['symbols'][int(tables['cache'][0]['symbol'])] == "BTC/USD"
+    assert header['sources'] == ["Binance", "CoinGecko"]
+    assert tables['latency'].shape[0] == 2
+
+
+def test_round_trip_restores_tick_history(tmp_path):
+    path = str(tmp_path / "aggregator.snap")
+    before = make_aggregator()
+    for i in range(3):
+        tick = consensus("BTC/USD", 50000.0 + i)
+        before.history.record_consensus(tick)
+        before.history.record_source(PriceData(
+            source="Binance", symbol="BTC/USD", price=tick.price - 5,
+            volume_24h=None, timestamp=tick.timestamp, confidence=95.0
+        ))
+    before.save_snapshot(path)
+
+    header, tables = read_snapshot(path)
+    assert tables['ticks'].dtype == TickBatch.RECORD_DTYPE
+    assert len(tables['ticks']) == 6
+
+    after = make_aggregator()
+    assert after.load_snapshot(path) is True
+    for source in (None, "Binance"):
+        original = before.history.window("BTC/USD", source=source)
+        restored = after.history.window("BTC/USD", source=source)
+        np.testing.assert_array_equal(restored.price, original.price)
+        np.testing.assert_array_equal(restored.ts_ns, original.ts_ns)
+    assert after.history.sources("BTC/USD") == ["Binance"]
+
+
+def test_invalid_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "aggregator.snap"
+    path.write_bytes(b"not a snapshot")
+
+    aggregator = make_aggregator()
+    assert aggregator.load_snapshot(str(path)) is False
+    assert len(aggregator.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_snapshot_written_on_close_and_loaded_on_startup(tmp_path, monkeypatch):
+    from src.utils.config import settings
+    path = str(tmp_path / "aggregator.snap")
+    monkeypatch.setattr(settings, "SNAPSHOT_PATH", path)
+
+    async with make_aggregator() as aggregator:
+        aggregator.cache["BTC/USD"] = (consensus("BTC/USD", 50000.0), datetime.now())
+
+    restarted = make_aggregator()
+    result = await restarted.get_price("BTC/USD")
+    assert result.price == 50000.0
+
+
+@pytest.mark.asyncio
+async def test_async_save_uses_unique_temp_files(tmp_path):
+    path = str(tmp_path / "aggregator.snap")
+    aggregator = make_aggregator()
+    aggregator.cache["BTC/USD"] = (consensus("BTC/USD", 50000.0), datetime.now())
+    aggregator.history.record_consensus(consensus("BTC/USD", 50000.0))
+
+    # Concurrent writers (e.g. workers sharing the path) must not clobber a shared temp file
+    sizes = await asyncio.gather(*(aggregator.save_snapshot_async(path) for _ in range(4)))
+
+    assert all(size and size > 0 for size in sizes)
+    assert os.listdir(tmp_path) == ["aggregator.snap"]
+    header, tables = read_snapshot(path)
+    assert len(tables['ticks']) == 1
@@ -0,0 +1,66 @@
+"""
+Unit tests for adaptive timeouts and dynamic source weights
+"""
+
+import pytest
+from src.data.data_aggregator import DataSourceBase
+from src.data.source_quality import SourceQuality
+
+
+def test_weight_neutral_until_min_samples():
+    quality = SourceQuality(alpha=0.1, deviation_scale=0.5, min_weight=0.05, min_samples=5)
+    for _ in range(4):
+        quality.record_deviation(10.0)
+    assert quality.weight == 1.0
+    
+    quality.record_deviation(10.0)
+    assert quality.weight == pytest.approx(0.05)  # 1 / (1 + 20) → piso
+
+
+def test_weight_tracks_deviation_and_success():
+    quality = SourceQuality(alpha=0.1, deviation_scale=0.5, min_weight=0.05, min_samples=1)
+    for _ in range(50):
+        quality.record_deviation(0.5)
+    assert quality.weight == pytest.approx(0.5)
+    
+    # Falhas recentes reduzem o peso; recuperação é gradual
+    for _ in range(10):
+        quality.record_outcome(False)
+    degraded = quality.weight
+    assert degraded < 0.5
+    for _ in range(100):
+        quality.record_outcome(True)
+    assert degraded < quality.weight <= 0.5
+
+
+def test_recent_behaviour_dominates():
+    quality = SourceQuality(alpha=0.2, deviation_scale=0.5, min_weight=0.05, min_samples=1)
+    for _ in range(100):
+        quality.record_deviation(5.0)
+    drifting = quality.weight
+    for _ in range(30):
+        quality.record_deviation(0.0)
+    assert quality.weight > 0.9 > drifting
+
+
+def test_request_timeout_adapts_to_latency():
+    source = DataSourceBase("Test", timeout=5)
+    assert source.request_timeout() == 5
+    
+    for _ in range(100):
+        source.update_health(True, 400.0)
+    # 2 × p99 (limite do bucket, até 25% acima da latência real)
+    assert 0.8 <= source.request_timeout() <= 1.0
+
+
+def test_timed_out_requests_raise_adaptive_timeout():
+    source = DataSourceBase("Test", timeout=5)
+    for _ in range(100):
+        source.update_health(True, 100.0)
+    tight = source.request_timeout()
+    
+    # Fonte ficou lenta: cada requisição estoura o timeout atual
+    for _ in range(20):
+        source.update_health(False, source.request_timeout() * 1000)
+    assert source.request_timeout() > tight
+    assert source.request_timeout() <= 5
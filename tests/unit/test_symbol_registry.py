@@ -0,0 +1,101 @@
+"""
+Unit tests for the symbol registry and per-source symbol mapping
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.data.data_aggregator import BinanceSource, CoinCapSource, CoinGeckoSource
+from src.data.symbols import SymbolRegistry
+
+
+def mock_session(payload):
+    response = MagicMock(status=200, headers={})
+    response.read = AsyncMock(return_value=json.dumps(payload).encode())
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=False)
+    session = MagicMock(closed=False)
+    session.get.return_value = context
+    return session
+
+
+def with_registry(source, registry):
+    source.registry = registry
+    return source
+
+
+def test_bidirectional_maps_and_replace():
+    registry = SymbolRegistry()
+    registry.register("CoinCap", {"BTC/USD": "bitcoin"})
+    assert registry.to_source("CoinCap", "BTC/USD") == "bitcoin"
+    assert registry.from_source("CoinCap", "bitcoin") == "BTC/USD"
+    assert not registry.is_loaded("CoinCap")
+
+    registry.replace("CoinCap", {"ETH/USD": "ethereum", "SOL/USD": "solana"})
+    assert registry.is_loaded("CoinCap")
+    assert registry.to_source("CoinCap", "BTC/USD") is None
+    assert registry.symbols("CoinCap") == ["ETH/USD", "SOL/USD"]
+    assert registry.sources_for("SOL/USD") == ["CoinCap"]
+
+
+@pytest.mark.parametrize("symbol,expected", [
+    ("BTC/USD", "BTCUSDT"),
+    ("DOT/USD", "DOTUSDT"),
+    ("BTC/USDT", "BTCUSDT"),   # antes: 'BTC/USDT' (barra mantida)
+    ("ETH/BTC", "ETHBTC"),     # antes: 'ETHBTCT'
+    ("BTC", None),
+])
+def test_binance_rule_before_universe_is_loaded(symbol, expected):
+    assert BinanceSource._to_binance_symbol(symbol, SymbolRegistry()) == expected
+
+
+@pytest.mark.asyncio
+async def test_binance_universe_is_authoritative():
+    registry = SymbolRegistry()
+    source = with_registry(BinanceSource(), registry)
+    source.bind_session(mock_session({'symbols': [
+        {'symbol': 'BTCUSDT', 'baseAsset': 'BTC', 'quoteAsset': 'USDT', 'status': 'TRADING'},
+        {'symbol': 'ETHBTC', 'baseAsset': 'ETH', 'quoteAsset': 'BTC', 'status': 'TRADING'},
+        {'symbol': 'LUNAUSDT', 'baseAsset': 'LUNA', 'quoteAsset': 'USDT', 'status': 'BREAK'},
+    ]}))
+
+    assert await source.refresh_symbols() == 2
+    assert registry.from_source("Binance", "BTCUSDT") == "BTC/USD"
+    assert source.supports("ETH/BTC")
+    assert not source.supports("LUNA/USD")
+    assert not source.supports("DOT/USD")
+
+
+@pytest.mark.asyncio
+async def test_coingecko_universe_keeps_static_overrides():
+    registry = SymbolRegistry()
+    source = with_registry(CoinGeckoSource(), registry)
+    registry.register(source.name, source.SYMBOL_MAP)
+    source.bind_session(mock_session([
+        {'id': 'bitcoin', 'symbol': 'btc'},
+        {'id': 'dogecoin', 'symbol': 'doge'},
+        {'id': 'doge-clone', 'symbol': 'doge'},
+    ]))
+
+    assert not source.supports("DOGE/USD")
+    await source.refresh_symbols()
+    assert registry.to_source("CoinGecko", "DOGE/USD") == "dogecoin"
+    assert registry.to_source("CoinGecko", "ADA/USD") == "cardano"
+    assert source.supports("DOGE/USD")
+
+
+@pytest.mark.asyncio
+async def test_coincap_batch_only_requests_mapped_assets():
+    registry = SymbolRegistry()
+    source = with_registry(CoinCapSource(), registry)
+    registry.register(source.name, {"BTC/USD": "bitcoin"})
+    session = mock_session({'data': [{
+        'id': 'bitcoin', 'priceUsd': '50000', 'volumeUsd24Hr': '1',
+        'marketCapUsd': '1', 'changePercent24Hr': '0.1'
+    }]})
+    source.bind_session(session)
+
+    results = await source.fetch_prices(["BTC/USD", "XYZ/USD"])
+    assert list(results) == ["BTC/USD"]
+    assert session.get.call_args.kwargs['params'] == {'ids': 'bitcoin'}
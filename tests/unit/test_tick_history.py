@@ -0,0 +1,141 @@
+"""
+Unit tests for the tick history ring buffers
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from src.data.data_aggregator import PriceData
+from src.data.tick_history import TickHistory, TickRingBuffer
+from src.data.ticks import SymbolTable, Tick, TickBatch
+
+
+def fill(buffer, values, start_ns=0):
+    for i, value in enumerate(values):
+        buffer.append(Tick(0, 0, float(value), np.nan, 90.0, start_ns + i))
+
+
+def test_grows_until_capacity_then_wraps():
+    buffer = TickRingBuffer(capacity=8, initial_capacity=2)
+    fill(buffer, range(5))
+    assert len(buffer) == 5
+    np.testing.assert_array_equal(buffer.last().price, [0, 1, 2, 3, 4])
+
+    fill(buffer, range(5, 20), start_ns=5)
+    assert len(buffer) == 8
+    assert buffer.total == 20
+    np.testing.assert_array_equal(buffer.last().price, np.arange(12, 20))
+    np.testing.assert_array_equal(buffer.last(3).ts_ns, [17, 18, 19])
+
+
+def test_windows_are_read_only_views():
+    buffer = TickRingBuffer(capacity=4, initial_capacity=4)
+    fill(buffer, range(6))
+    window = buffer.last()
+
+    assert isinstance(window, TickBatch)
+    assert np.shares_memory(window.price, buffer._columns['price'])
+    with pytest.raises(ValueError):
+        window.price[0] = 1.0
+    assert window[-1] == Tick(0, 0, 5.0, np.nan, 90.0, 5)
+
+
+def test_since_uses_timestamps():
+    buffer = TickRingBuffer(capacity=16)
+    fill(buffer, range(10), start_ns=100)
+    np.testing.assert_array_equal(buffer.since(105).price, [5, 6, 7, 8, 9])
+    assert len(buffer.since(1000).price) == 0
+
+
+def test_history_minutes_window():
+    history = TickHistory(capacity=16, table=SymbolTable())
+    now = datetime.now()
+    for minutes_ago, price in ((30, 1.0), (3, 2.0), (1, 3.0)):
+        history.record_consensus(PriceData(
+            source="MultiSource-Aggregator", symbol="ETH/USD", price=price,
+            volume_24h=None, timestamp=now - timedelta(minutes=minutes_ago), confidence=90.0
+        ))
+
+    np.testing.assert_array_equal(history.window("ETH/USD", minutes=5).price, [2.0, 3.0])
+    np.testing.assert_array_equal(history.window("ETH/USD", minutes=5, last=1).price, [3.0])
+    assert np.isnan(history.window("ETH/USD").volume).all()
+    assert len(history.window("BTC/USD").price) == 0
+    assert history.symbols() == ["ETH/USD"]
+
+
+def test_history_windows_convert_back_to_price_data():
+    table = SymbolTable()
+    history = TickHistory(capacity=4, table=table)
+    data = PriceData(
+        source="Binance", symbol="BTC/USD", price=50000.0,
+        volume_24h=1200.0, timestamp=datetime.now(), confidence=95.0
+    )
+    history.record_source(data)
+    history.record_consensus(data)
+
+    restored = history.window("BTC/USD", source="Binance").to_price_data()
+    assert [(p.source, p.price, p.volume_24h) for p in restored] == [("Binance", 50000.0, 1200.0)]
+    assert restored[0].timestamp == data.timestamp
+    assert history.window("BTC/USD")[0].source_id == table.lookup(TickHistory.CONSENSUS)
+
+
+def test_extend_keeps_the_newest_ticks_and_restore_remaps_ids():
+    buffer = TickRingBuffer(capacity=4, initial_capacity=2)
+    fill(buffer, range(3))
+    source = TickRingBuffer(capacity=8)
+    fill(source, range(3, 8), start_ns=3)
+    buffer.extend(source.last())
+    np.testing.assert_array_equal(buffer.last().price, [4, 5, 6, 7])
+    assert buffer.total == 8
+
+    exported_table = SymbolTable()
+    history = TickHistory(capacity=4, table=exported_table)
+    now = datetime.now()
+    for i in range(3):
+        history.record_source(PriceData(
+            source="CoinGecko", symbol="SOL/USD", price=100.0 + i,
+            volume_24h=None, timestamp=now, confidence=90.0
+        ))
+
+    target_table = SymbolTable()
+    target_table.intern("unrelated")
+    restored = TickHistory(capacity=4, table=target_table)
+    restored.restore(history.export())
+    assert restored.sources("SOL/USD") == ["CoinGecko"]
+    window = restored.window("SOL/USD", source="CoinGecko")
+    np.testing.assert_array_equal(window.price, [100.0, 101.0, 102.0])
+    assert window.to_price_data()[0].source == "CoinGecko"
+
+
+def test_extend_fresh_buffer_past_initial_capacity():
+    source = TickRingBuffer(capacity=256)
+    fill(source, range(100))
+
+    buffer = TickRingBuffer(capacity=2048)
+    buffer.extend(source.last())
+    assert len(buffer) == 100
+    np.testing.assert_array_equal(buffer.last().price, np.arange(100))
+
+    # Parcialmente cheio, crescendo de novo no meio do extend
+    buffer.extend(source.last())
+    np.testing.assert_array_equal(buffer.last().price, np.concatenate([np.arange(100)] * 2))
+    fill(buffer, [7.0], start_ns=200)
+    assert buffer.last(1).price[0] == 7.0
+
+
+def test_export_restore_round_trip_beyond_initial_capacity():
+    history = TickHistory(capacity=512, table=SymbolTable())
+    start = datetime.now() - timedelta(minutes=10)
+    for i in range(300):
+        history.record_source(PriceData(
+            source="Binance", symbol="BTC/USD", price=50000.0 + i,
+            volume_24h=None, timestamp=start + timedelta(seconds=i), confidence=95.0
+        ))
+
+    restored = TickHistory(capacity=512, table=SymbolTable())
+    restored.restore(history.export())
+    window = restored.window("BTC/USD", source="Binance")
+    assert len(window) == 300
+    np.testing.assert_array_equal(window.price, 50000.0 + np.arange(300))
+    np.testing.assert_array_equal(window.ts_ns, history.window("BTC/USD", source="Binance").ts_ns)
@@ -0,0 +1,96 @@
+"""
+Unit tests for the compact tick representation
+"""
+
+import math
+from datetime import datetime
+
+import numpy as np
+import pytest
+from src.data.data_aggregator import PriceData
+from src.data.ticks import SymbolTable, Tick, TickBatch, from_epoch_ns, to_epoch_ns
+
+
+def price(source, symbol, value, volume=1000.0):
+    return PriceData(
+        source=source,
+        symbol=symbol,
+        price=value,
+        volume_24h=volume,
+        timestamp=datetime(2024, 1, 1, 12, 0, 0, 123456),
+        confidence=95.0,
+        metadata={'ignored': True}
+    )
+
+
+def test_symbol_table_interns_stable_ids():
+    table = SymbolTable()
+    assert table.intern("Binance") == 0
+    assert table.intern("CoinGecko") == 1
+    assert table.intern("Binance") == 0
+    assert table.name(1) == "CoinGecko"
+    assert table.lookup("CoinCap") is None
+    assert len(table) == 2
+
+
+def test_epoch_ns_round_trip():
+    ts = datetime(2024, 1, 1, 12, 0, 0, 123456)
+    assert to_epoch_ns(ts) % 1000 == 0
+    assert from_epoch_ns(to_epoch_ns(ts)) == ts
+
+
+def test_tick_is_slotted_and_round_trips():
+    table = SymbolTable()
+    original = price("Binance", "BTC/USD", 50000.0, volume=None)
+    tick = Tick.from_price_data(original, table)
+
+    assert not hasattr(tick, '__dict__')
+    assert math.isnan(tick.volume)
+
+    restored = tick.to_price_data(table)
+    assert restored.source == "Binance"
+    assert restored.price == 50000.0
+    assert restored.volume_24h is None
+    assert restored.timestamp == original.timestamp
+    assert restored.metadata == {}
+
+
+def test_batch_grows_and_exposes_column_views():
+    table = SymbolTable()
+    batch = TickBatch(capacity=2, table=table)
+    for i in range(5):
+        batch.append_price_data(price("Binance", "BTC/USD", 50000.0 + i))
+    batch.append(Tick.from_price_data(price("CoinCap", "ETH/USD", 3000.0), table))
+
+    assert len(batch) == 6
+    np.testing.assert_array_equal(batch.price[:5], 50000.0 + np.arange(5))
+    assert batch.price.base is not None  # view, sem cópia
+    assert batch[-1].symbol_id == table.lookup("ETH/USD")
+    assert batch[0] == Tick.from_price_data(price("Binance", "BTC/USD", 50000.0), table)
+
+    with pytest.raises(IndexError):
+        batch[6]
+
+
+def test_batch_from_price_data():
+    table = SymbolTable()
+    items = [price("Binance", "BTC/USD", 50000.0), price("CoinGecko", "BTC/USD", 50010.0, volume=None)]
+    batch = TickBatch.from_price_data(items, table)
+
+    restored = batch.to_price_data()
+    assert [p.source for p in restored] == ["Binance", "CoinGecko"]
+    assert restored[1].volume_24h is None
+    assert batch.nbytes == 2 * (4 + 4 + 8 + 8 + 8 + 8)
+
+
+def test_batch_slices_are_views_and_copy_on_append():
+    table = SymbolTable()
+    batch = TickBatch.from_price_data([price("Binance", "BTC/USD", 50000.0 + i) for i in range(4)], table)
+
+    tail = batch[2:]
+    assert len(tail) == 2
+    assert np.shares_memory(tail.price, batch.price)
+    tail.append(Tick.from_price_data(price("Binance", "BTC/USD", 1.0), table))
+    assert not np.shares_memory(tail.price, batch.price)
+    np.testing.assert_array_equal(tail.price, [50002.0, 50003.0, 1.0])
+    assert len(batch) == 4
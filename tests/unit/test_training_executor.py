@@ -0,0 +1,126 @@
+"""
+Unit tests for the training executor
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+from src.ml.gas_fees_predictor import GasFeesPredictor
+from src.ml.predictor import Predictor
+from src.ml.training_executor import TrainingExecutor, TrainingQueueFull, TrainingTimeout
+
+
+class BlockingModel:
+    """Model whose fit waits until the test releases it (thread mode only)"""
+
+    def __init__(self, gate: threading.Event):
+        self.gate = gate
+        self.is_trained = False
+
+    def train(self, data):
+        self.gate.wait(5)
+        self.is_trained = True
+
+
+@pytest.fixture(scope="module")
+def process_executor():
+    executor = TrainingExecutor(max_workers=1, max_pending=4, timeout=60, shared_memory_min_bytes=0)
+    yield executor
+    executor.shutdown()
+
+
+async def wait_until(condition, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_process_fit_matches_inline_fit(process_executor):
+    prices = 30000 + np.random.default_rng(2).normal(0, 100, size=5000).cumsum()
+
+    trained = await process_executor.fit(Predictor(), prices)
+    reference = Predictor()
+    reference.train(prices)
+
+    assert trained.is_trained
+    assert trained.predict_next_day() == pytest.approx(reference.predict_next_day())
+    assert trained.get_confidence() == pytest.approx(reference.get_confidence())
+    # The shared input is not copied back: the model points at the caller's array
+    assert trained.prices is prices
+    await wait_until(lambda: process_executor.pending == 0)
+
+
+@pytest.mark.asyncio
+async def test_process_fit_gas_predictor(process_executor):
+    predictor = GasFeesPredictor()
+    gas_data = predictor._generate_mock_gas_data(hours=5)
+
+    trained = await process_executor.fit(predictor, gas_data)
+
+    assert trained.is_trained
+    assert trained.predict_gas_fee(20.0)['standard'] > 0
+
+
+@pytest.mark.asyncio
+async def test_queue_bound_rejects_excess_fits():
+    executor = TrainingExecutor(max_workers=0, max_pending=1, timeout=5)
+    gate = threading.Event()
+    try:
+        first = asyncio.ensure_future(executor.fit(BlockingModel(gate), None))
+        await asyncio.sleep(0)
+        with pytest.raises(TrainingQueueFull):
+            await executor.fit(BlockingModel(gate), None)
+        assert executor.stats['rejected'] == 1
+
+        gate.set()
+        assert (await first).is_trained
+        await wait_until(lambda: executor.pending == 0)
+    finally:
+        gate.set()
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_timeout_keeps_slot_until_fit_finishes():
+    executor = TrainingExecutor(max_workers=0, max_pending=2, timeout=5)
+    gate = threading.Event()
+    try:
+        with pytest.raises(TrainingTimeout):
+            await executor.fit(BlockingModel(gate), None, timeout=0.05)
+        assert executor.stats['timeouts'] == 1
+        # The fit already started on the thread: its slot is held until it ends
+        assert executor.pending == 1
+
+        gate.set()
+        await wait_until(lambda: executor.pending == 0)
+    finally:
+        gate.set()
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_queued_fit():
+    executor = TrainingExecutor(max_workers=0, max_pending=4, timeout=5)
+    gate = threading.Event()
+    try:
+        running = asyncio.ensure_future(executor.fit(BlockingModel(gate), None))
+        queued = asyncio.ensure_future(executor.fit(BlockingModel(gate), None))
+        await asyncio.sleep(0.05)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await wait_until(lambda: executor.stats['cancelled'] == 1)
+
+        gate.set()
+        await running
+        await wait_until(lambda: executor.pending == 0)
+        assert executor.stats['completed'] == 1
+    finally:
+        gate.set()
+        executor.shutdown()